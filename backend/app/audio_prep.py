@@ -0,0 +1,249 @@
+"""
+Audio Prep — shrink recorded answers before they are uploaded for transcription.
+
+Browsers record what they like: usually 48 kHz stereo WebM/Opus, sometimes WAV,
+with a second or two of silence at each end. Speech-to-text only needs 16 kHz
+mono, so most of those bytes are upload time and nothing else.
+
+`prepare()` decodes, downmixes to mono, resamples to 16 kHz, trims leading and
+trailing silence and re-encodes compactly:
+
+- with `ffmpeg` on PATH: any input format → Ogg/Opus at 24 kbit/s (speech mode);
+- without it, WAV input → 16-bit mono 16 kHz WAV via numpy (optional package);
+- otherwise the bytes go through unchanged, with their real content type.
+
+Every call returns an `AudioReport` (bytes and seconds before/after, and which
+path ran) that /interview/transcribe passes back to the client. Disabled
+entirely with `settings.audio_normalize = False`.
+"""
+
+from __future__ import annotations
+import io
+import shutil
+import struct
+import subprocess
+import wave
+from dataclasses import asdict, dataclass
+
+from .config import settings
+
+try:
+    import numpy as np
+except ImportError:  # optional — WAV fallback needs it
+    np = None
+
+TARGET_RATE = 16000
+OPUS_BITRATE = "24k"
+SILENCE_DB = -45          # frames quieter than this (relative to full scale) are silence
+EDGE_PAD_SEC = 0.15       # silence kept at each end so first/last phonemes aren't clipped
+FRAME_SEC = 0.02
+FFMPEG_TIMEOUT = 20
+
+_CONTENT_TYPES = {
+    "webm": "audio/webm", "ogg": "audio/ogg", "oga": "audio/ogg", "wav": "audio/wav",
+    "mp3": "audio/mpeg", "m4a": "audio/mp4", "mp4": "audio/mp4", "flac": "audio/flac",
+}
+
+
+@dataclass(slots=True)
+class AudioReport:
+    method: str                         # "ffmpeg" | "wav" | "passthrough"
+    input_bytes: int
+    output_bytes: int
+    input_seconds: float | None = None  # None when the container doesn't say
+    output_seconds: float | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class PreparedAudio:
+    data: bytes
+    filename: str
+    content_type: str
+    report: AudioReport
+
+
+def content_type_for(filename: str, declared: str | None = None) -> str:
+    if declared and declared.startswith("audio/"):
+        return declared.split(";")[0]
+    ext = (filename or "").rsplit(".", 1)[-1].lower()
+    return _CONTENT_TYPES.get(ext, "audio/webm")
+
+
+def prepare(data: bytes, filename: str, content_type: str | None = None) -> PreparedAudio:
+    """Normalize one recording for upload. Never raises: falls back to the original bytes."""
+    stem = (filename or "audio").rsplit(".", 1)[0] or "audio"
+    passthrough = PreparedAudio(data, filename or "audio.webm", content_type_for(filename, content_type),
+                                AudioReport("passthrough", len(data), len(data)))
+    if not settings.audio_normalize or not data:
+        return passthrough
+    if shutil.which("ffmpeg"):
+        try:
+            out = _ffmpeg_to_opus(data)
+            return PreparedAudio(out, f"{stem}.ogg", "audio/ogg", AudioReport(
+                "ffmpeg", len(data), len(out), output_seconds=_ogg_opus_seconds(out),
+                sample_rate=TARGET_RATE, channels=1,
+            ))
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"[audio] ffmpeg normalization failed: {e}")
+    if np is not None and data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        try:
+            out, in_sec, out_sec = _normalize_wav(data)
+            return PreparedAudio(out, f"{stem}.wav", "audio/wav", AudioReport(
+                "wav", len(data), len(out), input_seconds=in_sec, output_seconds=out_sec,
+                sample_rate=TARGET_RATE, channels=1,
+            ))
+        except (wave.Error, EOFError, ValueError) as e:
+            print(f"[audio] WAV normalization failed: {e}")
+    return passthrough
+
+
+def decode_pcm(data: bytes):
+    """16 kHz mono float32 samples of a recording, or None if it can't be decoded here."""
+    if np is None or not data:
+        return None
+    try:
+        if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+            samples, rate = _read_wav(data)
+            return resample(samples, rate)
+        if shutil.which("ffmpeg"):
+            cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+                   "-vn", "-ac", "1", "-ar", str(TARGET_RATE), "-f", "f32le", "pipe:1"]
+            proc = subprocess.run(cmd, input=data, capture_output=True, timeout=FFMPEG_TIMEOUT)
+            if proc.returncode == 0:
+                return np.frombuffer(proc.stdout, dtype="<f4")
+    except (OSError, subprocess.SubprocessError, wave.Error, EOFError, ValueError) as e:
+        print(f"[audio] decode failed: {e}")
+    return None
+
+
+def encode(samples) -> tuple[bytes, str, str]:
+    """Compact upload encoding of 16 kHz mono samples: (bytes, file extension, content type)."""
+    if shutil.which("ffmpeg"):
+        cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error",
+               "-f", "f32le", "-ar", str(TARGET_RATE), "-ac", "1", "-i", "pipe:0",
+               "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip", "-f", "ogg", "pipe:1"]
+        try:
+            proc = subprocess.run(cmd, input=np.asarray(samples, dtype="<f4").tobytes(),
+                                  capture_output=True, timeout=FFMPEG_TIMEOUT)
+            if proc.returncode == 0 and proc.stdout:
+                return proc.stdout, "ogg", "audio/ogg"
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"[audio] encode failed: {e}")
+    return _write_wav(samples), "wav", "audio/wav"
+
+
+# ─── ffmpeg path ──────────────────────────────────────────────────────────────
+
+_TRIM = f"silenceremove=start_periods=1:start_threshold={SILENCE_DB}dB:start_silence={EDGE_PAD_SEC}"
+
+
+def _ffmpeg_to_opus(data: bytes) -> bytes:
+    # Trailing silence is trimmed by reversing, trimming the (new) start, and reversing back.
+    cmd = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-i", "pipe:0",
+        "-vn", "-ac", "1", "-ar", str(TARGET_RATE),
+        "-af", f"{_TRIM},areverse,{_TRIM},areverse",
+        "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-application", "voip",
+        "-f", "ogg", "pipe:1",
+    ]
+    proc = subprocess.run(cmd, input=data, capture_output=True, timeout=FFMPEG_TIMEOUT)
+    if proc.returncode != 0 or not proc.stdout:
+        raise subprocess.SubprocessError(proc.stderr.decode("utf-8", "replace")[-300:] or "no output")
+    return proc.stdout
+
+
+def _ogg_opus_seconds(ogg: bytes) -> float | None:
+    """Duration from the last page's granule position (Opus always counts at 48 kHz)."""
+    last = ogg.rfind(b"OggS")
+    head = ogg.find(b"OpusHead")
+    if last < 0 or head < 0 or len(ogg) < last + 14:
+        return None
+    granule = struct.unpack_from("<q", ogg, last + 6)[0]
+    pre_skip = struct.unpack_from("<H", ogg, head + 10)[0]
+    return round(max(0, granule - pre_skip) / 48000, 2)
+
+
+# ─── numpy WAV path ───────────────────────────────────────────────────────────
+
+def _normalize_wav(data: bytes) -> tuple[bytes, float, float]:
+    samples, rate = _read_wav(data)
+    in_sec = len(samples) / rate
+    samples = _trim_silence(resample(samples, rate), TARGET_RATE)
+    return _write_wav(samples), round(in_sec, 2), round(len(samples) / TARGET_RATE, 2)
+
+
+def _read_wav(data: bytes):
+    """Mono float32 samples and their rate."""
+    with wave.open(io.BytesIO(data)) as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    return _pcm_to_float(frames, width).reshape(-1, channels).mean(axis=1), rate
+
+
+def _write_wav(samples) -> bytes:
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(TARGET_RATE)
+        wav.writeframes(pcm)
+    return out.getvalue()
+
+
+def concat(chunks: list):
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+
+
+def pcm16_to_float(raw: bytes):
+    """Signed 16-bit little-endian PCM → float32 in [-1, 1) (a trailing odd byte is ignored)."""
+    return _pcm_to_float(raw[: len(raw) - len(raw) % 2], 2)
+
+
+def _pcm_to_float(frames: bytes, width: int):
+    if width == 1:
+        return (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128) / 128
+    if width == 2:
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768
+    if width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        ints = (raw[:, 0].astype(np.int32) | (raw[:, 1].astype(np.int32) << 8) | (raw[:, 2].astype(np.int32) << 16))
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        return ints.astype(np.float32) / 8388608
+    if width == 4:
+        return np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648
+    raise ValueError(f"unsupported sample width {width}")
+
+
+def resample(samples, rate: int):
+    """Float samples at `rate` → TARGET_RATE."""
+    if rate == TARGET_RATE or not len(samples):
+        return samples
+    if rate % TARGET_RATE == 0:
+        # Integer decimation: average each block (a cheap low-pass) instead of dropping samples.
+        step = rate // TARGET_RATE
+        usable = len(samples) - len(samples) % step
+        return samples[:usable].reshape(-1, step).mean(axis=1)
+    n_out = int(len(samples) * TARGET_RATE / rate)
+    positions = np.arange(n_out) * (rate / TARGET_RATE)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def _trim_silence(samples, rate: int):
+    frame = max(1, int(rate * FRAME_SEC))
+    n = len(samples) // frame
+    if n == 0:
+        return samples[:0]
+    rms = np.sqrt(np.mean(np.square(samples[: n * frame].reshape(n, frame)), axis=1))
+    loud = np.nonzero(rms > 10 ** (SILENCE_DB / 20))[0]
+    if not len(loud):
+        return samples[:0]
+    pad = int(rate * EDGE_PAD_SEC)
+    start = max(0, loud[0] * frame - pad)
+    end = min(len(samples), (loud[-1] + 1) * frame + pad)
+    return samples[start:end]
@@ -9,6 +9,58 @@ class Settings(BaseSettings):
     # Comma-separated list of allowed CORS origins.
     # Defaults to * (open) — set in production to your frontend URL.
     allowed_origins: str = "*"
+    # Bounded executors for blocking work (see app/offload.py).
+    io_workers: int = 32
+    cpu_workers: int = 4
+    # Directory for binary session snapshots (see app/snapshot.py). Empty disables.
+    snapshot_dir: str = ""
+    # Max Hamming distance between 64-bit SimHash fingerprints for two questions
+    # to count as near-duplicates (see app/simhash.py). 0 = exact only.
+    simhash_threshold: int = 3
+    # Batched question generation (see app/question_queue.py): candidates per
+    # LLM call. 0 or 1 = one question per call. A background refill starts when
+    # a session's queue drops to question_batch_low_water.
+    question_batch_size: int = 0
+    question_batch_low_water: int = 1
+    # Rapid-fire sessions: answers evaluated per background LLM call.
+    rapid_fire_batch_size: int = 3
+    # On-disk TTS audio cache (see app/tts_cache.py). Empty dir disables.
+    tts_cache_dir: str = ""
+    tts_cache_max_mb: int = 256
+    # Sentence chunks synthesized ahead of the one being streamed (see app/tts_stream.py).
+    tts_parallel: int = 3
+    # Downmix/resample/trim recorded answers before transcription (see app/audio_prep.py).
+    audio_normalize: bool = True
+    # Answers longer than 1.5x this many seconds are transcribed as parallel
+    # silence-aligned segments (see app/segmented_stt.py). 0 disables.
+    stt_segment_seconds: int = 30
+    stt_parallel: int = 4
+    stt_retries: int = 2
+    # SSE token streams: text chunks are batched into one frame per window of
+    # this many ms or bytes, whichever fills first (see app/sse.py). 0 ms = a frame per chunk.
+    sse_coalesce_ms: int = 30
+    sse_coalesce_bytes: int = 512
+    # Resumable SSE: frames kept per session for Last-Event-ID replay, and how long a
+    # generation keeps running with no client attached before it is cancelled.
+    sse_replay_frames: int = 512
+    sse_resume_grace_sec: int = 15
+    # One LLM call per answered question: the evaluator also writes the next
+    # question (follow-up or new, by score) instead of a second call for it.
+    fused_turns: bool = False
+    # Grade answers with a compact score/verdict/topic schema and write the long
+    # feedback only when /interview/answer/detail asks for it. fused_turns wins if both are set.
+    quick_eval: bool = False
+    # Grade empty, "I don't know", one-word and pasted-question answers locally
+    # instead of calling the evaluator (see app/prescreen.py).
+    answer_prescreen: bool = True
+    # Circuit breaker per provider + key (see app/llm_client.py): this many consecutive
+    # failures make calls fail fast for the cooldown; evaluations are then scored
+    # locally (app/local_scorer.py). 0 disables.
+    llm_breaker_failures: int = 3
+    llm_breaker_cooldown_sec: int = 30
+    # Share (0-1) of basic-level questions served from the local template grammar
+    # (see app/question_grammar.py) instead of asking the provider. 0 = always ask.
+    local_question_share: float = 0.0
 
     class Config:
         env_file = ".env"
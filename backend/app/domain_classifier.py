@@ -0,0 +1,181 @@
+"""
+Domain Classifier — maps a free-text interview domain to a question category.
+
+Users type anything into the domain box ("Sr. Backend Engineer", "digital
+marketing", "sofware enginering"). This resolves it once to:
+
+- `category`: which templated question family fits (tech, business, marketing,
+  finance, hr, design, healthcare, legal, or generic), and
+- `banks`: which curated domain banks in question_bank match, in bank order.
+
+The keyword lists are compiled at import into a token index (phrase → category
+and weight). A domain is tokenized; each token is looked up exactly, and tokens
+that miss fall back to a fuzzy trigram match against the keyword vocabulary, so
+typos still land. Multi-word keywords ("machine learning", "product design")
+outweigh single words, and ties go to the category listed first.
+
+Results are memoized per normalized domain string, and /interview/start stores
+the result on the session — a session's domain never changes.
+"""
+
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from .question_bank import DOMAIN_QUESTIONS
+
+# Category → keywords. Order matters: it breaks ties.
+CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "tech": (
+        "software", "engineering", "engineer", "development", "developer", "programming",
+        "programmer", "tech", "technology", "data", "data science", "machine learning", "ml",
+        "ai", "artificial intelligence", "cloud", "devops", "sre", "cyber", "cybersecurity",
+        "security", "database", "databases", "system", "systems", "backend", "frontend",
+        "full stack", "fullstack", "web development", "mobile", "android", "ios", "python",
+        "java", "javascript", "infrastructure", "network", "networking", "computer science",
+        "qa", "it",
+    ),
+    "business": (
+        "business", "management", "manager", "strategy", "operations", "consulting",
+        "consultant", "product", "product management", "product manager",
+        "project management", "supply chain", "logistics", "entrepreneurship",
+    ),
+    "marketing": (
+        "marketing", "sales", "brand", "branding", "content", "social media", "seo",
+        "advertising", "digital marketing", "growth marketing", "public relations", "copywriting",
+    ),
+    "finance": (
+        "finance", "accounting", "accountant", "investment", "banking", "financial", "audit",
+        "auditor", "tax", "fintech", "economics", "actuarial",
+    ),
+    "hr": (
+        "human resources", "hr", "talent", "talent acquisition", "recruitment", "recruiter",
+        "recruiting", "organizational", "training", "people operations",
+    ),
+    "design": (
+        "design", "designer", "ux", "ui", "creative", "graphic", "graphic design",
+        "web design", "product design", "illustration", "animation",
+    ),
+    "healthcare": (
+        "healthcare", "medical", "clinical", "pharmaceutical", "pharma", "biotech", "health",
+        "nursing", "nurse", "medicine", "physician",
+    ),
+    "legal": (
+        "legal", "law", "lawyer", "attorney", "compliance", "regulatory", "contract",
+        "contracts", "intellectual property", "paralegal",
+    ),
+}
+CATEGORIES = tuple(CATEGORY_KEYWORDS) + ("generic",)
+
+FUZZY_MIN_LEN = 4        # shorter tokens ("ai", "hr", "ux") only match exactly
+FUZZY_THRESHOLD = 0.6    # Dice coefficient over padded trigrams
+MAX_NGRAM = 3
+
+# Extra words that select a curated bank (bank keys only cover their own words).
+BANK_ALIASES: dict[str, str] = {
+    "engineer": "software engineering",
+    "developer": "software engineering",
+    "designer": "ux/ui design",
+    "hr": "human resources",
+    "marketer": "digital marketing",
+}
+
+
+class DomainClass(NamedTuple):
+    category: str
+    banks: tuple[str, ...]
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _trigrams(word: str) -> frozenset[str]:
+    padded = f"${word}$"
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+# ─── Index (built once at import) ─────────────────────────────────────────────
+
+_phrase_index: dict[str, list[tuple[int, int]]] = {}   # phrase → [(category rank, weight)]
+_bank_index: dict[str, list[int]] = {}                  # token → [bank rank]
+_vocab: set[str] = set()                                 # every indexed single word
+_vocab_trigrams: dict[str, frozenset[str]] = {}         # word → its trigrams (fuzzy-eligible words)
+_trigram_index: dict[str, list[str]] = {}               # trigram → words containing it
+_BANK_KEYS = tuple(DOMAIN_QUESTIONS)
+
+
+def _build():
+    for rank, keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for phrase in keywords:
+            toks = _tokens(phrase)
+            _phrase_index.setdefault(" ".join(toks), []).append((rank, len(toks)))
+            _vocab.update(toks)
+    for rank, key in enumerate(_BANK_KEYS):
+        for tok in _tokens(key):
+            _bank_index.setdefault(tok, []).append(rank)
+            _vocab.add(tok)
+    for tok, key in BANK_ALIASES.items():
+        _bank_index.setdefault(tok, []).append(_BANK_KEYS.index(key))
+        _vocab.add(tok)
+    for word in _vocab:
+        if len(word) >= FUZZY_MIN_LEN:
+            grams = _vocab_trigrams[word] = _trigrams(word)
+            for tri in grams:
+                _trigram_index.setdefault(tri, []).append(word)
+
+
+_build()
+
+
+# ─── Lookup ───────────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=8192)
+def _fuzzy(token: str) -> str | None:
+    """Closest vocabulary word to a token that has no exact match (typos, inflections)."""
+    grams = _trigrams(token)
+    shared: dict[str, int] = {}
+    for tri in grams:
+        for word in _trigram_index.get(tri, ()):
+            shared[word] = shared.get(word, 0) + 1
+    if not shared:
+        return None
+
+    def dice(word: str) -> float:
+        return 2 * shared[word] / (len(grams) + len(_vocab_trigrams[word]))
+
+    best = max(shared, key=lambda w: (dice(w), w))
+    return best if dice(best) >= FUZZY_THRESHOLD else None
+
+
+def _resolve(token: str) -> str | None:
+    if token in _vocab:
+        return token
+    if len(token) >= FUZZY_MIN_LEN and not token.isdigit():
+        return _fuzzy(token)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _classify_normalized(domain: str) -> DomainClass:
+    words = [w for w in (_resolve(t) for t in _tokens(domain)) if w is not None]
+
+    scores = [0] * len(CATEGORY_KEYWORDS)
+    for n in range(1, MAX_NGRAM + 1):
+        for i in range(len(words) - n + 1):
+            for rank, weight in _phrase_index.get(" ".join(words[i:i + n]), ()):
+                scores[rank] += weight
+    best = max(range(len(scores)), key=lambda r: (scores[r], -r))
+    category = CATEGORIES[best] if scores[best] else "generic"
+
+    bank_ranks = sorted({r for w in words for r in _bank_index.get(w, ())})
+    return DomainClass(category, tuple(_BANK_KEYS[r] for r in bank_ranks))
+
+
+def classify(domain: str | None) -> DomainClass:
+    """Category and matching curated banks for a free-text domain (memoized)."""
+    return _classify_normalized(" ".join(_tokens(domain or "")))
@@ -0,0 +1,221 @@
+"""
+JSON Stream — incremental field extraction from a streamed JSON object.
+
+The evaluator answers with one JSON object, streamed a few characters at a
+time. Waiting for the closing brace and parsing the whole thing means the
+score — the first field — reaches the candidate last. `ObjectStream` is fed the
+chunks as they arrive and reports each top-level field the moment its value is
+complete:
+
+- `Event("field", name, value)` once a value has been read in full (any JSON
+  type; nested objects/arrays are collected and parsed as a unit);
+- `Event("delta", name, text)` for string fields listed in `stream_fields`,
+  with the decoded text as it arrives — escapes (including split `\\uXXXX`
+  surrogate pairs) are resolved even when a chunk boundary falls inside one.
+
+Text before the opening brace (markdown fences, chatter) is skipped, and
+whatever was read before a truncated response stopped is still in `fields`.
+String runs are copied in slices, not per character, so the cost is a few
+microseconds per chunk.
+"""
+
+from __future__ import annotations
+import json
+import re
+from typing import Any, NamedTuple
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_STRING_STOP = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,}\]\s]')
+
+_SEEK, _KEY_OR_END, _KEY, _COLON, _VALUE, _STRING, _SCALAR, _NESTED, _DONE = range(9)
+
+
+class Event(NamedTuple):
+    kind: str    # "field" | "delta"
+    name: str
+    value: Any
+
+
+class ObjectStream:
+    __slots__ = ("stream_fields", "fields", "_buf", "_state", "_key", "_text", "_depth", "_in_str", "_esc")
+
+    def __init__(self, stream_fields: tuple[str, ...] = ()):
+        self.stream_fields = stream_fields
+        self.fields: dict[str, Any] = {}
+        self._buf = ""
+        self._state = _SEEK
+        self._key = ""
+        self._text: list[str] = []
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: str) -> list[Event]:
+        """Consume one chunk; return the events it completed, adjacent deltas merged."""
+        if self._state == _DONE or not chunk:
+            return []
+        self._buf += chunk
+        events: list[Event] = []
+        self._buf = self._buf[self._scan(events):]
+        merged: list[Event] = []
+        for ev in events:
+            if merged and ev.kind == "delta" and merged[-1].kind == "delta" and merged[-1].name == ev.name:
+                merged[-1] = Event("delta", ev.name, merged[-1].value + ev.value)
+            else:
+                merged.append(ev)
+        return merged
+
+    def _scan(self, out: list[Event]) -> int:
+        """Advance through the buffer; return how much of it was consumed."""
+        buf, i, n = self._buf, 0, len(self._buf)
+        while i < n and self._state != _DONE:
+            state = self._state
+            if state == _SEEK:
+                j = buf.find("{", i)
+                if j < 0:
+                    return n
+                i, self._state = j + 1, _KEY_OR_END
+            elif state in (_KEY, _STRING):
+                i, closed = self._string(buf, i, out)
+                if not closed:
+                    return i
+                text = "".join(self._text)
+                if state == _KEY:
+                    self._key, self._state = text, _COLON
+                else:
+                    self._complete(text, out)
+            elif state == _SCALAR:
+                m = _SCALAR_END.search(buf, i)
+                if m is None:
+                    self._text.append(buf[i:])
+                    return n
+                self._text.append(buf[i:m.start()])
+                raw = "".join(self._text)
+                try:
+                    value = json.loads(raw)
+                except ValueError:
+                    value = raw
+                self._complete(value, out)
+                i = m.start()
+            elif state == _NESTED:
+                i = self._nested(buf, i, out)
+            else:
+                c = buf[i]
+                if c in " \t\r\n":
+                    i += 1
+                elif state == _KEY_OR_END:
+                    i += 1
+                    if c == "}":
+                        self._state = _DONE
+                    elif c == '"':
+                        self._state, self._text = _KEY, []
+                elif state == _COLON:
+                    i += 1
+                    if c == ":":
+                        self._state = _VALUE
+                elif c == '"':
+                    i += 1
+                    self._state, self._text = _STRING, []
+                elif c in "{[":
+                    self._state, self._text, self._depth, self._in_str, self._esc = _NESTED, [], 0, False, False
+                else:
+                    self._state, self._text = _SCALAR, []
+        return i
+
+    def _complete(self, value: Any, out: list[Event]) -> None:
+        self.fields[self._key] = value
+        if self._key not in self.stream_fields:
+            out.append(Event("field", self._key, value))
+        self._state = _KEY_OR_END
+
+    def _string(self, buf: str, i: int, out: list[Event]) -> tuple[int, bool]:
+        stream = self._state == _STRING and self._key in self.stream_fields
+        n = len(buf)
+        while i < n:
+            m = _STRING_STOP.search(buf, i)
+            j = m.start() if m else n
+            if j > i:
+                piece = buf[i:j]
+                self._text.append(piece)
+                if stream:
+                    out.append(Event("delta", self._key, piece))
+                i = j
+            if i >= n:
+                break
+            if buf[i] == '"':
+                return i + 1, True
+            # Escape sequence: wait for the rest of it if the chunk ended inside.
+            if i + 1 >= n:
+                break
+            e = buf[i + 1]
+            if e != "u":
+                ch, step = _ESCAPES.get(e, e), 2
+            else:
+                if i + 6 > n:
+                    break
+                code = _hex(buf[i + 2:i + 6])
+                ch, step = chr(code), 6
+                if 0xD800 <= code < 0xDC00:
+                    if i + 12 > n:
+                        break
+                    low = _hex(buf[i + 8:i + 12]) if buf[i + 6:i + 8] == "\\u" else -1
+                    if 0xDC00 <= low < 0xE000:
+                        ch, step = chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+                    else:
+                        ch = "\ufffd"
+                elif 0xDC00 <= code < 0xE000:
+                    ch = "\ufffd"
+            self._text.append(ch)
+            if stream:
+                out.append(Event("delta", self._key, ch))
+            i += step
+        return i, False
+
+    def _nested(self, buf: str, i: int, out: list[Event]) -> int:
+        start, n = i, len(buf)
+        while i < n:
+            c = buf[i]
+            i += 1
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif c == "\\":
+                    self._esc = True
+                elif c == '"':
+                    self._in_str = False
+            elif c == '"':
+                self._in_str = True
+            elif c in "{[":
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._text.append(buf[start:i])
+                    raw = "".join(self._text)
+                    try:
+                        value = json.loads(raw)
+                    except ValueError:
+                        value = raw
+                    self._complete(value, out)
+                    return i
+        self._text.append(buf[start:i])
+        return i
+
+
+def _hex(digits: str) -> int:
+    try:
+        return int(digits, 16)
+    except ValueError:
+        return 0xFFFD
+
+
+def parse_partial(raw: str) -> dict[str, Any]:
+    """Every top-level field that is complete in `raw`, even if the object is cut off."""
+    stream = ObjectStream()
+    stream.feed(raw or "")
+    return stream.fields
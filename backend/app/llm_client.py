@@ -1,13 +1,28 @@
 """
 Unified LLM client — all provider differences in one place.
 Routes call call_llm() or stream_llm() and never touch HTTP directly.
+
+A stream can be abandoned from another thread through its StreamHandle: cancel()
+closes the upstream HTTP response, which unblocks the worker thread reading it
+and stops the provider from generating (and billing) the rest of the reply.
+
+Circuit breaker: after `settings.llm_breaker_failures` consecutive failed calls
+for one provider + API key, calls fail fast with CircuitOpen for
+`settings.llm_breaker_cooldown_sec`; the first call after that is a trial that
+closes the circuit on success or reopens it on failure. Callers check
+circuit_open() to go straight to their local fallback.
 """
 from __future__ import annotations
 import json
 import re
+import threading
+import time
 import requests
 from typing import Generator
 
+from . import metrics
+from .config import settings
+
 PROVIDER_CONFIGS: dict[str, dict] = {
     "openai": {
         "base_url": "https://api.openai.com/v1",
@@ -51,6 +66,45 @@ def get_default_model(provider: str) -> str:
     return PROVIDER_CONFIGS.get(provider, PROVIDER_CONFIGS["openai"])["default_model"]
 
 
+# ─── Circuit breaker ──────────────────────────────────────────────────────────
+
+class CircuitOpen(RuntimeError):
+    """The provider failed repeatedly and is skipped until its cooldown ends."""
+
+
+_circuits: dict[tuple[str, int], list] = {}   # (provider, hash(api_key)) → [consecutive failures, open until]
+_circuits_lock = threading.Lock()
+
+
+def circuit_open(provider: str, api_key: str) -> bool:
+    with _circuits_lock:
+        state = _circuits.get((provider, hash(api_key)))
+        return state is not None and time.monotonic() < state[1]
+
+
+def _check_circuit(provider: str, api_key: str) -> None:
+    if circuit_open(provider, api_key):
+        metrics.incr("llm_circuit_rejections")
+        raise CircuitOpen(f"{provider} is failing; retrying after the cooldown")
+
+
+def _record(provider: str, api_key: str, ok: bool) -> None:
+    threshold = settings.llm_breaker_failures
+    if threshold <= 0:
+        return
+    key = (provider, hash(api_key))
+    with _circuits_lock:
+        if ok:
+            _circuits.pop(key, None)
+            return
+        state = _circuits.setdefault(key, [0, 0.0])
+        state[0] += 1
+        if state[0] >= threshold:
+            if state[1] <= time.monotonic():
+                metrics.incr("llm_circuit_opened")
+            state[1] = time.monotonic() + settings.llm_breaker_cooldown_sec
+
+
 def call_llm(
     provider: str,
     api_key: str,
@@ -63,6 +117,17 @@ def call_llm(
     cfg = PROVIDER_CONFIGS.get(provider)
     if not cfg:
         raise ValueError(f"Unknown provider: {provider}")
+    _check_circuit(provider, api_key)
+    try:
+        text = _call(cfg, api_key, model, messages, max_tokens, timeout)
+    except Exception:
+        _record(provider, api_key, False)
+        raise
+    _record(provider, api_key, True)
+    return text
+
+
+def _call(cfg: dict, api_key: str, model: str, messages: list[dict], max_tokens: int, timeout: int) -> str:
     style = cfg["style"]
     if style == "openai":
         return _call_openai_compat(cfg["base_url"], api_key, model, messages, max_tokens, timeout)
@@ -73,12 +138,50 @@ def call_llm(
     raise ValueError(f"Unknown provider style: {style}")
 
 
+class StreamHandle:
+    """Cancellation handle for one stream_llm() call; counts the text it delivered."""
+    __slots__ = ("chars", "finished", "cancelled", "_resp", "_lock")
+
+    def __init__(self):
+        self.chars = 0
+        self.finished = False
+        self.cancelled = False
+        self._resp = None
+        self._lock = threading.Lock()
+
+    def attach(self, resp) -> None:
+        with self._lock:
+            self._resp = resp
+            if not self.cancelled:
+                return
+        resp.close()
+
+    def finish(self) -> None:
+        with self._lock:
+            self.finished = True
+
+    def cancel(self) -> bool:
+        """Close the upstream response. True if the stream was still running."""
+        with self._lock:
+            if self.finished or self.cancelled:
+                return False
+            self.cancelled = True
+            resp = self._resp
+        if resp is not None:
+            try:
+                resp.close()
+            except Exception:
+                pass
+        return True
+
+
 def stream_llm(
     provider: str,
     api_key: str,
     model: str,
     messages: list[dict],
     max_tokens: int = 1024,
+    handle: StreamHandle | None = None,
 ) -> Generator[str, None, None]:
     """Yield text chunks as they stream from the provider."""
     cfg = PROVIDER_CONFIGS.get(provider)
@@ -86,11 +189,27 @@ def stream_llm(
         return
     style = cfg["style"]
     if style == "openai":
-        yield from _stream_openai_compat(cfg["base_url"], api_key, model, messages, max_tokens)
+        chunks = _stream_openai_compat(cfg["base_url"], api_key, model, messages, max_tokens, handle)
     elif style == "anthropic":
-        yield from _stream_anthropic(cfg["base_url"], api_key, model, messages, max_tokens)
+        chunks = _stream_anthropic(cfg["base_url"], api_key, model, messages, max_tokens, handle)
     elif style == "google":
-        yield from _stream_google(cfg["base_url"], api_key, model, messages, max_tokens)
+        chunks = _stream_google(cfg["base_url"], api_key, model, messages, max_tokens, handle)
+    else:
+        return
+    _check_circuit(provider, api_key)
+    try:
+        for text in chunks:
+            if handle is not None:
+                handle.chars += len(text)
+            yield text
+    except Exception:
+        if handle is not None and handle.cancelled:
+            return   # the read failed because we closed the response
+        _record(provider, api_key, False)
+        raise
+    _record(provider, api_key, True)
+    if handle is not None:
+        handle.finish()
 
 
 def call_llm_json(
@@ -122,12 +241,14 @@ def _call_openai_compat(
 
 def _stream_openai_compat(
     base_url: str, api_key: str, model: str,
-    messages: list[dict], max_tokens: int,
+    messages: list[dict], max_tokens: int, handle: StreamHandle | None = None,
 ) -> Generator[str, None, None]:
     url = base_url.rstrip("/") + "/chat/completions"
     headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     payload = {"model": model, "messages": messages, "max_tokens": max_tokens, "stream": True}
     with requests.post(url, headers=headers, json=payload, stream=True, timeout=60) as resp:
+        if handle is not None:
+            handle.attach(resp)
         resp.raise_for_status()
         for line in resp.iter_lines():
             if not line:
@@ -171,7 +292,7 @@ def _call_anthropic(
 
 def _stream_anthropic(
     base_url: str, api_key: str, model: str,
-    messages: list[dict], max_tokens: int,
+    messages: list[dict], max_tokens: int, handle: StreamHandle | None = None,
 ) -> Generator[str, None, None]:
     system, filtered = _split_system(messages)
     url = base_url.rstrip("/") + "/messages"
@@ -187,6 +308,8 @@ def _stream_anthropic(
     if system:
         payload["system"] = system
     with requests.post(url, headers=headers, json=payload, stream=True, timeout=60) as resp:
+        if handle is not None:
+            handle.attach(resp)
         resp.raise_for_status()
         for line in resp.iter_lines():
             if not line:
@@ -230,7 +353,7 @@ def _call_google(
 
 def _stream_google(
     base_url: str, api_key: str, model: str,
-    messages: list[dict], max_tokens: int,
+    messages: list[dict], max_tokens: int, handle: StreamHandle | None = None,
 ) -> Generator[str, None, None]:
     url = base_url.rstrip("/") + f"/models/{model}:streamGenerateContent"
     contents = _messages_to_google(messages)
@@ -243,6 +366,8 @@ def _stream_google(
         params={"key": api_key, "alt": "sse"},
         json=payload, stream=True, timeout=60,
     ) as resp:
+        if handle is not None:
+            handle.attach(resp)
         resp.raise_for_status()
         for line in resp.iter_lines():
             if not line:
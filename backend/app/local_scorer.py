@@ -0,0 +1,218 @@
+"""
+Local Scorer — a CPU-only answer evaluator for when the LLM can't be asked.
+
+Used in demo mode and whenever the provider's circuit is open or its call
+fails, instead of a flat "could not parse" 5/10. An answer is reduced to a
+dozen features and scored by a linear model shipped as data
+(data/local_scorer.json — weights, bias and the topic reference points):
+
+- reference match: TF-IDF cosine between the answer and the question's
+  reference text (the question, the key points of the topics it matches, and
+  the company track's focus areas), with IDF over every local question;
+- key-point coverage: share of the matched topics' key points the answer
+  mentions (`no_reference` stands in when no topic matches);
+- question coverage and novelty: how much of the question the answer
+  addresses, and how much it adds of its own;
+- communication: length, structure, clarity, confidence, specificity, STAR
+  and filler rate from speech_analyzer.
+
+`evaluate()` returns the evaluator's usual keys, with feedback built from the
+key points covered and missed. Scoring takes well under a millisecond when the
+speech analysis is passed in (see benchmarks/bench_local_scorer.py).
+"""
+
+from __future__ import annotations
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from . import prescreen, question_bank
+from .speech_analyzer import AnswerAnalysis, analyze
+
+MODEL_PATH = Path(__file__).parent / "data" / "local_scorer.json"
+MAX_TOPICS = 2
+LENGTH_SATURATION = 150     # content words at which the length feature reaches 1
+
+# prescreen's tokenizer, with a few more words that carry no meaning for scoring.
+_STOP = prescreen.STOP_WORDS | frozenset("as so if then than there their they them also just very really".split())
+_SPECIFIC = re.compile(r"\d|\bfor example\b|\bfor instance\b|\be\.g\.|\bsuch as\b")
+
+
+@dataclass(frozen=True, slots=True)
+class Topic:
+    name: str
+    match: re.Pattern
+    points: tuple[tuple[tuple[str, ...], ...], ...]   # point → alternatives → stemmed words
+    labels: tuple[str, ...]                           # first phrasing of each point, for feedback
+
+
+@dataclass(frozen=True, slots=True)
+class Model:
+    features: tuple[str, ...]
+    weights: tuple[float, ...]
+    bias: float
+    topics: tuple[Topic, ...]
+
+
+def _stem(word: str) -> str:
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokens(text: str) -> list[str]:
+    return [_stem(w) for w in prescreen.split_words(text, _STOP)]
+
+
+def _point_words(phrase: str) -> tuple[str, ...]:
+    """Stemmed words of one key-point phrasing; "word*" stays a prefix."""
+    return tuple(w.lower() if w.endswith("*") else t for w in phrase.split() for t in (tokens(w) or [""]) if t or w.endswith("*"))
+
+
+@lru_cache(maxsize=1)
+def model() -> Model:
+    with open(MODEL_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    topics = tuple(
+        Topic(
+            name=t["name"],
+            match=re.compile(r"\b(?:" + "|".join(re.escape(m) for m in t["match"]) + r")\b"),
+            points=tuple(tuple(_point_words(alt) for alt in p.split("|")) for p in t["points"]),
+            labels=tuple(p.split("|")[0] for p in t["points"]),
+        )
+        for t in data["topics"]
+    )
+    names = tuple(data["weights"])
+    return Model(names, tuple(float(data["weights"][n]) for n in names), float(data["bias"]), topics)
+
+
+@lru_cache(maxsize=1)
+def _idf() -> dict[str, float]:
+    docs = [set(tokens(question_bank.text(i))) for i in range(question_bank.count())]
+    docs += [{w.rstrip("*") for alts in t.points for alt in alts for w in alt} for t in model().topics]
+    df = Counter(w for doc in docs for w in doc)
+    n = len(docs)
+    return {w: math.log((1 + n) / (1 + c)) + 1 for w, c in df.items()}
+
+
+def _vector(words: list[str], idf: dict[str, float], default: float) -> dict[str, float]:
+    counts = Counter(words)
+    vec = {w: (1 + math.log(c)) * idf.get(w, default) for w, c in counts.items()}
+    norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+    return {w: v / norm for w, v in vec.items()}
+
+
+@lru_cache(maxsize=512)
+def _reference(question: str, focus: tuple[str, ...]) -> tuple[tuple[Topic, ...], dict[str, float]]:
+    """Topics matched by `question` and the TF-IDF vector of its reference text (cached per question)."""
+    lowered = question.lower()
+    scored = [(len(t.match.findall(lowered)), i, t) for i, t in enumerate(model().topics)]
+    matched = sorted((s for s in scored if s[0]), key=lambda s: (-s[0], s[1]))
+    topics = tuple(t for _, _, t in matched[:MAX_TOPICS])
+    words = tokens(question) + [w for f in focus for w in tokens(f)]
+    for t in topics:
+        words += [w.rstrip("*") for alts in t.points for alt in alts for w in alt]
+    idf = _idf()
+    return topics, _vector(words, idf, max(idf.values(), default=1.0))
+
+
+def _has(word: str, answer_words: set[str]) -> bool:
+    if word.endswith("*"):
+        return any(a.startswith(word[:-1]) for a in answer_words)
+    return word in answer_words
+
+
+def _covered(point: tuple[tuple[str, ...], ...], answer_words: set[str]) -> bool:
+    return any(alt and all(_has(w, answer_words) for w in alt) for alt in point)
+
+
+def features(question: str, answer: str, analysis: AnswerAnalysis | None = None,
+             focus: tuple[str, ...] = ()) -> tuple[dict[str, float], tuple[Topic, ...], list[list[bool]]]:
+    """Feature values for one answer, the topics used, and which of their points were covered."""
+    if analysis is None:
+        analysis = analyze(answer)
+    topics, ref = _reference(question or "", focus)
+    words = tokens(answer or "")
+    word_set = set(words)
+    idf = _idf()
+    vec = _vector(words, idf, max(idf.values(), default=1.0)) if words else {}
+    covered = [[_covered(p, word_set) for p in t.points] for t in topics]
+    n_points = sum(len(c) for c in covered)
+    asked = set(tokens(question or ""))
+    new = word_set - asked
+    return {
+        "ref_similarity": sum(v * ref.get(w, 0.0) for w, v in vec.items()),
+        "keypoint_coverage": sum(map(sum, covered)) / n_points if n_points else 0.0,
+        "no_reference": 0.0 if n_points else 1.0,
+        "question_coverage": len(asked & word_set) / len(asked) if asked else 0.0,
+        "novelty": min(1.0, len(new) / 25),
+        "length": min(1.0, math.log1p(len(words)) / math.log1p(LENGTH_SATURATION)),
+        "structure": analysis.structure_score / 10,
+        "clarity": analysis.clarity_score / 10,
+        "confidence": analysis.confidence_score / 10,
+        "specificity": min(1.0, (len(analysis.strong_language_found) + len(_SPECIFIC.findall(answer.lower()))) / 3),
+        "star": analysis.star_score / 4,
+        "filler_rate": analysis.filler_rate / 100,
+    }, topics, covered
+
+
+def score(values: dict[str, float]) -> int:
+    m = model()
+    raw = m.bias + sum(w * values.get(name, 0.0) for name, w in zip(m.features, m.weights))
+    return max(1, min(10, round(raw)))
+
+
+def evaluate(question: str, answer: str, analysis: AnswerAnalysis | None = None,
+             topic: str = "General", focus: tuple[str, ...] = ()) -> dict:
+    """An evaluation in the LLM evaluator's shape (plus "scorer": "local")."""
+    values, topics, covered = features(question, answer, analysis, focus)
+    s = score(values)
+    points = dict.fromkeys(label for t in topics for label in t.labels)   # ordered, without repeats
+    hit = dict.fromkeys(label for t, c in zip(topics, covered) for label, ok in zip(t.labels, c) if ok)
+    missed = [label for label in points if label not in hit]
+
+    if s >= 8:
+        verdict = "Strong answer — it hits the key points."
+    elif s >= 6:
+        verdict = "Solid direction, but some key points are missing."
+    elif s >= 4:
+        verdict = "Partially there — it needs more depth."
+    else:
+        verdict = "This misses most of what the question is after."
+
+    if topics:
+        feedback = (f"You covered {', '.join(hit)}." if hit else "None of the key points came through.")
+        if missed:
+            feedback += f" Missing: {', '.join(missed)}."
+        hint = "A strong answer covers: " + "; ".join(points) + "."
+    else:
+        feedback = ("Good depth and detail." if values["length"] >= 0.6 and values["novelty"] >= 0.6
+                    else "The answer is thin — explain how it works and why, not just what it is.")
+        hint = f"A strong answer covers a clear definition, how it works, the trade-offs and a concrete example from {topic}."
+
+    if missed and values["keypoint_coverage"] < 0.5:
+        tip = f"Review {topics[0].name}: make sure you can explain {', '.join(missed[:3])}."
+    elif values["filler_rate"] > 0.05:
+        tip = "Cut the filler words — pause instead; it reads as more confident."
+    elif values["length"] < 0.5:
+        tip = "Expand your answers: definition → how it works → a concrete example."
+    elif values["specificity"] < 0.34:
+        tip = "Add a concrete example with real numbers or a named system."
+    else:
+        tip = "Lead with the direct answer, then justify it with one trade-off."
+
+    return {
+        "score": s,
+        "is_correct": s >= 7,
+        "short_verdict": verdict,
+        "detailed_feedback": feedback,
+        "correct_answer_hint": hint,
+        "improvement_tip": tip,
+        "topic_tag": topics[0].name if topics else topic,
+        "scorer": "local",
+    }
@@ -0,0 +1,23 @@
+"""
+Metrics — process-wide counters for work the server avoided or abandoned.
+
+Counters are plain named integers, incremented from any thread and read as a
+snapshot by GET /interview/stats. They reset when the process restarts.
+"""
+
+from __future__ import annotations
+import threading
+from collections import Counter
+
+_counts: Counter[str] = Counter()
+_lock = threading.Lock()
+
+
+def incr(name: str, n: int = 1) -> None:
+    with _lock:
+        _counts[name] += n
+
+
+def snapshot() -> dict[str, int]:
+    with _lock:
+        return dict(_counts)
@@ -0,0 +1,66 @@
+"""
+Offload — keep the event loop free.
+
+Every route in the API is `async def`. Anything that would block the loop runs
+on one of two bounded executors instead:
+
+- I/O pool: blocking network calls (provider HTTP via `requests`). Sized for
+  many concurrent in-flight requests since the threads mostly sleep on sockets.
+- CPU pool: document parsing and speech analysis. Kept small so a burst of
+  uploads can't starve the request threads.
+
+Routes `await run_io(...)` / `await run_cpu(...)` and never call blocking code
+directly. Sync generators (provider token streams) are consumed with
+`iterate_io()`, which pulls each item on the I/O pool.
+"""
+
+from __future__ import annotations
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+from .config import settings
+
+T = TypeVar("T")
+
+_io_pool = ThreadPoolExecutor(max_workers=max(1, settings.io_workers), thread_name_prefix="intervai-io")
+_cpu_pool = ThreadPoolExecutor(max_workers=max(1, settings.cpu_workers), thread_name_prefix="intervai-cpu")
+
+_SENTINEL = object()
+
+
+async def run_io(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run a blocking network call on the I/O pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_pool, functools.partial(fn, *args, **kwargs))
+
+
+async def run_cpu(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run CPU-bound work (parsing, analysis) on the CPU pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_cpu_pool, functools.partial(fn, *args, **kwargs))
+
+
+async def iterate_io(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Consume a blocking iterator (e.g. `llm_client.stream_llm`) without blocking the loop."""
+    it = iter(iterator)
+    try:
+        while True:
+            item = await run_io(next, it, _SENTINEL)
+            if item is _SENTINEL:
+                return
+            yield item
+    finally:
+        # Closing runs the generator's cleanup (closing the upstream HTTP
+        # response), which may block — hand it to the I/O pool, never the loop.
+        close = getattr(it, "close", None)
+        if close is not None:
+            _io_pool.submit(_close_quietly, close)
+
+
+def _close_quietly(close: Callable[[], None]) -> None:
+    try:
+        close()
+    except Exception:
+        pass
@@ -0,0 +1,102 @@
+"""
+Prescreen — grade clearly trivial answers locally, without the evaluator.
+
+An empty answer, "I don't know", a single word, or the question pasted back
+costs the same evaluator round-trip as a real answer, and always earns the
+same 0-2. `screen()` recognizes those from speech_analyzer's word/filler
+counts, the answer's content words and their overlap with the question, and
+returns a ready evaluation: the usual evaluator keys plus "prescreen": <reason>.
+
+Reasons: "empty", "dont_know", "too_short", "echo". Anything it is not sure
+about returns None and goes to the LLM — an answer with a few words of its own
+is always forwarded, however weak.
+"""
+
+from __future__ import annotations
+import re
+
+from .speech_analyzer import FILLER_WORDS, AnswerAnalysis
+
+MIN_CONTENT_WORDS = 2       # fewer words of substance than this is not an answer
+ECHO_OVERLAP = 0.8          # share of the answer's content words that come from the question
+ECHO_COVERAGE = 0.7         # ...and share of the question it repeats ("TCP or UDP?" → "UDP" is an answer)
+ECHO_MAX_NEW_WORDS = 2
+
+WORD = re.compile(r"[a-z0-9]+(?:['.-][a-z0-9]+)*[+#]*")   # "c++", "node.js", "don't"; shared with local_scorer
+_DONT_KNOW = re.compile(
+    r"\b(?:i\s+)?(?:really\s+)?(?:do\s+not|don'?t|dunno)\s+know\b|\bidk\b|\bno\s+(?:idea|clue)\b"
+    r"|\b(?:i'?m\s+)?not\s+sure\b|\b(?:i\s+)?can'?t\s+remember\b|\bno\s+answer\b"
+)
+_GIVE_UP = {"pass", "skip", "next", "no", "nope", "none", "n/a", "na", "nothing", "?"}
+STOP_WORDS = frozenset(
+    "a an the is are was were be been to of in on at by for with and or but it its this that these those "
+    "what how why when which who do does did i you we me my your our can could would should will".split()
+)
+_NOT_CONTENT = STOP_WORDS | frozenset(f for f in FILLER_WORDS if " " not in f)
+
+# reason → (score, short_verdict, detailed_feedback, improvement_tip)
+_RESULTS = {
+    "empty": (0, "No answer given.",
+              "There was nothing to evaluate — the answer was empty.",
+              "Even a partial answer beats none: say what you do know, then reason out loud."),
+    "dont_know": (1, "No attempt at an answer.",
+                  "Saying you don't know is honest, but it gives the interviewer nothing to assess.",
+                  "Talk through what you do know that's related and how you'd work out the rest — the reasoning is graded too."),
+    "too_short": (2, "Too short to show understanding.",
+                  "A one-word answer can't show how well you understand the topic.",
+                  "Answer in 3-4 sentences: what it is, why it matters, and one concrete example."),
+    "echo": (1, "That repeats the question instead of answering it.",
+             "The answer restates the question without adding anything of its own.",
+             "Start from the question's key term and explain it in your own words, then give an example."),
+}
+
+
+def split_words(text: str, stop: frozenset[str] = STOP_WORDS) -> list[str]:
+    """Lowercased words of `text`, without `stop` words."""
+    return [w for w in WORD.findall(text.lower()) if w not in stop]
+
+
+def content_words(text: str) -> list[str]:
+    return split_words(text, _NOT_CONTENT)
+
+
+def classify(question: str, answer: str, analysis: AnswerAnalysis | None = None) -> str | None:
+    """Why `answer` needs no evaluator, or None if it does."""
+    lowered = (answer or "").strip().lower()
+    if not WORD.search(lowered):
+        return "empty"
+    if lowered.strip(" .!") in _GIVE_UP:
+        return "dont_know"
+    words = content_words(lowered)
+    if _DONT_KNOW.search(lowered) and len(content_words(_DONT_KNOW.sub(" ", lowered))) < MIN_CONTENT_WORDS:
+        return "dont_know"
+    if analysis is not None and analysis.word_count and analysis.filler_word_count >= analysis.word_count:
+        return "too_short"
+    if len(words) < MIN_CONTENT_WORDS:
+        return "too_short"
+    asked = set(content_words(question or ""))
+    if asked:
+        new = [w for w in words if w not in asked]
+        repeated = len(asked.intersection(words))
+        if (len(new) <= ECHO_MAX_NEW_WORDS and (len(words) - len(new)) / len(words) >= ECHO_OVERLAP
+                and repeated / len(asked) >= ECHO_COVERAGE):
+            return "echo"
+    return None
+
+
+def screen(question: str, answer: str, analysis: AnswerAnalysis | None = None, topic: str = "General") -> dict | None:
+    """A local evaluation for a trivial answer, or None to send it to the evaluator."""
+    reason = classify(question, answer, analysis)
+    if reason is None:
+        return None
+    score, verdict, feedback, tip = _RESULTS[reason]
+    return {
+        "score": score,
+        "is_correct": False,
+        "short_verdict": verdict,
+        "detailed_feedback": feedback,
+        "correct_answer_hint": "",
+        "improvement_tip": tip,
+        "topic_tag": topic,
+        "prescreen": reason,
+    }
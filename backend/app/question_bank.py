@@ -0,0 +1,378 @@
+"""
+Question Bank — local questions compiled once into an indexed store.
+
+Every local question (the domain banks, LOCAL_QUESTION_BANK, LOCAL_QUESTION_POOL
+and each company track's bank) is compiled at import into flat, id-indexed
+columns — text, normalized text, a stable 64-bit hash and a SimHash
+fingerprint — and grouped into
+buckets of ids keyed by source/difficulty/type:
+
+    "domain/software engineering/basic/coding", "bank/medium/scenario",
+    "pool/hard", "track/google/basic"
+
+Sessions draw from a bucket through a shuffled cursor: a random start and a
+random stride coprime with the bucket size walk every id exactly once, in a
+different order per session, without materialising a permutation. A draw is
+O(1) and the per-session state is three ints per bucket, kept in
+`session["bank_cursors"]` (so it is snapshotted with the session).
+"""
+
+from __future__ import annotations
+import hashlib
+import random
+import re
+from array import array
+from functools import lru_cache
+from math import gcd
+from typing import Callable
+
+from . import simhash
+from .company_tracks import TRACKS
+
+LOCAL_QUESTION_POOL: dict[str, list[str]] = {
+    "basic": [
+        "Explain the concept of polymorphism with a simple example.",
+        "What is a REST API and how does it work?",
+        "Define time complexity and why it matters.",
+        "Explain the difference between an array and a linked list.",
+        "What is normalization in databases?"
+    ],
+    "medium": [
+        "Design a URL shortener: outline key components and trade-offs.",
+        "How would you scale a read-heavy service with caching layers?",
+        "Compare SQL vs NoSQL for a logging system; justify your choice.",
+        "Describe optimistic vs pessimistic locking and when to use each.",
+        "Explain CAP theorem and its practical implications."
+    ],
+    "hard": [
+        "Design a globally distributed messaging system with exactly-once semantics.",
+        "How would you implement rate limiting at scale across regions?",
+        "Analyze bottlenecks in a high-throughput pipeline and propose fixes.",
+        "Explain consensus algorithms (e.g., Raft/Paxos) and failure scenarios.",
+        "Propose an approach to minimize tail latency in large systems."
+    ],
+}
+
+# Richer local bank organized by difficulty and type
+LOCAL_QUESTION_BANK: dict[str, dict[str, list[str]]] = {
+    "basic": {
+        "conceptual": [
+            "Explain polymorphism with a simple example.",
+            "What is a REST API and how does it work?",
+            "Define time complexity and why it matters.",
+            "Difference between an array and a linked list?",
+            "What is normalization in databases?",
+        ],
+        "practical": [
+            "Outline steps to debug a failing API endpoint.",
+            "How would you write unit tests for a simple function?",
+            "Describe a basic caching strategy for read-heavy data.",
+        ],
+        "scenario": [
+            "A service slows during peak hours—what do you check first?",
+            "User reports inconsistent data—how do you investigate?",
+        ],
+        "coding": [
+            "Write a function to reverse a string.",
+            "Implement a stack using two queues—explain your approach.",
+        ],
+        "behavioral": [
+            "Tell me about a time you resolved a team conflict.",
+            "Describe how you prioritize tasks under tight deadlines.",
+        ],
+    },
+    "medium": {
+        "conceptual": [
+            "Explain CAP theorem and practical implications.",
+            "Compare SQL vs NoSQL for a logging system.",
+        ],
+        "practical": [
+            "Scale a read-heavy service with caching—outline trade-offs.",
+            "Design a URL shortener components and storage model.",
+        ],
+        "scenario": [
+            "Service returns sporadic 500s—diagnose and propose fixes.",
+            "Cache stampede observed—how do you mitigate it?",
+        ],
+        "coding": [
+            "Implement LRU cache—describe data structures used.",
+            "Traverse a binary tree iteratively and explain complexity.",
+        ],
+        "behavioral": [
+            "Discuss a time you influenced a decision without authority.",
+            "Describe mentoring a junior engineer through a project.",
+        ],
+    },
+    "hard": {
+        "conceptual": [
+            "Explain consensus algorithms (Raft/Paxos) and failure scenarios.",
+            "Discuss exactly-once semantics and when they are feasible.",
+        ],
+        "practical": [
+            "Implement rate limiting at scale across regions.",
+            "Minimize tail latency—describe architectural approaches.",
+        ],
+        "scenario": [
+            "Global outage due to config drift—investigation and prevention plan.",
+            "Hot partition causing hotspots—how do you remediate?",
+        ],
+        "coding": [
+            "Implement distributed lock with lease renewal—explain guarantees.",
+            "Design a concurrent worker pool—handle backpressure.",
+        ],
+        "behavioral": [
+            "Tell me about leading a cross-functional incident response.",
+            "Describe driving architectural change against initial resistance.",
+        ],
+    },
+}
+
+DOMAIN_QUESTIONS: dict[str, dict[str, dict[str, list[str]]]] = {
+    # Technology & Engineering
+    'software engineering': {
+        'basic': {
+            'conceptual': ["Explain the difference between object-oriented and functional programming", "What is version control and why is it important?", "Define what an API is and how it works"],
+            'practical': ["How would you debug a slow-loading web page?", "Describe the steps to deploy a web application", "How do you ensure code quality in a team?"],
+            'coding': ["Write a function to find the largest number in an array", "Implement a simple calculator function", "Create a function to validate an email address"]
+        },
+        'medium': {
+            'conceptual': ["Explain microservices architecture and its benefits", "What is the difference between SQL and NoSQL databases?", "Describe the MVC design pattern"],
+            'practical': ["How would you scale a web application for high traffic?", "Design a simple e-commerce database schema", "Explain your approach to API testing"],
+            'coding': ["Implement a binary search algorithm", "Create a REST API endpoint for user authentication", "Write a function to detect cycles in a linked list"]
+        },
+        'hard': {
+            'conceptual': ["Explain distributed systems and CAP theorem", "Discuss event-driven architecture patterns", "What are the challenges of implementing microservices?"],
+            'practical': ["Design a system to handle millions of concurrent users", "How would you implement real-time notifications at scale?", "Architect a fault-tolerant payment processing system"],
+            'coding': ["Implement a distributed cache with consistency guarantees", "Design a rate limiter for an API", "Create a system for processing streaming data"]
+        }
+    },
+
+    # Marketing & Sales
+    'digital marketing': {
+        'basic': {
+            'conceptual': ["What is the difference between organic and paid marketing?", "Explain what a conversion funnel is", "What are the main social media platforms for B2B marketing?"],
+            'practical': ["How would you measure the success of an email campaign?", "Describe how to set up a Google Ads campaign", "What metrics would you track for a content marketing strategy?"],
+            'scenario': ["A client's website traffic dropped 50% - how do you investigate?", "You need to increase brand awareness on a limited budget - what's your approach?"]
+        },
+        'medium': {
+            'conceptual': ["Explain marketing attribution models and their use cases", "What is programmatic advertising and how does it work?", "Describe the customer journey mapping process"],
+            'practical': ["How would you optimize a landing page for conversions?", "Design a multi-channel marketing campaign for a product launch", "Create a strategy to improve email open rates"],
+            'scenario': ["Your competitor just launched a similar product - how do you respond?", "ROI on paid ads is declining - what's your optimization strategy?"]
+        },
+        'hard': {
+            'conceptual': ["Discuss advanced marketing automation and personalization strategies", "Explain cross-device tracking and privacy implications", "What are the challenges of marketing in a cookieless future?"],
+            'practical': ["Design a comprehensive attribution model for a multi-touch customer journey", "Create a strategy for international market expansion", "Develop a framework for marketing mix optimization"],
+            'scenario': ["You need to pivot marketing strategy due to economic downturn", "How would you handle a PR crisis affecting brand reputation?"]
+        }
+    },
+
+    # Finance & Accounting
+    'financial analysis': {
+        'basic': {
+            'conceptual': ["What are the three main financial statements?", "Explain the difference between revenue and profit", "What is cash flow and why is it important?"],
+            'practical': ["How would you calculate return on investment (ROI)?", "Describe the process of creating a budget", "What ratios would you use to assess company liquidity?"],
+            'scenario': ["A company's expenses are increasing faster than revenue - what do you analyze?", "You need to present financial performance to non-financial stakeholders"]
+        },
+        'medium': {
+            'conceptual': ["Explain different valuation methods for companies", "What is the time value of money and how is it applied?", "Describe various types of financial risks"],
+            'practical': ["How would you build a discounted cash flow model?", "Analyze the financial impact of a potential acquisition", "Create a sensitivity analysis for key business drivers"],
+            'scenario': ["You're evaluating two investment opportunities with different risk profiles", "A client wants to understand why their profit margins are declining"]
+        },
+        'hard': {
+            'conceptual': ["Discuss advanced derivatives and hedging strategies", "Explain the complexities of international financial reporting", "What are the challenges in valuing intangible assets?"],
+            'practical': ["Design a comprehensive risk management framework", "Model the financial impact of various economic scenarios", "Create a capital allocation strategy for a diversified portfolio"],
+            'scenario': ["You need to restructure debt for a distressed company", "How would you handle financial reporting during a major acquisition?"]
+        }
+    },
+
+    # Human Resources
+    'human resources': {
+        'basic': {
+            'conceptual': ["What is the difference between recruitment and talent acquisition?", "Explain the importance of employee onboarding", "What are the key components of compensation and benefits?"],
+            'practical': ["How would you conduct a job interview effectively?", "Describe the steps in performance management", "What's your approach to handling employee complaints?"],
+            'scenario': ["An employee is consistently underperforming - how do you address it?", "You need to reduce workforce due to budget constraints"]
+        },
+        'medium': {
+            'conceptual': ["Explain different leadership development approaches", "What is organizational culture and how do you shape it?", "Describe various employee engagement strategies"],
+            'practical': ["How would you design a comprehensive training program?", "Create a strategy for improving employee retention", "Develop a framework for succession planning"],
+            'scenario': ["There's conflict between two department heads affecting team morale", "You need to implement major organizational changes"]
+        },
+        'hard': {
+            'conceptual': ["Discuss advanced talent analytics and predictive HR", "Explain the complexities of global HR management", "What are the challenges of managing remote and hybrid workforces?"],
+            'practical': ["Design a comprehensive diversity and inclusion strategy", "Create a framework for organizational transformation", "Develop advanced compensation modeling for different markets"],
+            'scenario': ["You're leading HR during a major merger or acquisition", "How would you handle a workplace harassment investigation?"]
+        }
+    },
+
+    # Design & Creative
+    'ux/ui design': {
+        'basic': {
+            'conceptual': ["What is the difference between UX and UI design?", "Explain the importance of user research", "What are design systems and why are they useful?"],
+            'practical': ["How would you conduct user interviews?", "Describe your process for creating wireframes", "What tools do you use for prototyping?"],
+            'scenario': ["Users are complaining that a feature is confusing - how do you investigate?", "You need to design for both mobile and desktop - what's your approach?"]
+        },
+        'medium': {
+            'conceptual': ["Explain different usability testing methods", "What is information architecture and how do you approach it?", "Describe the principles of accessible design"],
+            'practical': ["How would you redesign a complex dashboard for better usability?", "Create a user journey map for an e-commerce checkout", "Design a responsive navigation system"],
+            'scenario': ["Stakeholders want to add many features but users want simplicity", "You have limited time and budget for user research"]
+        },
+        'hard': {
+            'conceptual': ["Discuss advanced interaction design patterns", "Explain the psychology behind user behavior and decision-making", "What are the challenges of designing for emerging technologies?"],
+            'practical': ["Design a comprehensive design system for a large organization", "Create a strategy for international localization", "Develop a framework for measuring design impact"],
+            'scenario': ["You need to convince executives to invest in design research", "How would you handle conflicting feedback from multiple stakeholders?"]
+        }
+    }
+}
+
+
+# ─── Compiled index ───────────────────────────────────────────────────────────
+
+_WS = re.compile(r"\s+")
+_TRAILING_PUNCT = re.compile(r"[\.;:!]+$")
+
+
+def normalize(text: str) -> str:
+    """Canonical form used for repeat detection (case, whitespace, trailing punctuation)."""
+    t = _WS.sub(" ", (text or "").strip().lower())
+    return _TRAILING_PUNCT.sub("", t)
+
+
+def stable_hash(norm: str) -> int:
+    """64-bit hash of normalized text that is the same in every process (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(norm.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+_texts: list[str] = []
+_norms: list[str] = []
+_hashes = array("Q")
+_fingerprints = array("Q")
+_ids_by_text: dict[str, int] = {}
+_buckets: dict[str, array] = {}
+
+
+def _add(bucket: str, questions: list[str]):
+    ids = _buckets.setdefault(bucket, array("H"))
+    for q in questions:
+        qid = _ids_by_text.get(q)
+        if qid is None:
+            qid = _ids_by_text[q] = len(_texts)
+            norm = normalize(q)
+            _texts.append(q)
+            _norms.append(norm)
+            _hashes.append(stable_hash(norm))
+            _fingerprints.append(simhash.fingerprint(norm))
+        ids.append(qid)
+
+
+def _compile():
+    for domain_key, levels in DOMAIN_QUESTIONS.items():
+        for difficulty, types in levels.items():
+            for qtype, questions in types.items():
+                _add(f"domain/{domain_key}/{difficulty}/{qtype}", questions)
+    for difficulty, types in LOCAL_QUESTION_BANK.items():
+        for qtype, questions in types.items():
+            _add(f"bank/{difficulty}/{qtype}", questions)
+    for difficulty, questions in LOCAL_QUESTION_POOL.items():
+        _add(f"pool/{difficulty}", questions)
+    for track_id, track in TRACKS.items():
+        for difficulty, questions in track.get("questions", {}).items():
+            _add(f"track/{track_id}/{difficulty}", questions)
+
+
+_compile()
+
+
+# ─── Lookups ──────────────────────────────────────────────────────────────────
+
+def count() -> int:
+    return len(_texts)
+
+
+def text(qid: int) -> str:
+    return _texts[qid]
+
+
+def norm(qid: int) -> str:
+    return _norms[qid]
+
+
+def qhash(qid: int) -> int:
+    return _hashes[qid]
+
+
+def fingerprint(qid: int) -> int:
+    return _fingerprints[qid]
+
+
+def size(bucket: str) -> int:
+    ids = _buckets.get(bucket)
+    return len(ids) if ids is not None else 0
+
+
+def first(bucket: str) -> int | None:
+    ids = _buckets.get(bucket)
+    return ids[0] if ids else None
+
+
+def domain_bucket(banks: tuple[str, ...], difficulty: str, qtype: str) -> str | None:
+    """First of the matched domain banks (see domain_classifier) with questions of this difficulty and type."""
+    for key in banks:
+        bucket = f"domain/{key}/{difficulty}/{qtype}"
+        if bucket in _buckets:
+            return bucket
+    return None
+
+
+def bank_bucket(difficulty: str, qtype: str) -> str:
+    """LOCAL_QUESTION_BANK bucket, falling back to the flat pool for the difficulty."""
+    bucket = f"bank/{difficulty}/{qtype}"
+    if bucket in _buckets:
+        return bucket
+    pool = f"pool/{difficulty}"
+    return pool if pool in _buckets else "pool/basic"
+
+
+def track_bucket(track_id: str, difficulty: str) -> str | None:
+    track_id = (track_id or "").lower()
+    for level in (difficulty, "medium"):
+        bucket = f"track/{track_id}/{level}"
+        if bucket in _buckets:
+            return bucket
+    return None
+
+
+# ─── Per-session sampling ─────────────────────────────────────────────────────
+
+@lru_cache(maxsize=None)
+def _strides(n: int) -> tuple[int, ...]:
+    return tuple(k for k in range(1, n + 1) if gcd(k, n) == 1)
+
+
+def draw(session, bucket: str, accept: Callable[[int], bool] | None = None) -> int | None:
+    """Next question id from `bucket` this session has not drawn yet, or None when exhausted.
+
+    Ids rejected by `accept` (e.g. already asked in another session) are consumed too.
+    """
+    ids = _buckets.get(bucket)
+    if not ids:
+        return None
+    n = len(ids)
+    cursors = session.setdefault("bank_cursors", {})
+    cur = cursors.get(bucket)
+    if cur is None:
+        cur = cursors[bucket] = [random.randrange(n), random.choice(_strides(n)), 0]
+    start, stride, pos = cur
+    while pos < n:
+        qid = ids[(start + pos * stride) % n]
+        pos += 1
+        if accept is None or accept(qid):
+            cur[2] = pos
+            return qid
+    cur[2] = pos
+    return None
+
+
+def sample(bucket: str) -> int | None:
+    """Uniform random id from a bucket, with no session state."""
+    ids = _buckets.get(bucket)
+    return random.choice(ids) if ids else None
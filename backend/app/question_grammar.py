@@ -0,0 +1,153 @@
+"""
+Question Grammar — combinatorial local questions, per category and type.
+
+The category templates used to be one fixed sentence per difficulty, whatever
+the question type, so the local path repeated within a few questions and the
+LLM was asked for nearly every one. Here a question is a template for the
+difficulty and type, with slots filled from the category's vocabulary
+(data/question_grammar.json):
+
+    "While working on {subtopic}, you run into {failure}. How do you diagnose and fix it?"
+
+- `{subtopic}` / `{other}` — two different subtopics: half the time one of the
+  session's topics and company-track focus areas, otherwise any of those or
+  the category's own list;
+- `{constraint}`, `{scale}`, `{failure}` — the category's constraints, scales
+  and failure modes;
+- `{domain}` — the session's domain.
+
+That gives thousands of distinct, type-aware questions per category (see
+`count()`); categories without coding questions answer "coding" with practical
+ones. A question takes a few microseconds (benchmarks/bench_question_grammar.py).
+"""
+
+from __future__ import annotations
+import json
+import random
+import string
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+GRAMMAR_PATH = Path(__file__).parent / "data" / "question_grammar.json"
+SLOTS = ("domain", "subtopic", "other", "constraint", "scale", "failure")
+
+
+@dataclass(frozen=True, slots=True)
+class Template:
+    text: str
+    slots: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    coding: bool
+    subtopics: tuple[str, ...]
+    constraints: tuple[str, ...]
+    scales: tuple[str, ...]
+    failures: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Grammar:
+    templates: dict[tuple[str, str], tuple[Template, ...]]   # (difficulty, qtype) → templates
+    categories: dict[str, Category]
+
+
+def _template(text: str) -> Template:
+    slots = tuple(dict.fromkeys(name for _, name, _, _ in string.Formatter().parse(text) if name))
+    unknown = set(slots) - set(SLOTS)
+    if unknown:
+        raise ValueError(f"unknown slot(s) {sorted(unknown)} in question template {text!r}")
+    return Template(text, slots)
+
+
+@lru_cache(maxsize=1)
+def grammar() -> Grammar:
+    with open(GRAMMAR_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    templates = {
+        (difficulty, qtype): tuple(_template(t) for t in texts)
+        for difficulty, types in data["templates"].items()
+        for qtype, texts in types.items()
+    }
+    categories = {
+        name: Category(bool(c.get("coding")), tuple(c["subtopics"]), tuple(c["constraints"]),
+                       tuple(c["scales"]), tuple(c["failures"]))
+        for name, c in data["categories"].items()
+    }
+    return Grammar(templates, categories)
+
+
+def _category(category: str) -> Category:
+    categories = grammar().categories
+    return categories.get(category) or categories["generic"]
+
+
+def _templates(category: Category, difficulty: str, qtype: str) -> tuple[Template, ...]:
+    templates = grammar().templates
+    if qtype == "coding" and not category.coding:
+        qtype = "practical"
+    return templates.get((difficulty, qtype)) or templates.get(("basic", qtype)) or templates[("basic", "conceptual")]
+
+
+@lru_cache(maxsize=256)
+def _subtopics(category: str, topics: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """(the session's own subtopics, all subtopics): session topics first, then the
+    category's, without repeats."""
+    seen = set()
+    out = []
+    n_own = 0
+    for i, t in enumerate(topics + _category(category).subtopics):
+        key = t.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            out.append(t.strip())
+            n_own += i < len(topics)
+    return tuple(out[:n_own]), tuple(out)
+
+
+def generate(category: str, domain: str, difficulty: str = "basic", qtype: str = "conceptual",
+             topics: tuple[str, ...] = (), rng: random.Random | None = None) -> str:
+    """One question for the category, difficulty and type; `topics` are preferred subtopics."""
+    rng = rng or random
+    cat = _category(category)
+    template = rng.choice(_templates(cat, difficulty, qtype))
+    domain = domain or "your field"
+    own, subtopics = _subtopics(category, tuple(topics))
+    if "domain" in template.slots:
+        # A session's topics default to its domain: don't ask "why X matters in X".
+        own = tuple(t for t in own if t.lower() != domain.lower())
+        subtopics = tuple(t for t in subtopics if t.lower() != domain.lower())
+    values = {}
+    for slot in template.slots:
+        if slot == "domain":
+            values[slot] = domain
+        elif slot == "subtopic":
+            # Half the time from the session's own topics, when it has any.
+            values[slot] = rng.choice(own if own and rng.random() < 0.5 else subtopics)
+        elif slot == "other":
+            continue
+        else:
+            values[slot] = rng.choice(getattr(cat, slot + "s"))
+    if "other" in template.slots:
+        values["other"] = rng.choice([t for t in subtopics if t != values.get("subtopic")] or subtopics)
+    question = template.text.format(**values)
+    return question[0].upper() + question[1:]
+
+
+def count(category: str, difficulty: str = "basic", qtype: str = "conceptual",
+          topics: tuple[str, ...] = ()) -> int:
+    """How many distinct questions `generate` can produce for these arguments (at most —
+    templates naming the domain skip a topic equal to it)."""
+    cat = _category(category)
+    n_sub = len(_subtopics(category, tuple(topics))[1])
+    sizes = {"domain": 1, "subtopic": n_sub, "other": max(1, n_sub - 1),
+             "constraint": len(cat.constraints), "scale": len(cat.scales), "failure": len(cat.failures)}
+    total = 0
+    for template in _templates(cat, difficulty, qtype):
+        n = 1
+        for slot in template.slots:
+            n *= sizes[slot]
+        total += n
+    return total
@@ -0,0 +1,66 @@
+"""
+Question Queue — per-session candidates from one batched LLM call.
+
+A single question costs a full LLM round trip, most of it prompt prefill for a
+one-sentence answer. In batch mode (`settings.question_batch_size` > 1) one call
+returns K typed candidates (soul_engine.build_question_prompt(batch_size=K));
+they are queued on the session and handed out locally, preferring the type
+_select_question_type picked and skipping anything _is_repeat rejects.
+
+Candidates were written for the profile as it was when they were generated. The
+queue is tagged with a signature of the profile fields the prompt adapts to —
+difficulty, skill level, weak spots, confidence band — and is dropped as soon as
+the live profile's signature differs, so the next question triggers a fresh batch.
+
+State lives on the session as plain lists (`question_queue`, `question_queue_sig`)
+so snapshots carry it. Callers hold the session lock.
+"""
+
+from __future__ import annotations
+from typing import Callable
+
+
+def signature(profile) -> str:
+    """The profile fields a queued question depends on."""
+    confidence = float(profile.get("confidence", 5) or 5)
+    band = "low" if confidence <= 3 else ("mid" if confidence <= 6 else "high")   # as soul_engine's tone
+    weak = ",".join(sorted(profile.get("weakness_areas") or []))
+    return f"{profile.get('current_difficulty', 'basic')}|{profile.get('skill_level', 'unknown')}|{band}|{weak}"
+
+
+def pending(session) -> int:
+    return len(session.get("question_queue") or ())
+
+
+def fill(session, candidates: list[tuple[str | None, str]], sig: str) -> None:
+    """Replace the queue with fresh candidates generated for profile signature `sig`."""
+    session["question_queue"] = [[qtype or "", text] for qtype, text in candidates]
+    session["question_queue_sig"] = sig
+
+
+def invalidate(session) -> None:
+    session["question_queue"] = []
+    session["question_queue_sig"] = ""
+
+
+def take(session, qtype: str, sig: str, reject: Callable[[str], bool]) -> tuple[str | None, str] | None:
+    """Pop the best candidate for `qtype`: same type first, else the oldest usable one.
+
+    Returns (type, question) — type None when the model left it unlabelled — or
+    None when the queue is empty, exhausted or stale for `sig`.
+    """
+    queue = session.get("question_queue")
+    if not queue:
+        return None
+    if session.get("question_queue_sig") != sig:
+        invalidate(session)
+        return None
+    queue[:] = [c for c in queue if not reject(c[1])]
+    if not queue:
+        return None
+    for i, (ctype, text) in enumerate(queue):
+        if ctype == qtype:
+            del queue[i]
+            return ctype, text
+    ctype, text = queue.pop(0)
+    return ctype or None, text
@@ -1,17 +1,22 @@
-from fastapi import FastAPI, Form, HTTPException, APIRouter, UploadFile, File
+from fastapi import FastAPI, Form, Header, HTTPException, APIRouter, Request, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
+import asyncio
+import copy
+import functools
 import requests
 import os
 import uuid
 import re
 import json
 import random
-import time
 import threading
+from typing import Iterator
 from . import soul_engine, document_engine, speech_analyzer, gamification, company_tracks
-from . import llm_client
-from .config import get_cors_origins
+from . import audio_prep, domain_classifier, json_stream, llm_client, local_scorer, metrics, offload
+from . import prescreen, prosody, question_bank, question_grammar, question_queue, segmented_stt, simhash, snapshot, sse, tts_cache, tts_stream, vad
+from .config import get_cors_origins, settings
+from .session_model import AnswerRecord, InterviewSession
 
 app = FastAPI()
 
@@ -29,30 +34,42 @@ router = APIRouter()
 # In a real application, this would be a database or a more robust session management system
 active_sessions = {}
 _prefetch_cache: dict[str, str] = {}   # session_id → pre-generated next question
+_turn_next: dict[str, tuple[str, str]] = {}   # session_id → (kind, question) from a fused evaluation
+
+# Per-session serialization. Request handlers and background threads
+# (_prefetch_next) take a session's lock only around short read-modify-write
+# sections — never across an LLM call — so one session's mutations stay
+# consistent while different sessions never wait on each other.
+_session_locks: dict[str, threading.RLock] = {}
+_session_locks_guard = threading.Lock()
+
+def _session_lock(session_id: str) -> threading.RLock:
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        with _session_locks_guard:
+            lock = _session_locks.setdefault(session_id, threading.RLock())
+    return lock
+
+def _drop_session_lock(session_id: str):
+    with _session_locks_guard:
+        _session_locks.pop(session_id, None)
+
+async def _checkpoint(session_id: str, session: InterviewSession):
+    """Snapshot a session to disk (settings.snapshot_dir) so it survives a restart.
+
+    Encoding happens under the session lock so the snapshot is consistent; the
+    file write happens off the event loop and outside the lock.
+    """
+    if not settings.snapshot_dir:
+        return
+    with _session_lock(session_id):
+        blob = snapshot.dumps(session)
+    try:
+        await offload.run_io(snapshot.write, session_id, blob)
+    except OSError as e:
+        print(f"[snapshot] could not write {session_id}: {e}")
+
 DIFFICULTY_LEVELS = ("basic", "medium", "hard")
-LOCAL_QUESTION_POOL = {
-    "basic": [
-        "Explain the concept of polymorphism with a simple example.",
-        "What is a REST API and how does it work?",
-        "Define time complexity and why it matters.",
-        "Explain the difference between an array and a linked list.",
-        "What is normalization in databases?"
-    ],
-    "medium": [
-        "Design a URL shortener: outline key components and trade-offs.",
-        "How would you scale a read-heavy service with caching layers?",
-        "Compare SQL vs NoSQL for a logging system; justify your choice.",
-        "Describe optimistic vs pessimistic locking and when to use each.",
-        "Explain CAP theorem and its practical implications."
-    ],
-    "hard": [
-        "Design a globally distributed messaging system with exactly-once semantics.",
-        "How would you implement rate limiting at scale across regions?",
-        "Analyze bottlenecks in a high-throughput pipeline and propose fixes.",
-        "Explain consensus algorithms (e.g., Raft/Paxos) and failure scenarios.",
-        "Propose an approach to minimize tail latency in large systems."
-    ],
-}
 
 def _compute_effective_difficulty(base_diff: str, last_score_10: int | None) -> str:
     base = (base_diff or "basic").strip().lower()
@@ -75,120 +92,55 @@ QUESTION_TYPE_WEIGHTS = {
     "hard": {"conceptual": 0.15, "practical": 0.30, "scenario": 0.25, "coding": 0.20, "behavioral": 0.10},
 }
 
-# Richer local bank organized by difficulty and type
-LOCAL_QUESTION_BANK = {
-    "basic": {
-        "conceptual": [
-            "Explain polymorphism with a simple example.",
-            "What is a REST API and how does it work?",
-            "Define time complexity and why it matters.",
-            "Difference between an array and a linked list?",
-            "What is normalization in databases?",
-        ],
-        "practical": [
-            "Outline steps to debug a failing API endpoint.",
-            "How would you write unit tests for a simple function?",
-            "Describe a basic caching strategy for read-heavy data.",
-        ],
-        "scenario": [
-            "A service slows during peak hours—what do you check first?",
-            "User reports inconsistent data—how do you investigate?",
-        ],
-        "coding": [
-            "Write a function to reverse a string.",
-            "Implement a stack using two queues—explain your approach.",
-        ],
-        "behavioral": [
-            "Tell me about a time you resolved a team conflict.",
-            "Describe how you prioritize tasks under tight deadlines.",
-        ],
-    },
-    "medium": {
-        "conceptual": [
-            "Explain CAP theorem and practical implications.",
-            "Compare SQL vs NoSQL for a logging system.",
-        ],
-        "practical": [
-            "Scale a read-heavy service with caching—outline trade-offs.",
-            "Design a URL shortener components and storage model.",
-        ],
-        "scenario": [
-            "Service returns sporadic 500s—diagnose and propose fixes.",
-            "Cache stampede observed—how do you mitigate it?",
-        ],
-        "coding": [
-            "Implement LRU cache—describe data structures used.",
-            "Traverse a binary tree iteratively and explain complexity.",
-        ],
-        "behavioral": [
-            "Discuss a time you influenced a decision without authority.",
-            "Describe mentoring a junior engineer through a project.",
-        ],
-    },
-    "hard": {
-        "conceptual": [
-            "Explain consensus algorithms (Raft/Paxos) and failure scenarios.",
-            "Discuss exactly-once semantics and when they are feasible.",
-        ],
-        "practical": [
-            "Implement rate limiting at scale across regions.",
-            "Minimize tail latency—describe architectural approaches.",
-        ],
-        "scenario": [
-            "Global outage due to config drift—investigation and prevention plan.",
-            "Hot partition causing hotspots—how do you remediate?",
-        ],
-        "coding": [
-            "Implement distributed lock with lease renewal—explain guarantees.",
-            "Design a concurrent worker pool—handle backpressure.",
-        ],
-        "behavioral": [
-            "Tell me about leading a cross-functional incident response.",
-            "Describe driving architectural change against initial resistance.",
-        ],
-    },
-}
-
-# Global anti-repeat across sessions (best-effort in-memory)
+# Global anti-repeat across sessions (best-effort in-memory).
+# Holds question_bank.stable_hash() of normalized question text for exact
+# repeats, and SimHash fingerprints for near-duplicates (paraphrases).
 GLOBAL_ASKED_HASHES = set()
+GLOBAL_NEAR_DUPS = simhash.SimHashIndex()
 
 def _is_globally_unseen(text: str) -> bool:
-    try:
-        h = hash(text)
-        return h not in GLOBAL_ASKED_HASHES
-    except Exception:
-        return True
+    norm = _normalize_q(text)
+    return (question_bank.stable_hash(norm) not in GLOBAL_ASKED_HASHES
+            and not _is_near_dup(GLOBAL_NEAR_DUPS, simhash.fingerprint(norm)))
 
-def _note_global_question(text: str):
-    try:
-        GLOBAL_ASKED_HASHES.add(hash(text))
-    except Exception:
-        pass
+def _note_global_question(norm: str, fp: int):
+    GLOBAL_ASKED_HASHES.add(question_bank.stable_hash(norm))
+    if fp:
+        GLOBAL_NEAR_DUPS.add(fp)
 
 def _normalize_q(text: str) -> str:
-    try:
-        t = (text or "").strip().lower()
-        # collapse whitespace and strip trivial punctuation
-        t = re.sub(r"\s+", " ", t)
-        t = re.sub(r"[\.;:!]+$", "", t)
-        return t
-    except Exception:
-        return text or ""
+    return question_bank.normalize(text)
+
+def _is_near_dup(index: simhash.SimHashIndex, fp: int) -> bool:
+    # fp == 0: no content words to compare ("What is it?") — exact matching only.
+    return bool(fp) and fp in index
 
 def _is_repeat(session: dict, question: str) -> bool:
     norm = _normalize_q(question)
-    asked_norm = session.setdefault('asked_norm_set', set())
-    if norm in asked_norm:
+    return _is_repeat_norm(session, norm, question_bank.stable_hash(norm), simhash.fingerprint(norm))
+
+def _is_repeat_norm(session: dict, norm: str, h: int, fp: int) -> bool:
+    if norm in session.setdefault('asked_norm_set', set()) or h in GLOBAL_ASKED_HASHES:
         return True
-    try:
-        return hash(norm) in GLOBAL_ASKED_HASHES
-    except Exception:
-        return False
+    return _is_near_dup(_session_near_dups(session), fp) or _is_near_dup(GLOBAL_NEAR_DUPS, fp)
+
+def _is_repeat_id(session: dict, qid: int) -> bool:
+    """_is_repeat for a compiled bank question, using its precomputed norm, hash and fingerprint."""
+    return _is_repeat_norm(session, question_bank.norm(qid), question_bank.qhash(qid), question_bank.fingerprint(qid))
+
+def _session_near_dups(session: dict) -> simhash.SimHashIndex:
+    index = session.get('near_dup_index')
+    if index is None:   # bare dict sessions
+        index = session['near_dup_index'] = simhash.SimHashIndex()
+    return index
 
 def _note_session_question(session: dict, question: str):
     norm = _normalize_q(question)
+    fp = simhash.fingerprint(norm)
     session.setdefault('asked_norm_set', set()).add(norm)
-    _note_global_question(norm)
+    if fp:
+        _session_near_dups(session).add(fp)
+    _note_global_question(norm, fp)
 
 def _select_question_type(prep_level: str, last_score_10: int | None, session: dict | None = None) -> str:
     level = _compute_effective_difficulty(prep_level, last_score_10)
@@ -219,248 +171,90 @@ def _select_question_type(prep_level: str, last_score_10: int | None, session: d
 
 def _generate_domain_specific_question(domain: str, difficulty: str, qtype: str) -> str:
     """Generate domain-specific questions based on job type"""
-    domain_lower = domain.lower()
-    
-    # Domain-specific question templates
-    domain_questions = {
-        # Technology & Engineering
-        'software engineering': {
-            'basic': {
-                'conceptual': ["Explain the difference between object-oriented and functional programming", "What is version control and why is it important?", "Define what an API is and how it works"],
-                'practical': ["How would you debug a slow-loading web page?", "Describe the steps to deploy a web application", "How do you ensure code quality in a team?"],
-                'coding': ["Write a function to find the largest number in an array", "Implement a simple calculator function", "Create a function to validate an email address"]
-            },
-            'medium': {
-                'conceptual': ["Explain microservices architecture and its benefits", "What is the difference between SQL and NoSQL databases?", "Describe the MVC design pattern"],
-                'practical': ["How would you scale a web application for high traffic?", "Design a simple e-commerce database schema", "Explain your approach to API testing"],
-                'coding': ["Implement a binary search algorithm", "Create a REST API endpoint for user authentication", "Write a function to detect cycles in a linked list"]
-            },
-            'hard': {
-                'conceptual': ["Explain distributed systems and CAP theorem", "Discuss event-driven architecture patterns", "What are the challenges of implementing microservices?"],
-                'practical': ["Design a system to handle millions of concurrent users", "How would you implement real-time notifications at scale?", "Architect a fault-tolerant payment processing system"],
-                'coding': ["Implement a distributed cache with consistency guarantees", "Design a rate limiter for an API", "Create a system for processing streaming data"]
-            }
-        },
-        
-        # Marketing & Sales
-        'digital marketing': {
-            'basic': {
-                'conceptual': ["What is the difference between organic and paid marketing?", "Explain what a conversion funnel is", "What are the main social media platforms for B2B marketing?"],
-                'practical': ["How would you measure the success of an email campaign?", "Describe how to set up a Google Ads campaign", "What metrics would you track for a content marketing strategy?"],
-                'scenario': ["A client's website traffic dropped 50% - how do you investigate?", "You need to increase brand awareness on a limited budget - what's your approach?"]
-            },
-            'medium': {
-                'conceptual': ["Explain marketing attribution models and their use cases", "What is programmatic advertising and how does it work?", "Describe the customer journey mapping process"],
-                'practical': ["How would you optimize a landing page for conversions?", "Design a multi-channel marketing campaign for a product launch", "Create a strategy to improve email open rates"],
-                'scenario': ["Your competitor just launched a similar product - how do you respond?", "ROI on paid ads is declining - what's your optimization strategy?"]
-            },
-            'hard': {
-                'conceptual': ["Discuss advanced marketing automation and personalization strategies", "Explain cross-device tracking and privacy implications", "What are the challenges of marketing in a cookieless future?"],
-                'practical': ["Design a comprehensive attribution model for a multi-touch customer journey", "Create a strategy for international market expansion", "Develop a framework for marketing mix optimization"],
-                'scenario': ["You need to pivot marketing strategy due to economic downturn", "How would you handle a PR crisis affecting brand reputation?"]
-            }
-        },
-        
-        # Finance & Accounting
-        'financial analysis': {
-            'basic': {
-                'conceptual': ["What are the three main financial statements?", "Explain the difference between revenue and profit", "What is cash flow and why is it important?"],
-                'practical': ["How would you calculate return on investment (ROI)?", "Describe the process of creating a budget", "What ratios would you use to assess company liquidity?"],
-                'scenario': ["A company's expenses are increasing faster than revenue - what do you analyze?", "You need to present financial performance to non-financial stakeholders"]
-            },
-            'medium': {
-                'conceptual': ["Explain different valuation methods for companies", "What is the time value of money and how is it applied?", "Describe various types of financial risks"],
-                'practical': ["How would you build a discounted cash flow model?", "Analyze the financial impact of a potential acquisition", "Create a sensitivity analysis for key business drivers"],
-                'scenario': ["You're evaluating two investment opportunities with different risk profiles", "A client wants to understand why their profit margins are declining"]
-            },
-            'hard': {
-                'conceptual': ["Discuss advanced derivatives and hedging strategies", "Explain the complexities of international financial reporting", "What are the challenges in valuing intangible assets?"],
-                'practical': ["Design a comprehensive risk management framework", "Model the financial impact of various economic scenarios", "Create a capital allocation strategy for a diversified portfolio"],
-                'scenario': ["You need to restructure debt for a distressed company", "How would you handle financial reporting during a major acquisition?"]
-            }
-        },
-        
-        # Human Resources
-        'human resources': {
-            'basic': {
-                'conceptual': ["What is the difference between recruitment and talent acquisition?", "Explain the importance of employee onboarding", "What are the key components of compensation and benefits?"],
-                'practical': ["How would you conduct a job interview effectively?", "Describe the steps in performance management", "What's your approach to handling employee complaints?"],
-                'scenario': ["An employee is consistently underperforming - how do you address it?", "You need to reduce workforce due to budget constraints"]
-            },
-            'medium': {
-                'conceptual': ["Explain different leadership development approaches", "What is organizational culture and how do you shape it?", "Describe various employee engagement strategies"],
-                'practical': ["How would you design a comprehensive training program?", "Create a strategy for improving employee retention", "Develop a framework for succession planning"],
-                'scenario': ["There's conflict between two department heads affecting team morale", "You need to implement major organizational changes"]
-            },
-            'hard': {
-                'conceptual': ["Discuss advanced talent analytics and predictive HR", "Explain the complexities of global HR management", "What are the challenges of managing remote and hybrid workforces?"],
-                'practical': ["Design a comprehensive diversity and inclusion strategy", "Create a framework for organizational transformation", "Develop advanced compensation modeling for different markets"],
-                'scenario': ["You're leading HR during a major merger or acquisition", "How would you handle a workplace harassment investigation?"]
-            }
-        },
-        
-        # Design & Creative
-        'ux/ui design': {
-            'basic': {
-                'conceptual': ["What is the difference between UX and UI design?", "Explain the importance of user research", "What are design systems and why are they useful?"],
-                'practical': ["How would you conduct user interviews?", "Describe your process for creating wireframes", "What tools do you use for prototyping?"],
-                'scenario': ["Users are complaining that a feature is confusing - how do you investigate?", "You need to design for both mobile and desktop - what's your approach?"]
-            },
-            'medium': {
-                'conceptual': ["Explain different usability testing methods", "What is information architecture and how do you approach it?", "Describe the principles of accessible design"],
-                'practical': ["How would you redesign a complex dashboard for better usability?", "Create a user journey map for an e-commerce checkout", "Design a responsive navigation system"],
-                'scenario': ["Stakeholders want to add many features but users want simplicity", "You have limited time and budget for user research"]
-            },
-            'hard': {
-                'conceptual': ["Discuss advanced interaction design patterns", "Explain the psychology behind user behavior and decision-making", "What are the challenges of designing for emerging technologies?"],
-                'practical': ["Design a comprehensive design system for a large organization", "Create a strategy for international localization", "Develop a framework for measuring design impact"],
-                'scenario': ["You need to convince executives to invest in design research", "How would you handle conflicting feedback from multiple stakeholders?"]
-            }
-        }
-    }
-    
-    # Find matching domain questions
-    for domain_key, questions in domain_questions.items():
-        if domain_key in domain_lower or any(word in domain_lower for word in domain_key.split()):
-            if difficulty in questions and qtype in questions[difficulty]:
-                return random.choice(questions[difficulty][qtype])
-    
-    # Fallback to generic questions based on domain category
-    if any(tech_word in domain_lower for tech_word in ['software', 'engineering', 'development', 'programming', 'tech', 'data', 'machine learning', 'ai', 'cloud', 'devops', 'cyber', 'security', 'database', 'system']):
-        return _generate_tech_question(domain, difficulty, qtype)
-    elif any(business_word in domain_lower for business_word in ['business', 'management', 'strategy', 'operations', 'consulting', 'product']):
-        return _generate_business_question(domain, difficulty, qtype)
-    elif any(marketing_word in domain_lower for marketing_word in ['marketing', 'sales', 'brand', 'content', 'social media', 'seo', 'advertising']):
-        return _generate_marketing_question(domain, difficulty, qtype)
-    elif any(finance_word in domain_lower for finance_word in ['finance', 'accounting', 'investment', 'banking', 'financial', 'audit', 'tax']):
-        return _generate_finance_question(domain, difficulty, qtype)
-    elif any(hr_word in domain_lower for hr_word in ['human resources', 'hr', 'talent', 'recruitment', 'organizational', 'training']):
-        return _generate_hr_question(domain, difficulty, qtype)
-    elif any(design_word in domain_lower for design_word in ['design', 'ux', 'ui', 'creative', 'graphic', 'web design', 'product design']):
-        return _generate_design_question(domain, difficulty, qtype)
-    elif any(healthcare_word in domain_lower for healthcare_word in ['healthcare', 'medical', 'clinical', 'pharmaceutical', 'biotech', 'health']):
-        return _generate_healthcare_question(domain, difficulty, qtype)
-    elif any(legal_word in domain_lower for legal_word in ['legal', 'compliance', 'regulatory', 'contract', 'intellectual property']):
-        return _generate_legal_question(domain, difficulty, qtype)
-    else:
-        return _generate_generic_question(domain, difficulty, qtype)
-
-def _generate_tech_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"Explain a fundamental concept in {domain} that every professional should know",
-        'medium': f"Describe how you would solve a common challenge in {domain}",
-        'hard': f"Design a complex system or solution for an advanced {domain} problem"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_business_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"What are the key principles of {domain} and why are they important?",
-        'medium': f"How would you approach a strategic decision in {domain}?",
-        'hard': f"Design a comprehensive strategy for a complex {domain} challenge"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_marketing_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"Explain the basics of {domain} and its key metrics",
-        'medium': f"How would you create and execute a {domain} campaign?",
-        'hard': f"Design an advanced {domain} strategy for a competitive market"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_finance_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"What are the fundamental concepts in {domain}?",
-        'medium': f"How would you analyze and present {domain} data to stakeholders?",
-        'hard': f"Design a comprehensive {domain} framework for complex scenarios"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_hr_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"What are the core responsibilities in {domain}?",
-        'medium': f"How would you handle a challenging {domain} situation?",
-        'hard': f"Design a strategic {domain} initiative for organizational transformation"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_design_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"Explain the design process and principles in {domain}",
-        'medium': f"How would you approach a {domain} project with specific constraints?",
-        'hard': f"Design a comprehensive {domain} system for a complex product"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_healthcare_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"What are the key regulations and standards in {domain}?",
-        'medium': f"How would you improve processes or outcomes in {domain}?",
-        'hard': f"Design a solution for a complex {domain} challenge involving multiple stakeholders"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_legal_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"What are the fundamental legal principles in {domain}?",
-        'medium': f"How would you handle a {domain} issue for a client?",
-        'hard': f"Design a comprehensive {domain} strategy for a complex legal matter"
-    }
-    return templates.get(difficulty, templates['basic'])
-
-def _generate_generic_question(domain: str, difficulty: str, qtype: str) -> str:
-    templates = {
-        'basic': f"What are the key skills and knowledge areas required in {domain}?",
-        'medium': f"Describe a challenging situation you might face in {domain} and how you would handle it",
-        'hard': f"Design a strategic approach to excel in {domain} in a competitive environment"
-    }
-    return templates.get(difficulty, templates['basic'])
+    dclass = domain_classifier.classify(domain)
+    bucket = question_bank.domain_bucket(dclass.banks, difficulty, qtype)
+    if bucket:
+        return question_bank.text(question_bank.sample(bucket))
+    return _generate_category_question(domain, dclass.category, difficulty, qtype)
+
+def _generate_category_question(domain: str, category: str, difficulty: str, qtype: str,
+                                topics: tuple[str, ...] = ()) -> str:
+    """Question from the category's template grammar (see app/question_grammar.py)."""
+    return question_grammar.generate(category, domain, difficulty, qtype, topics)
+
+def _session_domain_class(session: dict) -> domain_classifier.DomainClass:
+    """The classification stored at /interview/start (classified on the fly for bare dicts)."""
+    return session.get('domain_class') or domain_classifier.classify(session.get('domain'))
+
+GRAMMAR_ATTEMPTS = 8   # grammar draws tried before falling back to the general bank
+
+def _session_subtopics(session: dict) -> tuple[str, ...]:
+    """Subtopics the grammar should prefer: the profile's topics, then the company track's focus areas."""
+    profile = session.get('soul_profile') or {}
+    topics = list(profile.get('topics') or session.get('topics') or ())
+    track = company_tracks.get_track(session.get('company_track')) if session.get('company_track') else None
+    if track:
+        topics += track.get('focus', ())
+    return tuple(topics)
+
+def _local_basic_question(session_id: str, session: dict) -> str | None:
+    """A grammar question instead of a provider call, for settings.local_question_share of basic-level questions."""
+    share = settings.local_question_share
+    if share <= 0 or _compute_effective_difficulty(session.get('difficulty', 'basic'), session.get('last_score_10')) != 'basic':
+        return None
+    if share < 1 and random.random() >= share:
+        return None
+    with _session_lock(session_id):
+        q = _generate_local_question_locked(session)
+        session.setdefault('questions_asked', []).append(q)
+        session['current_question'] = q
+    metrics.incr("llm_calls_avoided")
+    metrics.incr("questions_local")
+    return q
 
 def _generate_local_question_with_difficulty(session: dict, session_id: str) -> str:
+    with _session_lock(session_id):
+        return _generate_local_question_locked(session)
+
+def _generate_local_question_locked(session: dict) -> str:
     domain = session.get('domain') or 'your field'
     eff = _compute_effective_difficulty(session.get('difficulty', 'basic'), session.get('last_score_10'))
     qtype = _select_question_type(eff, session.get('last_score_10'), session)
-    
-    # Try domain-specific question first
-    domain_question = _generate_domain_specific_question(domain, eff, qtype)
-    if domain_question:
-        asked = set(session.get('questions_asked', []))
-        if domain_question not in asked and not _is_repeat(session, domain_question):
-            _note_session_question(session, domain_question)
-            session.setdefault('type_counts', {})[qtype] = int(session.setdefault('type_counts', {}).get(qtype, 0)) + 1
-            session.setdefault('last_types', []).append(qtype)
-            return domain_question
-    
-    # Fallback to original question bank
-    bank = LOCAL_QUESTION_BANK.get(eff, {}).get(qtype, [])
-    if not bank:
-        bank = LOCAL_QUESTION_POOL.get(eff, LOCAL_QUESTION_POOL['basic'])
-    asked = set(session.get('questions_asked', []))
-    session.setdefault('type_counts', {})
-    session.setdefault('last_types', [])
-    # Try up to len(bank) to avoid repeat within session
-    if bank:
-        for _ in range(len(bank)):
-            idx = random.randrange(0, len(bank))
-            candidate = f"{bank[idx]} (Type: {qtype}, Topic: {domain})"
-            if candidate not in asked and not _is_repeat(session, candidate):
-                _note_session_question(session, candidate)
-                session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
-                session['last_types'].append(qtype)
-                return candidate
-        # fallback if all seen
-        fallback = f"{bank[0]} (Type: {qtype}, Topic: {domain})"
-        _note_session_question(session, fallback)
-        session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
-        session['last_types'].append(qtype)
-        return fallback
+    type_counts = session.setdefault('type_counts', {})
+    last_types = session.setdefault('last_types', [])
+
+    def _take(question: str) -> str:
+        _note_session_question(session, question)
+        type_counts[qtype] = int(type_counts.get(qtype, 0)) + 1
+        last_types.append(qtype)
+        return question
+
+    # Try domain-specific question first: the next unseen one from the domain's
+    # bank, then the category's template grammar once the bank has run out (or
+    # when the domain has no bank for this type).
+    dclass = _session_domain_class(session)
+    bucket = question_bank.domain_bucket(dclass.banks, eff, qtype)
+    if bucket:
+        qid = question_bank.draw(session, bucket, accept=lambda q: not _is_repeat_id(session, q))
+        if qid is not None:
+            return _take(question_bank.text(qid))
+    topics = _session_subtopics(session)
+    for _ in range(GRAMMAR_ATTEMPTS):
+        domain_question = _generate_category_question(domain, dclass.category, eff, qtype, topics)
+        if not _is_repeat(session, domain_question):
+            return _take(domain_question)
+
+    # Fallback to the general question bank
+    bucket = question_bank.bank_bucket(eff, qtype)
+    def _bank_question(qid: int) -> str:
+        return f"{question_bank.text(qid)} (Type: {qtype}, Topic: {domain})"
+    qid = question_bank.draw(session, bucket, accept=lambda q: not _is_repeat(session, _bank_question(q)))
+    if qid is None:
+        qid = question_bank.first(bucket)   # everything seen — repeat the first
+    if qid is not None:
+        return _take(_bank_question(qid))
     # ultimate fallback
-    ultimate = f"Ask me one {eff} {qtype} interview question about {domain}."
-    _note_session_question(session, ultimate)
-    session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
-    session['last_types'].append(qtype)
-    return ultimate
+    return _take(f"Ask me one {eff} {qtype} interview question about {domain}.")
 
 # Define API configurations for different providers
 # "default_model" is used when the user doesn't specify one.
@@ -561,53 +355,100 @@ def _is_offline_demo(session: dict) -> bool:
         return False
 
 # ─── Session persistence helpers ─────────────────────────────────────────────
+# Callers hold _session_lock(session_id) around these.
 
-def _persist_answer(session: dict, answer: str, score: int, eval_data: dict, analysis_dict: dict):
-    """Write Q&A result into the session so both streaming and blocking paths stay in sync."""
-    question = session.get("current_question", "")
-    session.setdefault("qa_pairs", []).append({
-        "question": question,
-        "user_answer": answer,
-        "score": score,
-        "verdict": "Correct" if eval_data.get("is_correct") else ("Partially Correct" if score >= 5 else "Incorrect"),
-        "feedback": eval_data.get("detailed_feedback", ""),
-        "correct_answer": eval_data.get("correct_answer_hint", ""),
-        "improvement_tip": eval_data.get("improvement_tip", ""),
-        "topic_tag": eval_data.get("topic_tag", ""),
-        "analysis": analysis_dict,
-    })
-    session.setdefault("answers_given", []).append(answer)
-    session.setdefault("feedback_received", []).append(eval_data.get("detailed_feedback", ""))
-    session.setdefault("scores_10", []).append(score)
-    session.setdefault("analysis_history", []).append(analysis_dict)
-    session["last_score_10"] = score
-    session["last_answer_word_count"] = len(answer.split())
-    # Cap history to last 30 entries to prevent memory growth
-    for key in ("qa_pairs", "answers_given", "feedback_received", "scores_10", "analysis_history"):
-        if len(session.get(key, [])) > 30:
-            session[key] = session[key][-30:]
-    if "soul_profile" in session:
-        session["soul_profile"] = soul_engine.update_profile(
-            session["soul_profile"], score, topic=eval_data.get("topic_tag") or session.get("domain")
-        )
-        session["difficulty"] = session["soul_profile"]["current_difficulty"]
+def _commit_question(session: dict, question: str, qtype: str | None = None):
+    """Make `question` the current one and record it for anti-repeat / diversity."""
+    session.setdefault('questions_asked', []).append(question)
+    session['current_question'] = question
+    if qtype:
+        session.setdefault('type_counts', {})
+        session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
+        session.setdefault('last_types', []).append(qtype)
+    _note_session_question(session, question)
+
+def _persist_answer(session: InterviewSession, answer: str, score: int, eval_data: dict, analysis: speech_analyzer.AnswerAnalysis, question: str | None = None):
+    """Write Q&A result into the session so both streaming and blocking paths stay in sync.
+
+    `question` is the question the answer was given to, captured when the request
+    arrived — by the time the evaluation returns, another request may have moved
+    `current_question` on.
+    """
+    if question is None:
+        question = session.current_question
+    session.record_answer(AnswerRecord(
+        question=question,
+        answer=answer,
+        verdict="Correct" if eval_data.get("is_correct") else ("Partially Correct" if score >= 5 else "Incorrect"),
+        feedback=eval_data.get("detailed_feedback", ""),
+        correct_answer=eval_data.get("correct_answer_hint", ""),
+        improvement_tip=eval_data.get("improvement_tip", ""),
+        topic_tag=eval_data.get("topic_tag", ""),
+        analysis=analysis,
+    ), score)
+    session.last_score_10 = score
+    session.last_answer_word_count = len(answer.split())
+    session.soul_profile = soul_engine.update_profile(
+        session.soul_profile, score, topic=eval_data.get("topic_tag") or session.domain
+    )
+    session.difficulty = session.soul_profile.current_difficulty
+
+
+_VOICE_WORD = re.compile(r"[a-z0-9']+")
+
+def _take_voice_prosody(session: dict, answer: str):
+    """Prosody of the recording `answer` was transcribed from, if it was spoken.
+
+    Consumed once. A typed answer (or a transcript edited beyond recognition)
+    doesn't match the stored transcript and gets no delivery metrics.
+    """
+    voice, transcript = session.get("voice_prosody"), session.get("voice_transcript") or ""
+    if voice is None:
+        return None
+    session["voice_prosody"], session["voice_transcript"] = None, ""
+    spoken, given = set(_VOICE_WORD.findall(transcript.lower())), set(_VOICE_WORD.findall(answer.lower()))
+    if not spoken or len(spoken & given) / len(spoken | given) < 0.6:
+        return None
+    return voice
+
+def _note_voice(session_id: str, session: dict, transcript: str, voice):
+    if session is None or voice is None or session_id not in active_sessions:
+        return
+    with _session_lock(session_id):
+        session["voice_transcript"], session["voice_prosody"] = transcript, voice
+
+async def _analyze_answer(session_id: str, session: dict, answer: str) -> speech_analyzer.AnswerAnalysis:
+    """speech_analyzer.analyze on the CPU pool, with delivery metrics when the answer was spoken."""
+    with _session_lock(session_id):
+        voice = _take_voice_prosody(session, answer)
+    return await offload.run_cpu(speech_analyzer.analyze, answer, question_type=session.get("interview_type", "general"), prosody=voice)
 
 
 # ─── Soul-engine-powered evaluator (replaces per-provider duplication) ────────
 
-def _evaluate_with_soul(session: dict, answer: str) -> dict:
+def _evaluate_with_soul(session: dict, answer: str, question: str | None = None,
+                        analysis: speech_analyzer.AnswerAnalysis | None = None) -> dict:
     """
     Evaluate an answer using soul_engine's rich prompt via the unified llm_client.
     Returns: {score, is_correct, short_verdict, detailed_feedback,
               correct_answer_hint, improvement_tip, topic_tag}
-    Falls back gracefully if the LLM call fails.
+    Falls back to the local scorer if the LLM call fails.
     """
-    question = session.get("current_question", "")
+    if question is None:
+        question = session.get("current_question", "")
     profile = session.get("soul_profile") or soul_engine.default_profile(
         session.get("domain", "General")
     )
 
     eval_prompt = soul_engine.build_evaluation_prompt(question, answer, profile)
+    raw = _call_evaluator(session, eval_prompt, 600)
+    if raw is None:
+        return _local_eval(session, answer, question, analysis)
+    return soul_engine.parse_evaluation_json(raw)
+
+
+def _call_evaluator(session: dict, prompt: str, max_tokens: int) -> str | None:
+    """One blocking evaluator call; None if it failed (or the provider's circuit is open)."""
     messages = [
         {
             "role": "system",
@@ -616,7 +457,7 @@ def _evaluate_with_soul(session: dict, answer: str) -> dict:
                 "Always respond with a single valid JSON object. No markdown, no extra text."
             ),
         },
-        {"role": "user", "content": eval_prompt},
+        {"role": "user", "content": prompt},
     ]
 
     provider = session.get("provider", "openai")
@@ -624,11 +465,383 @@ def _evaluate_with_soul(session: dict, answer: str) -> dict:
     api_key = session.get("api_key", "")
 
     try:
-        raw = llm_client.call_llm(provider, api_key, model, messages, max_tokens=600, timeout=45)
-        return soul_engine.parse_evaluation_json(raw)
+        return llm_client.call_llm(provider, api_key, model, messages, max_tokens=max_tokens, timeout=45)
+    except llm_client.CircuitOpen:
+        return None
     except Exception as exc:
-        print(f"Soul evaluator error ({provider}): {exc}")
-        return soul_engine.parse_evaluation_json("")
+        print(f"Soul evaluator error ({provider}): {mask_secret(str(exc))}")
+        return None
+
+
+def _evaluate_answer(session: dict, answer: str, question: str,
+                     analysis: speech_analyzer.AnswerAnalysis | None = None) -> tuple[dict, tuple[str, str] | None]:
+    """The configured evaluator: a fused turn, a quick grade, or the full evaluation. Blocking."""
+    if settings.fused_turns:
+        return _evaluate_turn(session, answer, question, analysis)
+    if settings.quick_eval:
+        return _evaluate_quick(session, answer, question, analysis), None
+    return _evaluate_with_soul(session, answer, question, analysis), None
+
+
+def _prescreen(session: dict, question: str, answer: str, analysis: speech_analyzer.AnswerAnalysis) -> dict | None:
+    """A local evaluation when the answer is clearly trivial (see prescreen.py), counted as an LLM call avoided."""
+    if not settings.answer_prescreen:
+        return None
+    eval_data = prescreen.screen(question, answer, analysis, topic=session.get("domain") or "General")
+    if eval_data is not None:
+        metrics.incr("llm_calls_avoided")
+        metrics.incr(f"prescreen_{eval_data['prescreen']}")
+    return eval_data
+
+
+# ─── Two-phase evaluation (settings.quick_eval) ──────────────────────────────
+# Output tokens dominate evaluator latency, so the answer is first graded with a
+# three-key schema (score, verdict, topic). The long feedback and model answer
+# are written by /interview/answer/detail only when the candidate opens them,
+# and stored on the answer's record — asking again is free. A local fallback
+# (the evaluator failed) is returned but not stored, so the next request retries.
+
+QUICK_MAX_TOKENS = 60
+DETAIL_MAX_TOKENS = 600
+
+_detail_tasks: dict[int, asyncio.Future] = {}   # id(AnswerRecord) → detail generation in flight
+
+def _evaluate_quick(session: dict, answer: str, question: str,
+                    analysis: speech_analyzer.AnswerAnalysis | None = None) -> dict:
+    profile = session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
+    track = company_tracks.get_track(session.get("company_track")) if session.get("company_track") else None
+    prompt = soul_engine.build_quick_evaluation_prompt(question, answer, profile, company_track=track)
+    raw = _call_evaluator(session, prompt, QUICK_MAX_TOKENS)
+    if raw is None:
+        return _local_eval(session, answer, question, analysis)
+    return soul_engine.parse_quick_evaluation_json(raw)
+
+def _detail_response(record: AnswerRecord, cached: bool) -> dict:
+    return {
+        "answer_id": record.id,
+        "feedback": record.feedback,
+        "correct_answer": record.correct_answer,
+        "improvement_tip": record.improvement_tip,
+        "cached": cached,
+    }
+
+def _generate_detail(session_id: str, session: InterviewSession, record: AnswerRecord, score: int) -> dict | None:
+    """Blocking: write the long feedback for `record` into it (unless someone else already did).
+
+    If the evaluator fails, the local scorer's feedback is returned instead and
+    the record is left alone, so the next request asks the provider again.
+    """
+    profile = session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
+    prompt = soul_engine.build_detail_prompt(record.question, record.answer, profile, score, record.verdict)
+    raw = _call_evaluator(session, prompt, DETAIL_MAX_TOKENS)
+    if raw is None:
+        return _local_eval(session, record.answer, record.question, record.analysis)
+    detail = soul_engine.parse_detail_json(raw)
+    with _session_lock(session_id):
+        if not record.feedback:
+            record.feedback = detail["detailed_feedback"]
+            record.correct_answer = detail["correct_answer_hint"]
+            record.improvement_tip = detail["improvement_tip"]
+    return None
+
+
+# ─── Fused turns (settings.fused_turns) ──────────────────────────────────────
+# The evaluator also writes the next question — a follow-up or a new one, picked
+# by the score it gave — so a turn costs one LLM round-trip instead of two. The
+# question is held in _turn_next and served by whichever endpoint asks next
+# (/interview/question, its stream, or /interview/followup).
+
+TURN_MAX_TOKENS = 800
+
+def _turn_prompt(session: dict, answer: str, question: str) -> str:
+    profile = session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
+    track = company_tracks.get_track(session.get("company_track")) if session.get("company_track") else None
+    return soul_engine.build_turn_prompt(
+        question, answer, profile,
+        question_number=len(session.get("questions_asked", [])) + 1,
+        company_track=track,
+        pressure_level=session.get("pressure_level", "none"),
+    )
+
+def _evaluate_turn(session: dict, answer: str, question: str,
+                   analysis: speech_analyzer.AnswerAnalysis | None = None) -> tuple[dict, tuple[str, str] | None]:
+    """Evaluation plus (next_kind, next_question) from one call; the question is None if the model left it out."""
+    raw = _call_evaluator(session, _turn_prompt(session, answer, question), TURN_MAX_TOKENS)
+    if raw is None:
+        return _local_eval(session, answer, question, analysis), None
+    return soul_engine.parse_turn_json(raw)
+
+def _stash_turn_next(session_id: str, session: dict, nxt: tuple[str, str] | None) -> bool:
+    """Hold a fused turn's next question for the next question request. Returns whether it was kept."""
+    with _session_lock(session_id):
+        if not nxt or session_id not in active_sessions or _is_repeat(session, nxt[1]):
+            return False
+        _turn_next[session_id] = nxt
+        _prefetch_cache.pop(session_id, None)
+    threading.Thread(target=_presynthesize, args=(session, nxt[1]), daemon=True).start()
+    return True
+
+def _take_turn_next(session_id: str, session: dict) -> tuple[str, str] | None:
+    """The held next question, committed as the current one. Consumed once."""
+    with _session_lock(session_id):
+        nxt = _turn_next.pop(session_id, None)
+        if nxt:
+            _commit_question(session, nxt[1])
+    return nxt
+
+
+def _prefetch_next(sid: str, sess: dict, prof: dict, prov: str, akey: str, mdl: str):
+    """Background thread: pre-generate the next question and cache it.
+
+    `prof` is a snapshot taken under the session lock; the live session is only
+    touched again under the lock, after the (slow) LLM call.
+    """
+    try:
+        with _session_lock(sid):
+            q_num = len(sess.get("questions_asked", [])) + 1
+            last_sc = sess.get("last_score_10")
+        prompt = soul_engine.build_question_prompt(profile=prof, question_number=q_num, last_score=last_sc)
+        msgs = [{"role": "user", "content": prompt}]
+        chunks = []
+        for ch in llm_client.stream_llm(prov, akey, mdl, msgs, max_tokens=400):
+            chunks.append(ch)
+        q_text = "".join(chunks).strip()
+        with _session_lock(sid):
+            if not (q_text and sid in active_sessions and not _is_repeat(sess, q_text)):
+                return
+            _prefetch_cache[sid] = q_text
+        _presynthesize(sess, q_text)
+    except Exception:
+        pass  # silent — fallback will generate live
+
+
+# ─── Batched question generation (settings.question_batch_size > 1) ──────────
+
+_batch_refills: set[str] = set()       # session_ids with a background refill in flight
+_batch_refills_guard = threading.Lock()
+
+def _batching_enabled() -> bool:
+    return settings.question_batch_size > 1
+
+def _live_profile(session: dict):
+    return session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
+
+def _refill_question_queue(sid: str, sess: dict, prov: str, akey: str, mdl: str) -> int:
+    """One LLM call for a batch of candidate questions; returns how many were queued.
+
+    Blocking — run it via offload.run_io or a background thread. The prompt is
+    built from a snapshot taken under the session lock; the batch is dropped if
+    the profile moved on while the call was in flight.
+    """
+    k = settings.question_batch_size
+    with _session_lock(sid):
+        profile = _live_profile(sess)
+        sig = question_queue.signature(profile)
+        track = company_tracks.get_track(sess.get("company_track")) if sess.get("company_track") else None
+        prompt = soul_engine.build_question_prompt(
+            profile=copy.deepcopy(profile),
+            question_number=len(sess.get("questions_asked", [])) + 1,
+            last_score=sess.get("last_score_10"),
+            user_memory=sess.get("user_memory"),
+            last_answer_word_count=sess.get("last_answer_word_count"),
+            company_track=track,
+            pressure_level=sess.get("pressure_level", "none"),
+            batch_size=k,
+            question_types=QUESTION_TYPES,
+        )
+    raw = llm_client.call_llm(prov, akey, mdl, [{"role": "user", "content": prompt}], max_tokens=120 * k + 100)
+    candidates = soul_engine.parse_question_batch_json(raw, QUESTION_TYPES)
+    with _session_lock(sid):
+        if sid not in active_sessions or question_queue.signature(_live_profile(sess)) != sig:
+            return 0
+        fresh = [c for c in candidates if not _is_repeat(sess, c[1])]
+        question_queue.fill(sess, fresh, sig)
+        return len(fresh)
+
+def _background_refill(sid: str, sess: dict, prov: str, akey: str, mdl: str):
+    try:
+        _refill_question_queue(sid, sess, prov, akey, mdl)
+    except Exception as e:
+        print(f"[batch] background refill failed ({prov}): {mask_secret(str(e))}")
+    finally:
+        with _batch_refills_guard:
+            _batch_refills.discard(sid)
+
+def _maybe_refill_in_background(sid: str, sess: dict, prov: str, akey: str, mdl: str):
+    """Start a background batch when the queue is low or no longer fits the profile."""
+    with _session_lock(sid):
+        if sess.get("question_queue_sig") != question_queue.signature(_live_profile(sess)):
+            question_queue.invalidate(sess)
+        if question_queue.pending(sess) > settings.question_batch_low_water:
+            return
+    with _batch_refills_guard:
+        if sid in _batch_refills:
+            return
+        _batch_refills.add(sid)
+    threading.Thread(target=_background_refill, args=(sid, sess, prov, akey, mdl), daemon=True).start()
+
+def _take_queued_locked(session: dict, qtype: str) -> tuple[str | None, str] | None:
+    sig = question_queue.signature(_live_profile(session))
+    return question_queue.take(session, qtype, sig, reject=lambda q: _is_repeat(session, q))
+
+async def _next_batched_question(sid: str, sess: dict, qtype: str, prov: str, akey: str, mdl: str) -> str | None:
+    """Commit and return the next question from the session's candidate queue.
+
+    An empty or stale queue is refilled with one batched call first. Returns
+    None when the batch call fails, so callers fall back to single-question
+    generation.
+    """
+    with _session_lock(sid):
+        picked = _take_queued_locked(sess, qtype)
+    if picked is None:
+        try:
+            await offload.run_io(_refill_question_queue, sid, sess, prov, akey, mdl)
+        except Exception as e:
+            print(f"[batch] question batch failed ({prov}): {mask_secret(str(e))}")
+            return None
+        with _session_lock(sid):
+            picked = _take_queued_locked(sess, qtype)
+    if picked is None:
+        return None
+    ptype, question = picked
+    with _session_lock(sid):
+        _commit_question(sess, question, ptype or qtype)
+    _maybe_refill_in_background(sid, sess, prov, akey, mdl)
+    return question
+
+
+# ─── Rapid-fire mode: batched background evaluation ──────────────────────────
+# Answers are accepted instantly with local speech_analyzer feedback and queued
+# on session.pending_answers. A background worker evaluates them
+# settings.rapid_fire_batch_size at a time — one LLM call per batch — and
+# merges the results into qa_pairs / soul_profile in the order they were given.
+
+INTERVIEW_MODES = ("standard", "rapid_fire")
+
+_rapid_fire_workers: dict[str, threading.Lock] = {}   # session_id → held while a batch is in flight
+_rapid_fire_workers_guard = threading.Lock()
+
+def _rapid_fire_worker(session_id: str) -> threading.Lock:
+    with _rapid_fire_workers_guard:
+        return _rapid_fire_workers.setdefault(session_id, threading.Lock())
+
+def _local_eval(session: dict, answer: str, question: str | None = None,
+                analysis: speech_analyzer.AnswerAnalysis | None = None) -> dict:
+    """Evaluation without the LLM (demo mode, open circuit, failed call): local_scorer's model."""
+    if question is None:
+        question = session.get("current_question", "")
+    track = company_tracks.get_track(session.get("company_track")) if session.get("company_track") else None
+    return local_scorer.evaluate(question, answer, analysis, topic=session.get("domain") or "General",
+                                 focus=tuple(track.get("focus", ())) if track else ())
+
+def _evaluate_rapid_batch(session: dict, batch: list[AnswerRecord], profile, track: dict | None) -> list[dict]:
+    """One evaluation per record, in order. Blocking; falls back per item on failure."""
+    if _is_offline_demo(session):
+        return [_local_eval(session, r.answer, r.question, r.analysis) for r in batch]
+    # Trivial answers are graded here; only the rest go into the batch prompt.
+    results: list[dict | None] = [None] * len(batch)
+    if settings.answer_prescreen:
+        topic = session.get("domain") or "General"
+        for i, r in enumerate(batch):
+            results[i] = prescreen.screen(r.question, r.answer, r.analysis, topic=topic)
+            if results[i] is not None:
+                metrics.incr(f"prescreen_{results[i]['prescreen']}")
+    todo = [i for i, res in enumerate(results) if res is None]
+    if not todo:
+        metrics.incr("llm_calls_avoided")
+        return results
+    for i, eval_data in zip(todo, _evaluate_rapid_items(session, [batch[i] for i in todo], profile, track)):
+        results[i] = eval_data
+    return results
+
+def _evaluate_rapid_items(session: dict, batch: list[AnswerRecord], profile, track: dict | None) -> list[dict]:
+    prompt = soul_engine.build_batch_evaluation_prompt([(r.question, r.answer) for r in batch], profile, company_track=track)
+    messages = [
+        {"role": "system", "content": "You are an expert interview evaluator. Respond with only a valid JSON array."},
+        {"role": "user", "content": prompt},
+    ]
+    provider = session.get("provider", "openai")
+    model = session.get("model") or llm_client.get_default_model(provider)
+    try:
+        raw = llm_client.call_llm(provider, session.get("api_key", ""), model, messages,
+                                  max_tokens=250 * len(batch) + 100, timeout=60)
+    except Exception as exc:
+        if not isinstance(exc, llm_client.CircuitOpen):
+            print(f"[rapid_fire] batch evaluation error ({provider}): {mask_secret(str(exc))}")
+        return [_local_eval(session, r.answer, r.question, r.analysis) for r in batch]
+    return soul_engine.parse_batch_evaluation_json(raw, len(batch))
+
+def _rapid_fire_ready(sid: str, sess: InterviewSession) -> bool:
+    with _session_lock(sid):
+        return len(sess.pending_answers) >= max(1, settings.rapid_fire_batch_size)
+
+def _drain_rapid_fire(sid: str, sess: InterviewSession, flush: bool = False):
+    """Evaluate queued rapid-fire answers batch by batch, merging results in order.
+
+    Normally only full batches are sent, and the call returns at once if another
+    worker already owns the session. With `flush` (end of the round) it waits
+    for that worker, then evaluates whatever is left, partial batch included.
+    """
+    size = max(1, settings.rapid_fire_batch_size)
+    worker = _rapid_fire_worker(sid)
+    while worker.acquire(blocking=flush):
+        try:
+            while True:
+                with _session_lock(sid):
+                    pending = sess.pending_answers
+                    if not pending or (len(pending) < size and not flush):
+                        break
+                    batch = pending[:size]
+                    profile = copy.deepcopy(_live_profile(sess))
+                    track = company_tracks.get_track(sess.company_track) if sess.company_track else None
+                results = _evaluate_rapid_batch(sess, batch, profile, track)
+                with _session_lock(sid):
+                    for record, eval_data in zip(batch, results):
+                        try:
+                            score = max(1, min(10, int(eval_data.get("score", 5))))
+                        except (TypeError, ValueError):
+                            score = 5
+                        _persist_answer(sess, record.answer, score, eval_data, record.analysis, question=record.question)
+                    del sess.pending_answers[:len(batch)]
+                    blob = snapshot.dumps(sess) if settings.snapshot_dir and sid in active_sessions else None
+                if blob is not None:
+                    try:
+                        snapshot.write(sid, blob)
+                    except OSError as e:
+                        print(f"[snapshot] could not write {sid}: {e}")
+        finally:
+            worker.release()
+        # A batch that filled up while we were finishing found the worker busy.
+        if flush or not _rapid_fire_ready(sid, sess):
+            return
+
+def _background_drain(sid: str, sess: InterviewSession):
+    try:
+        _drain_rapid_fire(sid, sess)
+    except Exception as e:
+        print(f"[rapid_fire] background evaluation failed: {mask_secret(str(e))}")
+
+async def _accept_rapid_fire_answer(session_id: str, session: InterviewSession, answer: str, question: str) -> dict:
+    user_answer = (answer or "").strip()
+    analysis = await _analyze_answer(session_id, session, user_answer)
+    with _session_lock(session_id):
+        session.pending_answers.append(AnswerRecord(question=question, answer=user_answer, analysis=analysis))
+        pending = len(session.pending_answers)
+    await _checkpoint(session_id, session)
+    if pending >= max(1, settings.rapid_fire_batch_size):
+        threading.Thread(target=_background_drain, args=(session_id, session), daemon=True).start()
+    return {
+        'score': None,
+        'verdict': 'Pending',
+        'short_verdict': 'Answer recorded — scored at the end of the round.',
+        'feedback': " ".join(analysis.tips),
+        'correct_answer': '',
+        'improvement_tip': analysis.tips[0] if analysis.tips else '',
+        'topic_tag': session.get('domain') or 'General',
+        'analysis': speech_analyzer.to_dict(analysis),
+        'pending': True,
+        'pending_evaluations': pending,
+    }
 
 
 # Local fallback question generator to ensure resilience when upstream APIs fail
@@ -648,7 +861,7 @@ def _generate_local_question(session: dict, session_id: str) -> str:
     return samples[idx]
 
 @router.post("/interview/start")
-def start_interview(provider: str = Form(...), api_key: str = Form(...), domain: str = Form(...), model: str | None = Form(None), difficulty: str = Form("basic"), topics: str | None = Form(None), company_track: str | None = Form(None), interview_type: str | None = Form(None), user_memory: str | None = Form(None), pressure_level: str = Form("none")):
+async def start_interview(provider: str = Form(...), api_key: str = Form(...), domain: str = Form(...), model: str | None = Form(None), difficulty: str = Form("basic"), topics: str | None = Form(None), company_track: str | None = Form(None), interview_type: str | None = Form(None), user_memory: str | None = Form(None), pressure_level: str = Form("none"), mode: str = Form("standard")):
     if not api_key:
         raise HTTPException(status_code=400, detail="API key cannot be empty")
     if provider not in API_CONFIGS:
@@ -694,28 +907,21 @@ def start_interview(provider: str = Form(...), api_key: str = Form(...), domain:
         except Exception:
             pass
 
-    active_sessions[session_id] = {
-        "provider": provider,
-        "api_key": api_key,
-        "domain": domain,
-        "model": chosen_model,
-        "difficulty": diff_val,
-        "topics": topic_list,
-        "company_track": track_id,
-        "interview_type": (interview_type or "general").strip().lower(),
-        "questions_asked": [],
-        "answers_given": [],
-        "feedback_received": [],
-        "qa_pairs": [],
-        "weak_areas": {},
-        "scores_10": [],
-        "last_score_10": None,
-        "soul_profile": profile,
-        "analysis_history": [],
-        "user_memory": parsed_memory,
-        "pressure_level": pressure_level if pressure_level in ("none", "moderate", "high") else "none",
-        "last_answer_word_count": None,
-    }
+    active_sessions[session_id] = InterviewSession(
+        provider=provider,
+        api_key=api_key,
+        domain=domain,
+        model=chosen_model,
+        soul_profile=profile,
+        difficulty=diff_val,
+        topics=topic_list,
+        company_track=track_id,
+        interview_type=(interview_type or "general").strip().lower(),
+        user_memory=parsed_memory,
+        pressure_level=pressure_level if pressure_level in ("none", "moderate", "high") else "none",
+        mode=mode if mode in INTERVIEW_MODES else "standard",
+        domain_class=domain_classifier.classify(domain),
+    )
     return {
         "message": "Interview session started",
         "session_id": session_id,
@@ -726,14 +932,18 @@ def start_interview(provider: str = Form(...), api_key: str = Form(...), domain:
         "topics": topic_list,
         "company_track": track_id,
         "interview_type": active_sessions[session_id]["interview_type"],
+        "mode": active_sessions[session_id].mode,
         "track_info": {"name": track_data["name"], "style": track_data["style"], "tips": track_data["tips"]} if track_data else None,
     }
 
 @router.post("/interview/question")
-def get_interview_question(session_id: str = Form(...)):
+async def get_interview_question(session_id: str = Form(...)):
     session = active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
+    nxt = _take_turn_next(session_id, session)
+    if nxt:
+        return {"question": nxt[1], "source": "turn", "kind": nxt[0]}
     # Compute effective difficulty and tag for prompting
     base_diff = session.get('difficulty', 'basic')
     last = session.get('last_score_10')
@@ -748,35 +958,46 @@ def get_interview_question(session_id: str = Form(...)):
     # Company track: try fetching a track-specific question first
     track_id = session.get("company_track")
     if track_id:
-        eff_for_track = session.get("soul_profile", {}).get("current_difficulty", "medium")
-        asked_set = set(session.get("questions_asked", []))
-        track_q = company_tracks.get_track_question(track_id, eff_for_track, asked_set)
-        if track_q and not _is_repeat(session, track_q):
-            _note_session_question(session, track_q)
-            session.setdefault("questions_asked", []).append(track_q)
-            session["current_question"] = track_q
-            session.setdefault("type_counts", {})
-            session["type_counts"]["track"] = session["type_counts"].get("track", 0) + 1
-            return {"question": track_q, "source": "company_track"}
+        with _session_lock(session_id):
+            eff_for_track = session.get("soul_profile", {}).get("current_difficulty", "medium")
+            bucket = question_bank.track_bucket(track_id, eff_for_track)
+            qid = question_bank.draw(session, bucket, accept=lambda q: not _is_repeat_id(session, q)) if bucket else None
+            track_q = question_bank.text(qid) if qid is not None else None
+            if track_q:
+                _commit_question(session, track_q)
+                session.setdefault("type_counts", {})
+                session["type_counts"]["track"] = session["type_counts"].get("track", 0) + 1
+                return {"question": track_q, "source": "company_track"}
 
     # Offline/demo mode: return a locally generated question without calling external APIs
     if _is_offline_demo(session):
-        q = _generate_local_question_with_difficulty(session, session_id)
-        session.setdefault('questions_asked', []).append(q)
-        session['current_question'] = q
+        with _session_lock(session_id):
+            q = _generate_local_question_locked(session)
+            session.setdefault('questions_asked', []).append(q)
+            session['current_question'] = q
         return {"question": q}
 
     provider = session['provider']
     config = API_CONFIGS.get(provider)
     # If config is missing, gracefully fallback instead of erroring
     if not config:
-        question = _generate_local_question_with_difficulty(session, session_id)
-        session.setdefault('questions_asked', []).append(question)
-        session['current_question'] = question
+        with _session_lock(session_id):
+            question = _generate_local_question_locked(session)
+            session.setdefault('questions_asked', []).append(question)
+            session['current_question'] = question
         return {"question": question}
 
     model = session.get('model') or get_default_model(provider)
 
+    local_q = _local_basic_question(session_id, session)
+    if local_q:
+        return {"question": local_q, "source": "local"}
+
+    if _batching_enabled():
+        queued = await _next_batched_question(session_id, session, qtype, provider, session['api_key'], model)
+        if queued:
+            return {"question": queued, "source": "batch"}
+
     # Build soul-engine-enhanced prompt
     soul_prompt = soul_engine.build_question_prompt(
         profile=session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General")),
@@ -794,7 +1015,7 @@ def get_interview_question(session_id: str = Form(...)):
                 "model": model,
                 "messages": [{"role": "user", "content": soul_prompt}]
             }
-            res = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            res = await offload.run_io(requests.post, api_url, headers=headers, json=payload, timeout=30)
             try:
                 response_data = res.json()
             except Exception:
@@ -822,7 +1043,7 @@ def get_interview_question(session_id: str = Form(...)):
                     {"role": "user", "content": soul_prompt}
                 ]
             }
-            res = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            res = await offload.run_io(requests.post, api_url, headers=headers, json=payload, timeout=30)
             try:
                 response_data = res.json()
             except Exception:
@@ -844,7 +1065,7 @@ def get_interview_question(session_id: str = Form(...)):
                     {"parts": [{"text": soul_prompt}]}
                 ]
             }
-            res = requests.post(api_url, headers=headers, params={"key": session['api_key']}, json=payload, timeout=30)
+            res = await offload.run_io(requests.post, api_url, headers=headers, params={"key": session['api_key']}, json=payload, timeout=30)
             try:
                 response_data = res.json()
             except Exception:
@@ -871,90 +1092,58 @@ def get_interview_question(session_id: str = Form(...)):
         print(f"Upstream request failed (question): {str(e)}")
         question = _generate_local_question(session, session_id)
 
-    # Final guard to always produce a question
-    if not question:
-        question = _generate_local_question_with_difficulty(session, session_id)
-
-    session.setdefault('questions_asked', []).append(question)
-    session['current_question'] = question
-    # Update type counts and global seen for provider-generated question
-    session.setdefault('type_counts', {})
-    session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
-    session.setdefault('last_types', []).append(qtype)
-    _note_session_question(session, question)
+    with _session_lock(session_id):
+        # Final guard to always produce a question
+        if not question:
+            question = _generate_local_question_locked(session)
+        # Update type counts and global seen for provider-generated question
+        _commit_question(session, question, qtype)
     return {"question": question}
 
 
 @router.post("/interview/answer")
-def submit_interview_answer(session_id: str = Form(...), answer: str = Form(...)):
+async def submit_interview_answer(session_id: str = Form(...), answer: str = Form(...)):
     session = active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Offline/demo mode: naive local evaluation without external API calls
+    # Answers are graded against the question that was current when they arrived.
+    with _session_lock(session_id):
+        asked_question = session.get('current_question', '')
+
+    # Rapid-fire: accept now, evaluate in background batches
+    if session.get('mode') == "rapid_fire":
+        return await _accept_rapid_fire_answer(session_id, session, answer, asked_question)
+
+    # Offline/demo mode: local evaluation (local_scorer) without external API calls
     if _is_offline_demo(session):
         user_answer = (answer or "").strip()
-        question = session.get('current_question') or 'the previous question'
-        # Naive local scoring on 1–10 scale
-        length = len(user_answer.split())
-        is_invalid = length < 3
-        if is_invalid:
-            score = 1
-            verdict = "Incorrect"
-        else:
-            score = min(10, 5 + max(0, length - 8) // 2)
-            verdict = "Correct" if score >= 8 else ("Partially Correct" if score >= 5 else "Incorrect")
-        feedback_lines = []
-        if is_invalid:
-            feedback_lines.append("Your answer seems too short or incomplete. Please provide more detail and address the question directly.")
-        feedback_lines += [
-            "Good structure and clarity." if score >= 8 else "Decent attempt—add more detail and examples.",
-            "Consider emphasizing trade-offs." if score >= 5 else "Address key concepts explicitly.",
-            "Provide real-world examples to strengthen your answer."
-        ]
-        feedback = " ".join(feedback_lines)
-        domain = (session.get('domain') or 'your field')
-        correct_answer = (
-            f"A strong answer to the question \"{question}\" would typically cover: a clear definition, key concepts, trade-offs, "
-            f"a concise real-world example, and best practices related to {domain}."
-        )
+        question = asked_question or 'the previous question'
         # Speech analysis runs in all modes
-        interview_type_local = session.get("interview_type", "general")
-        analysis_local = speech_analyzer.analyze(user_answer, question_type=interview_type_local)
+        analysis_local = await _analyze_answer(session_id, session, user_answer)
         analysis_dict_local = speech_analyzer.to_dict(analysis_local)
+        eval_data = _local_eval(session, user_answer, question, analysis_local)
+        score = eval_data["score"]
+        verdict = "Correct" if score >= 8 else ("Partially Correct" if score >= 5 else "Incorrect")
+        feedback = eval_data["detailed_feedback"]
+        correct_answer = eval_data["correct_answer_hint"]
+        improvement_tip_demo = eval_data["improvement_tip"]
+        short_verdict_demo = eval_data["short_verdict"]
+        topic_tag_demo = eval_data["topic_tag"]
+
+        with _session_lock(session_id):
+            _persist_answer(session, user_answer, score, eval_data, analysis_local, question=question)
+
+            weak_map = session.setdefault('weak_areas', {})
+            topic = (session.get('domain') or 'General').strip() or 'General'
+            if score < 8:
+                weak_map.setdefault(topic, [])
+                weak_map[topic].append({
+                    'question': question,
+                    'improvement_tips': improvement_tip_demo,
+                })
+        await _checkpoint(session_id, session)
 
-        session.setdefault('qa_pairs', []).append({
-            'question': question,
-            'user_answer': user_answer,
-            'score': score,
-            'verdict': verdict,
-            'feedback': feedback,
-            'correct_answer': correct_answer,
-            'analysis': analysis_dict_local,
-        })
-        session.setdefault('answers_given', []).append(user_answer)
-        session.setdefault('feedback_received', []).append(feedback)
-        session.setdefault('scores_10', []).append(score)
-        session.setdefault('analysis_history', []).append(analysis_dict_local)
-        session['last_score_10'] = score
-
-        # Update soul profile in offline mode too
-        if "soul_profile" in session:
-            session["soul_profile"] = soul_engine.update_profile(
-                session["soul_profile"], score, topic=session.get("domain")
-            )
-
-        weak_map = session.setdefault('weak_areas', {})
-        topic = (session.get('domain') or 'General').strip() or 'General'
-        if score < 8:
-            weak_map.setdefault(topic, [])
-            weak_map[topic].append({
-                'question': question,
-                'improvement_tips': 'Study core concepts; practice with real examples; focus on clarity and completeness.'
-            })
-        improvement_tip_demo = 'Study core concepts; practice with real examples; focus on clarity and completeness.'
-        short_verdict_demo = 'Correct' if score >= 8 else ('Partially correct — needs more depth.' if score >= 5 else 'Answer too short or off-topic.')
-        topic_tag_demo = session.get('domain') or 'General'
         return {
             'score': score,
             'verdict': verdict,
@@ -971,11 +1160,18 @@ def submit_interview_answer(session_id: str = Form(...), answer: str = Form(...)
     if not config:
         raise HTTPException(status_code=500, detail="API configuration not found for this provider")
 
+    # ── Speech / text analysis ────────────────────────────────────────────────
+    analysis = await _analyze_answer(session_id, session, answer)
+    analysis_dict = speech_analyzer.to_dict(analysis)
+
     # ── Use soul_engine evaluation for rich, structured feedback ──────────────
-    try:
-        eval_data = _evaluate_with_soul(session, answer)
-    except Exception as e:
-        raise HTTPException(status_code=502, detail=f"Evaluation failed: {str(e)}")
+    nxt = None
+    eval_data = _prescreen(session, asked_question, answer, analysis)
+    if eval_data is None:
+        try:
+            eval_data, nxt = await offload.run_io(_evaluate_answer, session, answer, asked_question, analysis)
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Evaluation failed: {str(e)}")
 
     score = max(1, min(10, int(eval_data.get("score", 5))))
     verdict = "Correct" if eval_data.get("is_correct") else (
@@ -987,14 +1183,12 @@ def submit_interview_answer(session_id: str = Form(...), answer: str = Form(...)
     short_verdict = eval_data.get("short_verdict") or verdict
     topic_tag = eval_data.get("topic_tag") or session.get("domain") or "General"
 
-    # ── Speech / text analysis ────────────────────────────────────────────────
-    interview_type = session.get("interview_type", "general")
-    analysis = speech_analyzer.analyze(answer, question_type=interview_type)
-    analysis_dict = speech_analyzer.to_dict(analysis)
-
-    _persist_answer(session, answer, score, eval_data, analysis_dict)
+    with _session_lock(session_id):
+        _persist_answer(session, answer, score, eval_data, analysis, question=asked_question)
+        answer_id = session.answers[-1].id
+    await _checkpoint(session_id, session)
 
-    return {
+    result = {
         'score': score,
         'verdict': verdict,
         'short_verdict': short_verdict,
@@ -1003,76 +1197,70 @@ def submit_interview_answer(session_id: str = Form(...), answer: str = Form(...)
         'improvement_tip': improvement_tip,
         'topic_tag': topic_tag,
         'analysis': analysis_dict,
+        'answer_id': answer_id,
     }
+    if not eval_data.get("detailed_feedback"):
+        result['detail_pending'] = True   # fetch it from /interview/answer/detail
+    if eval_data.get("prescreen"):
+        result['prescreen'] = eval_data["prescreen"]
+    if _stash_turn_next(session_id, session, nxt):
+        result['next_kind'], result['next_question'] = nxt
+    return result
 
 
-@router.get("/interview/answer/stream")
-def stream_answer_feedback(session_id: str, answer: str):
-    """Stream answer evaluation feedback via SSE. Stores result in session on completion."""
+@router.post("/interview/answer/detail")
+async def get_answer_detail(session_id: str = Form(...), answer_id: int = Form(-1)):
+    """Long feedback and model answer for one answer (default: the latest), generated on first request.
+
+    `answer_id` is the id /interview/answer returned; it is 404 once the answer
+    has dropped out of the session's history.
+    """
     session = active_sessions.get(session_id)
     if not session:
-        def _err():
-            yield "data: [ERROR]Session not found\n\n"
-        return StreamingResponse(_err(), media_type="text/event-stream",
-                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
-
-    question = session.get("current_question", "")
-    profile = session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
-    eval_prompt = soul_engine.build_evaluation_prompt(question, answer, profile)
-    messages = [
-        {"role": "system", "content": "You are an expert interview evaluator. Always respond with a single valid JSON object. No markdown, no extra text."},
-        {"role": "user", "content": eval_prompt},
-    ]
-    provider = session.get("provider", "openai")
-    model = session.get("model") or llm_client.get_default_model(provider)
-    api_key = session.get("api_key", "")
-
-    accumulated = []
-
-    def _gen():
-        try:
-            for chunk in llm_client.stream_llm(provider, api_key, model, messages, max_tokens=600):
-                accumulated.append(chunk)
-                yield f"data: {json.dumps(chunk)}\n\n"
-            full = "".join(accumulated)
-            eval_data = soul_engine.parse_evaluation_json(full)
-            score = max(1, min(10, int(eval_data.get("score", 5))))
-            interview_type = session.get("interview_type", "general")
-            analysis = speech_analyzer.analyze(answer, question_type=interview_type)
-            analysis_dict = speech_analyzer.to_dict(analysis)
-            _persist_answer(session, answer, score, eval_data, analysis_dict)
-            result_meta = {
-                "score": score,
-                "short_verdict": eval_data.get("short_verdict", ""),
-                "improvement_tip": eval_data.get("improvement_tip", ""),
-                "topic_tag": eval_data.get("topic_tag", session.get("domain", "General")),
-                "analysis": analysis_dict,
-            }
-            yield f"data: [META]{json.dumps(result_meta)}\n\n"
-            yield "data: [DONE]\n\n"
-        except Exception as exc:
-            print(f"Stream answer error: {exc}")
-            yield f"data: [ERROR]{str(exc)[:200]}\n\n"
-
-    return StreamingResponse(_gen(), media_type="text/event-stream",
-                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+        raise HTTPException(status_code=404, detail="Session not found")
+    with _session_lock(session_id):
+        pos = session.answer_position(answer_id)
+        if pos is None:
+            raise HTTPException(status_code=404, detail="Answer not found")
+        record, score = session.answers[pos], session.scores[pos]
+        if record.feedback:
+            return _detail_response(record, cached=True)
+
+    # Concurrent requests for the same answer share one generation.
+    task = _detail_tasks.get(id(record))
+    if task is None:
+        task = asyncio.ensure_future(offload.run_io(_generate_detail, session_id, session, record, score))
+        _detail_tasks[id(record)] = task
+        task.add_done_callback(lambda _, key=id(record): _detail_tasks.pop(key, None))
+    fallback = await asyncio.shield(task)
+    if fallback is not None:
+        return {"answer_id": record.id, "feedback": fallback["detailed_feedback"],
+                "correct_answer": fallback["correct_answer_hint"], "improvement_tip": fallback["improvement_tip"],
+                "cached": False, "fallback": True}
+    await _checkpoint(session_id, session)
+    with _session_lock(session_id):
+        return _detail_response(record, cached=False)
 
 
 @router.post("/interview/followup")
-def generate_followup(session_id: str = Form(...)):
+async def generate_followup(session_id: str = Form(...)):
     session = active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
+    nxt = _take_turn_next(session_id, session)
+    if nxt:
+        return {"question": nxt[1], "kind": nxt[0]}
+
+    with _session_lock(session_id):
+        prev_q = session.get('current_question') or ''
+        last_pair = session.get('qa_pairs', [])[-1] if session.get('qa_pairs') else None
+        prev_a = (last_pair or {}).get('user_answer') or (session.get('answers_given', [])[-1] if session.get('answers_given') else '')
+        base_diff = session.get('difficulty', 'basic')
+        last = session.get('last_score_10')
+        last_types = list(session.get('last_types', []))
 
-    prev_q = session.get('current_question') or ''
-    last_pair = session.get('qa_pairs', [])[-1] if session.get('qa_pairs') else None
-    prev_a = (last_pair or {}).get('user_answer') or (session.get('answers_given', [])[-1] if session.get('answers_given') else '')
-
-    base_diff = session.get('difficulty', 'basic')
-    last = session.get('last_score_10')
     eff = _compute_effective_difficulty(base_diff, last)
     # Prefer a different type than the last asked for diversity
-    last_types = session.get('last_types', [])
     preferred_type = None
     for t in QUESTION_TYPES:
         if not last_types or t != last_types[-1]:
@@ -1084,22 +1272,19 @@ def generate_followup(session_id: str = Form(...)):
     if _is_offline_demo(session):
         domain = session.get('domain') or 'your field'
         follow = f"Follow-up ({eff}, {qtype}) on {domain}: Can you elaborate more on your previous answer about '{prev_q}'?"
-        if _is_repeat(session, follow):
-            follow = _generate_local_question_with_difficulty(session, session_id)
-        session.setdefault('questions_asked', []).append(follow)
-        session['current_question'] = follow
-        session.setdefault('type_counts', {})
-        session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
-        session.setdefault('last_types', []).append(qtype)
-        _note_session_question(session, follow)
+        with _session_lock(session_id):
+            if _is_repeat(session, follow):
+                follow = _generate_local_question_locked(session)
+            _commit_question(session, follow, qtype)
         return {"question": follow}
 
     provider = session['provider']
     config = API_CONFIGS.get(provider)
     if not config:
-        q = _generate_local_question_with_difficulty(session, session_id)
-        session.setdefault('questions_asked', []).append(q)
-        session['current_question'] = q
+        with _session_lock(session_id):
+            q = _generate_local_question_locked(session)
+            session.setdefault('questions_asked', []).append(q)
+            session['current_question'] = q
         return {"question": q}
 
     model = session.get('model') or get_default_model(provider)
@@ -1120,7 +1305,7 @@ def generate_followup(session_id: str = Form(...)):
                 f"Return ONLY the question text."
             )
             payload = {"model": model, "messages": [{"role": "user", "content": prompt}]}
-            res = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            res = await offload.run_io(requests.post, api_url, headers=headers, json=payload, timeout=30)
             try:
                 response_data = res.json()
             except Exception:
@@ -1143,7 +1328,7 @@ def generate_followup(session_id: str = Form(...)):
                 f"Return ONLY the question text."
             )
             payload = {"model": model, "max_tokens": 200, "messages": [{"role": "user", "content": prompt}]}
-            res = requests.post(api_url, headers=headers, json=payload, timeout=30)
+            res = await offload.run_io(requests.post, api_url, headers=headers, json=payload, timeout=30)
             try:
                 response_data = res.json()
             except Exception:
@@ -1167,7 +1352,7 @@ def generate_followup(session_id: str = Form(...)):
                 f"Return ONLY the question text."
             )
             payload = {"contents": [{"parts": [{"text": prompt}]}]}
-            res = requests.post(api_url, headers=headers, params={"key": session['api_key']}, json=payload, timeout=30)
+            res = await offload.run_io(requests.post, api_url, headers=headers, params={"key": session['api_key']}, json=payload, timeout=30)
             try:
                 response_data = res.json()
             except Exception:
@@ -1192,26 +1377,34 @@ def generate_followup(session_id: str = Form(...)):
         print(f"Upstream request failed (followup): {str(e)}")
         question = _generate_local_question_with_difficulty(session, session_id)
 
-    if not question:
-        question = _generate_local_question_with_difficulty(session, session_id)
-
-    session.setdefault('questions_asked', []).append(question)
-    session['current_question'] = question
-    session.setdefault('type_counts', {})
-    session['type_counts'][qtype] = int(session['type_counts'].get(qtype, 0)) + 1
-    session.setdefault('last_types', []).append(qtype)
-    _note_session_question(session, question)
+    with _session_lock(session_id):
+        if not question:
+            question = _generate_local_question_locked(session)
+        _commit_question(session, question, qtype)
     return {"question": question}
 
 
 @router.post("/interview/end")
-def end_interview(session_id: str = Form(...)):
+async def end_interview(session_id: str = Form(...)):
     session = active_sessions.pop(session_id, None)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found or already ended")
-
-    qa_pairs = session.get('qa_pairs', [])
-    analysis_history = session.get('analysis_history', [])
+    _prefetch_cache.pop(session_id, None)
+    _turn_next.pop(session_id, None)
+    log = _stream_logs.pop(session_id, None)
+    if log is not None and log.task is not None and not log.done:
+        log.task.cancel()   # closes the upstream request; nothing more is written to the session
+    if session.get('mode') == "rapid_fire":
+        await offload.run_io(_drain_rapid_fire, session_id, session, True)
+        with _rapid_fire_workers_guard:
+            _rapid_fire_workers.pop(session_id, None)
+
+    # Let any in-flight mutation finish before summarising.
+    with _session_lock(session_id):
+        qa_pairs = list(session.get('qa_pairs', []))
+        analysis_history = list(session.get('analysis_history', []))
+    _drop_session_lock(session_id)
+    await offload.run_io(snapshot.delete, session_id)
 
     if not qa_pairs:
         return {"summary": {
@@ -1261,6 +1454,16 @@ def _most_common_fillers(analysis_list: list[dict]) -> list[str]:
     counts = Counter(all_fillers)
     return [w for w, _ in counts.most_common(5)]
 
+def _analyse_document(filename: str, raw: bytes) -> tuple[str, str, list[str]]:
+    """Parse + summarise an upload. CPU-bound — always run via offload.run_cpu."""
+    extracted = document_engine.extract_text(filename, raw)
+    if not extracted or len(extracted) < 50:
+        return extracted, "", []
+    summary = document_engine.summarize_document(extracted, max_chars=4000)
+    topics = document_engine.extract_key_topics(extracted)
+    return extracted, summary, topics
+
+
 @router.post("/interview/upload_document")
 async def upload_document(file: UploadFile = File(...), session_id: str = Form(...)):
     """
@@ -1281,21 +1484,19 @@ async def upload_document(file: UploadFile = File(...), session_id: str = Form(.
     if len(raw) > 5 * 1024 * 1024:
         raise HTTPException(status_code=413, detail="File too large. Maximum size is 5 MB.")
 
-    extracted = document_engine.extract_text(filename, raw)
+    extracted, summary, topics = await offload.run_cpu(_analyse_document, filename, raw)
     if not extracted or len(extracted) < 50:
         raise HTTPException(status_code=422, detail="Could not extract readable text from the file.")
 
-    summary = document_engine.summarize_document(extracted, max_chars=4000)
-    topics = document_engine.extract_key_topics(extracted)
-
     # Store in soul profile so question prompts use it
-    if "soul_profile" not in session:
-        session["soul_profile"] = soul_engine.default_profile(session.get("domain", "General"))
-    session["soul_profile"]["document_context"] = summary
-    if topics:
-        existing = session["soul_profile"].get("topics", [])
-        merged = list(dict.fromkeys(existing + topics))
-        session["soul_profile"]["topics"] = merged[:15]
+    with _session_lock(session_id):
+        if "soul_profile" not in session:
+            session["soul_profile"] = soul_engine.default_profile(session.get("domain", "General"))
+        session["soul_profile"]["document_context"] = summary
+        if topics:
+            existing = session["soul_profile"].get("topics", [])
+            merged = list(dict.fromkeys(existing + topics))
+            session["soul_profile"]["topics"] = merged[:15]
 
     return {
         "message": "Document uploaded and analysed. Questions will now draw from its content.",
@@ -1306,7 +1507,7 @@ async def upload_document(file: UploadFile = File(...), session_id: str = Form(.
 
 
 @router.post("/interview/growth_plan")
-def get_growth_plan(session_id: str = Form(...)):
+async def get_growth_plan(session_id: str = Form(...)):
     """
     Generate a personalized 7-day growth plan for the candidate based on
     their soul profile and interview history. Does NOT end the session.
@@ -1353,19 +1554,19 @@ def get_growth_plan(session_id: str = Form(...)):
                 {"role": "system", "content": "You are a career coach. Always respond with a single valid JSON object only. No markdown, no explanation before or after the JSON."},
                 {"role": "user", "content": plan_prompt}
             ]}
-            res = requests.post(api_url, headers=headers, json=payload, timeout=60)
+            res = await offload.run_io(requests.post, api_url, headers=headers, json=payload, timeout=60)
             raw = res.json().get("choices", [{}])[0].get("message", {}).get("content", "") if res.ok else ""
         elif provider == "anthropic":
             api_url = config["base_url"] + "/messages"
             headers = {"x-api-key": session["api_key"], "anthropic-version": "2023-06-01", "Content-Type": "application/json"}
             payload = {"model": model, "max_tokens": 2048, "messages": [{"role": "user", "content": plan_prompt}]}
-            res = requests.post(api_url, headers=headers, json=payload, timeout=60)
+            res = await offload.run_io(requests.post, api_url, headers=headers, json=payload, timeout=60)
             parts = res.json().get("content", []) if res.ok else []
             raw = "".join([p.get("text", "") for p in parts if isinstance(p, dict)])
         elif provider == "google":
             api_url = config["base_url"] + f"/models/{model}:generateContent"
             payload = {"contents": [{"parts": [{"text": plan_prompt}]}]}
-            res = requests.post(api_url, headers={}, params={"key": session["api_key"]}, json=payload, timeout=60)
+            res = await offload.run_io(requests.post, api_url, headers={}, params={"key": session["api_key"]}, json=payload, timeout=60)
             try:
                 candidates = res.json().get("candidates", [])
                 raw = candidates[0].get("content", {}).get("parts", [{}])[0].get("text", "") if candidates else ""
@@ -1380,13 +1581,13 @@ def get_growth_plan(session_id: str = Form(...)):
 
 
 @router.get("/tracks")
-def list_tracks():
+async def list_tracks():
     """Return all available company/topic interview tracks."""
     return {"tracks": company_tracks.get_all_tracks()}
 
 
 @router.get("/tracks/{track_id}")
-def get_track(track_id: str):
+async def get_track(track_id: str):
     """Return details for a specific track."""
     track = company_tracks.get_track(track_id)
     if not track:
@@ -1394,10 +1595,49 @@ def get_track(track_id: str):
     return {"track": track}
 
 
+# ─── Speech-to-text ───────────────────────────────────────────────────────────
+
+# provider → (transcription URL, model, label reported to the client)
+_STT_ENDPOINTS = {
+    "openai": ("https://api.openai.com/v1/audio/transcriptions", "whisper-1", "whisper"),
+    "grok": ("https://api.groq.com/openai/v1/audio/transcriptions", "whisper-large-v3", "groq-whisper"),
+}
+
+def _stt_request(provider: str, api_key: str, filename: str, data: bytes, content_type: str) -> str:
+    """One blocking transcription call; raises on HTTP errors."""
+    url, model, _ = _STT_ENDPOINTS[provider]
+    resp = requests.post(
+        url,
+        headers={"Authorization": f"Bearer {api_key}"},
+        files={"file": (filename, data, content_type)},
+        data={"model": model},
+        timeout=30,
+    )
+    if not resp.ok:
+        raise RuntimeError(f"STT HTTP {resp.status_code}: {resp.text[:200]}")
+    return resp.json().get("text", "").strip()
+
+def _should_segment(report: audio_prep.AudioReport) -> bool:
+    seg = settings.stt_segment_seconds
+    return seg > 0 and (report.output_seconds is None or report.output_seconds > seg * 1.5)
+
+def _encode_segments(samples) -> list[tuple[bytes, str, str]] | None:
+    """Split decoded samples at silences and encode each piece; None if it stays whole."""
+    pieces = segmented_stt.split_at_silence(samples, audio_prep.TARGET_RATE, settings.stt_segment_seconds)
+    if len(pieces) < 2:
+        return None
+    return [audio_prep.encode(piece) for piece in pieces]
+
 @router.post("/interview/transcribe")
 async def transcribe_audio(file: UploadFile = File(...), session_id: str = Form(...)):
-    """Real STT via OpenAI Whisper (or Groq Whisper). Falls back gracefully."""
-    import io as _io
+    """Real STT via OpenAI Whisper (or Groq Whisper). Falls back gracefully.
+
+    The recording is normalized first (mono, 16 kHz, silence trimmed, compact
+    encoding — see audio_prep); the response's "audio" field reports the savings.
+    Long answers are split at silences and transcribed in parallel (segmented_stt).
+    Delivery features (prosody) are kept on the session for the answer this
+    transcript is submitted as.
+    """
     session = active_sessions.get(session_id)
     data = await file.read()
     if not data:
@@ -1405,85 +1645,291 @@ async def transcribe_audio(file: UploadFile = File(...), session_id: str = Form(
 
     api_key = (session or {}).get("api_key", "")
     provider = (session or {}).get("provider", "openai")
-    filename = file.filename or "audio.webm"
-
-    # ── OpenAI Whisper ────────────────────────────────────────────────────────
-    if provider == "openai" and api_key and not api_key.lower().startswith("demo"):
+    audio = await offload.run_cpu(audio_prep.prepare, data, file.filename or "audio.webm", file.content_type)
+    report = audio.report.to_dict()
+    if audio.report.output_seconds == 0:
+        return {"text": "", "silent": True, "audio": report}   # nothing but silence — skip the upload
+
+    endpoint = _STT_ENDPOINTS.get(provider)
+    if endpoint and api_key and not api_key.lower().startswith("demo"):
+        label = endpoint[2]
+        samples = await offload.run_cpu(audio_prep.decode_pcm, audio.data)
+        prosody_task = asyncio.ensure_future(offload.run_cpu(prosody.extract, samples)) if samples is not None else None
+        segments = None
+        if samples is not None and _should_segment(audio.report):
+            segments = await offload.run_cpu(_encode_segments, samples)
         try:
-            resp = requests.post(
-                "https://api.openai.com/v1/audio/transcriptions",
-                headers={"Authorization": f"Bearer {api_key}"},
-                files={"file": (filename, _io.BytesIO(data), "audio/webm")},
-                data={"model": "whisper-1"},
-                timeout=30,
-            )
-            if resp.ok:
-                text = resp.json().get("text", "").strip()
+            if segments:
+                ext, content_type = segments[0][1], segments[0][2]
+                try:
+                    transcript = await offload.run_io(
+                        segmented_stt.transcribe, [seg[0] for seg in segments],
+                        lambda payload: _stt_request(provider, api_key, f"segment.{ext}", payload, content_type),
+                    )
+                    if transcript.text:
+                        _note_voice(session_id, session, transcript.text, await prosody_task if prosody_task else None)
+                        return {"text": transcript.text, "provider": label, "audio": report,
+                                "segments": transcript.segments, "failed_segments": transcript.failed}
+                except Exception as e:
+                    print(f"{label} segmented STT error: {mask_secret(str(e))}")
+            # Not segmented, or no segment came back: one request for the whole recording.
+            try:
+                text = await offload.run_io(_stt_request, provider, api_key, audio.filename, audio.data, audio.content_type)
                 if text:
-                    return {"text": text, "provider": "whisper"}
-        except Exception as e:
-            print(f"Whisper STT error: {e}")
+                    _note_voice(session_id, session, text, await prosody_task if prosody_task else None)
+                    return {"text": text, "provider": label, "audio": report}
+            except Exception as e:
+                print(f"{label} STT error: {mask_secret(str(e))}")
+        finally:
+            if prosody_task is not None and not prosody_task.done():
+                prosody_task.cancel()
 
-    # ── Groq Whisper (free tier, very fast) ───────────────────────────────────
-    if provider == "grok" and api_key and not api_key.lower().startswith("demo"):
+    # Fallback — tell frontend to use browser speech recognition
+    return {"text": "", "fallback": True, "audio": report}
+
+
+# ─── Live voice (WebSocket) ───────────────────────────────────────────────────
+# Protocol:
+#   client → {"session_id": ..., "sample_rate": 16000}   first message
+#   client → binary frames: mono PCM, signed 16-bit little-endian, as captured
+#   client → {"type": "end"}                            candidate stopped
+#   server → {"type": "ready"}
+#   server → {"type": "partial", "text": ..., "utterances": n}   as utterances are transcribed
+#   server → {"type": "final", "text": ..., "utterances": n, "failed_utterances": [...]}
+#   server → {"type": "error", "detail": ..., "fallback": true}  use browser recognition
+# Server-side VAD (vad.py) cuts the stream at pauses; each utterance is encoded
+# and transcribed while the candidate keeps talking, so at end-of-speech only
+# the last utterance is still in flight.
+
+MIN_UTTERANCE_SEC = 0.25
+
+@router.websocket("/interview/voice")
+async def live_voice(websocket: WebSocket):
+    await websocket.accept()
+    try:
+        hello = await websocket.receive_json()
+    except (WebSocketDisconnect, ValueError):
+        return
+    session_id = str(hello.get("session_id", "")) if isinstance(hello, dict) else ""
+    session = active_sessions.get(session_id)
+    provider = (session or {}).get("provider", "")
+    api_key = (session or {}).get("api_key", "")
+    if provider not in _STT_ENDPOINTS or not api_key or api_key.lower().startswith("demo"):
+        await websocket.send_json({"type": "error", "detail": "Live transcription not available", "fallback": True})
+        await websocket.close()
+        return
+    try:
+        rate = max(8000, int(hello.get("sample_rate") or audio_prep.TARGET_RATE))
+    except (TypeError, ValueError):
+        rate = audio_prep.TARGET_RATE
+
+    detector = vad.VoiceActivityDetector(audio_prep.TARGET_RATE)
+    texts: list[str | None] = []
+    failed: list[int] = []
+    tasks: list[asyncio.Task] = []
+    received: list = []   # every frame, for prosody over the whole answer
+    send_lock = asyncio.Lock()
+    sent = 0
+
+    async def send(message: dict):
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def transcribe_utterance(i: int, samples):
+        nonlocal sent
         try:
-            resp = requests.post(
-                "https://api.groq.com/openai/v1/audio/transcriptions",
-                headers={"Authorization": f"Bearer {api_key}"},
-                files={"file": (filename, _io.BytesIO(data), "audio/webm")},
-                data={"model": "whisper-large-v3"},
-                timeout=30,
+            payload, ext, content_type = await offload.run_cpu(audio_prep.encode, samples)
+            texts[i] = await offload.run_io(
+                segmented_stt.with_retries,
+                lambda data: _stt_request(provider, api_key, f"utterance.{ext}", data, content_type),
+                payload, settings.stt_retries,
             )
-            if resp.ok:
-                text = resp.json().get("text", "").strip()
-                if text:
-                    return {"text": text, "provider": "groq-whisper"}
         except Exception as e:
-            print(f"Groq Whisper STT error: {e}")
+            print(f"[voice] utterance {i} failed: {mask_secret(str(e))}")
+            failed.append(i)
+            texts[i] = ""
+        # Partials only ever extend the in-order prefix of finished utterances.
+        done = sent
+        while done < len(texts) and texts[done] is not None:
+            done += 1
+        if done > sent:
+            sent = done
+            await send({"type": "partial", "text": " ".join(t for t in texts[:done] if t), "utterances": done})
+
+    def start(samples):
+        if len(samples) < MIN_UTTERANCE_SEC * audio_prep.TARGET_RATE:
+            return
+        texts.append(None)
+        tasks.append(asyncio.create_task(transcribe_utterance(len(texts) - 1, samples)))
 
-    # Fallback — tell frontend to use browser speech recognition
-    return {"text": "", "fallback": True}
+    try:
+        await send({"type": "ready"})
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes"):
+                pcm = audio_prep.resample(audio_prep.pcm16_to_float(message["bytes"]), rate)
+                received.append(pcm)
+                for utterance in detector.feed(pcm):
+                    start(utterance)
+            elif message.get("text"):
+                try:
+                    control = json.loads(message["text"])
+                except ValueError:
+                    continue
+                if isinstance(control, dict) and control.get("type") == "end":
+                    break
+        tail = detector.flush()
+        if tail is not None:
+            start(tail)
+        await asyncio.gather(*tasks)
+        final = " ".join(t for t in texts if t)
+        if final and received:
+            samples = await offload.run_cpu(audio_prep.concat, received)
+            _note_voice(session_id, session, final, await offload.run_cpu(prosody.extract, samples))
+        await send({"type": "final", "text": final,
+                    "utterances": len(texts), "failed_utterances": sorted(failed)})
+        await websocket.close()
+    except WebSocketDisconnect:
+        for task in tasks:
+            task.cancel()
+    except Exception as e:
+        for task in tasks:
+            task.cancel()
+        print(f"[voice] live transcription failed: {mask_secret(str(e))}")
+        try:
+            await send({"type": "error", "detail": "Live transcription failed", "fallback": True})
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+
+# ─── Text-to-speech ───────────────────────────────────────────────────────────
+# Long text is synthesized in sentence-sized chunks, pipelined in parallel and
+# streamed in order as audio arrives (tts_stream). Finished audio is cached on
+# disk by (model, voice, text) — see tts_cache — and served with a content-hash
+# ETag and Range support. Prefetched next questions are synthesized ahead of
+# time (_presynthesize).
+
+TTS_MODEL = "tts-1"
+TTS_VOICE = "nova"
+TTS_MAX_CHARS = 4096
+
+def _tts_available(session: dict) -> bool:
+    api_key = session.get("api_key", "")
+    return session.get("provider") == "openai" and bool(api_key) and not api_key.lower().startswith("demo")
+
+def _synthesize_stream(api_key: str, text: str) -> Iterator[bytes]:
+    """Blocking OpenAI TTS call for one chunk, yielding MP3 bytes as they arrive."""
+    with requests.post(
+        "https://api.openai.com/v1/audio/speech",
+        headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+        json={"model": TTS_MODEL, "voice": TTS_VOICE, "input": text},
+        stream=True,
+        timeout=30,
+    ) as resp:
+        if not resp.ok:
+            raise RuntimeError(f"TTS HTTP {resp.status_code}: {mask_secret(resp.text[:200])}")
+        yield from resp.iter_content(chunk_size=8192)
+
+def _speech_audio(api_key: str, text: str) -> Iterator[bytes]:
+    """Sentence-split, pipelined synthesis of `text` (see tts_stream)."""
+    return tts_stream.stream(tts_stream.split_text(text), functools.partial(_synthesize_stream, api_key))
+
+def _synthesize(api_key: str, text: str) -> bytes:
+    """The whole MP3 for `text`. Blocking."""
+    return b"".join(_speech_audio(api_key, text))
+
+def _tee_into_cache(store, key: str, audio: Iterator[bytes]) -> Iterator[bytes]:
+    """Pass audio through, caching it once the stream completes (never a partial file)."""
+    parts = []
+    for chunk in audio:
+        parts.append(chunk)
+        yield chunk
+    store.put(key, b"".join(parts))
+
+def _presynthesize(session: dict, text: str):
+    """Warm the TTS cache for a question the candidate is about to hear. Blocking."""
+    store = tts_cache.store()
+    clean = (text or "").strip()[:TTS_MAX_CHARS]
+    if store is None or not clean or not _tts_available(session):
+        return
+    api_key = session.get("api_key", "")
+    try:
+        store.get_or_create(tts_cache.key(TTS_MODEL, TTS_VOICE, clean), lambda: _synthesize(api_key, clean))
+    except Exception as e:
+        print(f"[tts] pre-synthesis failed: {mask_secret(str(e))}")
 
+def _cached_audio_response(request: Request, key: str, path: str):
+    tag = tts_cache.etag(key)
+    headers = {"ETag": tag, "Cache-Control": "public, max-age=31536000, immutable", "X-TTS-Key": key}
+    if tag in (request.headers.get("if-none-match") or ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type="audio/mpeg", headers=headers)
 
 @router.post("/interview/speak")
-async def text_to_speech(session_id: str = Form(...), text: str = Form(...)):
-    """TTS via OpenAI (tts-1). Returns audio/mpeg stream."""
-    from fastapi.responses import Response as FResponse
-    import io as _io
+async def text_to_speech(request: Request, session_id: str = Form(...), text: str = Form(...)):
+    """TTS via OpenAI (tts-1). Streams audio/mpeg as it is synthesized; repeated text is served from the cache."""
     session = active_sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     api_key = session.get("api_key", "")
-    provider = session.get("provider", "")
-    clean = (text or "").strip()[:4096]
+    clean = (text or "").strip()[:TTS_MAX_CHARS]
     if not clean:
         raise HTTPException(status_code=400, detail="No text provided")
 
-    if provider == "openai" and api_key and not api_key.lower().startswith("demo"):
+    if _tts_available(session):
+        store = tts_cache.store()
+        key = tts_cache.key(TTS_MODEL, TTS_VOICE, clean)
+        headers = {"Cache-Control": "no-cache", "X-TTS-Key": key}
         try:
-            resp = requests.post(
-                "https://api.openai.com/v1/audio/speech",
-                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
-                json={"model": "tts-1", "voice": "nova", "input": clean},
-                timeout=30,
-            )
-            if resp.ok:
-                return StreamingResponse(
-                    _io.BytesIO(resp.content),
-                    media_type="audio/mpeg",
-                    headers={"Cache-Control": "no-cache"},
-                )
+            if store is not None:
+                path = store.get(key)
+                if path is None and store.in_flight(key):   # being pre-synthesized — wait for it
+                    path = await offload.run_io(store.get_or_create, key, lambda: _synthesize(api_key, clean))
+                if path is not None:
+                    return _cached_audio_response(request, key, path)
+            audio = _speech_audio(api_key, clean)
+            if store is not None:
+                audio = _tee_into_cache(store, key, audio)
+            # Pull the first bytes before answering, so an upstream failure is still a 503.
+            head = await offload.run_io(next, audio, b"")
         except Exception as e:
-            print(f"OpenAI TTS error: {e}")
+            print(f"OpenAI TTS error: {mask_secret(str(e))}")
+        else:
+            async def _relay():
+                if head:
+                    yield head
+                async for chunk in offload.iterate_io(audio):
+                    yield chunk
+            return StreamingResponse(_relay(), media_type="audio/mpeg", headers=headers)
 
     raise HTTPException(status_code=503, detail="TTS not available for this provider; use browser synthesis")
 
+@router.get("/interview/speak/{key}")
+async def cached_speech(key: str, request: Request):
+    """Previously synthesized audio by cache key (X-TTS-Key), with ETag / Range support."""
+    store = tts_cache.store()
+    path = store.get(key) if store is not None and re.fullmatch(r"[0-9a-f]{32}", key) else None
+    if path is None:
+        raise HTTPException(status_code=404, detail="Audio not cached")
+    return _cached_audio_response(request, key, path)
+
 @router.post("/interview/restore")
-def restore_interview(session_id: str = Form(...)):
+async def restore_interview(session_id: str = Form(...)):
     session = active_sessions.get(session_id)
     if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
+        # Not in memory (e.g. after a restart) — try the on-disk snapshot.
+        try:
+            session = await offload.run_io(snapshot.load, session_id)
+        except (OSError, snapshot.SnapshotError) as e:
+            print(f"[snapshot] could not restore {session_id}: {e}")
+            session = None
+        if session is None:
+            raise HTTPException(status_code=404, detail="Session not found")
+        session = active_sessions.setdefault(session_id, session)
     model = session.get('model') or get_default_model(session['provider'])
     # Return minimal metadata for client-side state restore
     return {
@@ -1495,50 +1941,115 @@ def restore_interview(session_id: str = Form(...)):
     }
 
 
+@router.get("/interview/stats")
+async def server_stats():
+    """Process-wide counters (see app/metrics.py)."""
+    return metrics.snapshot()
+
+
+@router.post("/interview/rapid_fire/results")
+async def rapid_fire_results(session_id: str = Form(...)):
+    """Evaluations merged so far in a rapid-fire round, plus how many are still queued."""
+    session = active_sessions.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    with _session_lock(session_id):
+        return {"qa_pairs": list(session.qa_pairs), "pending": len(session.pending_answers)}
+
+
 # ─── SSE Streaming Endpoints ──────────────────────────────────────────────────
 # These stream text token-by-token so the UI can show a typing effect.
 # Frontend uses fetch() + ReadableStream (works with POST-initiated GET).
+# Generators yield text chunks and sse.control() frames; _event_stream batches
+# the text into frames (see app/sse.py).
+# Each generation runs in an sse.StreamLog owned by the session, and responses
+# only follow it: a client that drops and reconnects with Last-Event-ID (or
+# repeats the same request while it is still running) resumes from the frames
+# it missed instead of starting another LLM call. A generation left without a
+# client for settings.sse_resume_grace_sec is cancelled, and the cancellation
+# closes the upstream provider response (_abandon_stream) instead of reading it
+# to the end and then writing the result into the session.
+
+_stream_logs: dict[str, sse.StreamLog] = {}   # session_id → latest generation
+
+
+def _event_stream(source) -> StreamingResponse:
+    return StreamingResponse(sse.coalesce(source), media_type="text/event-stream", headers=sse.HEADERS)
 
-@router.get("/interview/question/stream")
-def stream_question(session_id: str):
-    """Stream the next interview question via SSE (GET, session_id as query param)."""
-    session = active_sessions.get(session_id)
-    if not session:
-        def _err():
-            yield "data: [ERROR]Session not found\n\n"
-        return StreamingResponse(_err(), media_type="text/event-stream",
-                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
+async def _resumable_stream(session_id: str, fingerprint: tuple, last_event_id, make_source,
+                            replay_finished: bool = False) -> StreamingResponse:
+    """Follow the session's generation for `fingerprint`, starting one if none matches.
+
+    With `replay_finished`, a repeat of a request whose generation already
+    ended replays it (as far as the buffer reaches) instead of running it
+    again; answers use this so a retried submit isn't evaluated and recorded twice.
+    """
+    log = _stream_logs.get(session_id)
+    if log is not None:
+        after = log.resume_point(last_event_id if isinstance(last_event_id, str) else None)
+        if after is None and log.fingerprint == fingerprint and (replay_finished or not log.done):
+            after = log.frames[0][0] - 1 if log.done and log.frames else -1
+        if after is not None:
+            return StreamingResponse(log.follow(after), media_type="text/event-stream", headers=sse.HEADERS)
+    log = _stream_logs[session_id] = sse.StreamLog(fingerprint)
+    try:
+        log.start(sse.coalesce(await make_source()))
+    except BaseException:
+        log.close()
+        raise
+    return StreamingResponse(log.follow(), media_type="text/event-stream", headers=sse.HEADERS)
+
+
+CHARS_PER_TOKEN = 4   # rough English average, for the tokens-saved estimate
+
+def _abandon_stream(handle: llm_client.StreamHandle, max_tokens: int):
+    """The client went away mid-stream: close the upstream request and count what that saved."""
+    if handle.cancel():
+        metrics.incr("llm_streams_cancelled")
+        metrics.incr("llm_tokens_saved_est", max(0, max_tokens - handle.chars // CHARS_PER_TOKEN))
+
+
+async def _question_source(session_id: str, session: InterviewSession):
+    """Text chunks of the next question, then DONE. Shared by the SSE and WebSocket transports."""
     if _is_offline_demo(session):
-        q = _generate_local_question_with_difficulty(session, session_id)
-        session.setdefault('questions_asked', []).append(q)
-        session['current_question'] = q
-        def _local():
+        with _session_lock(session_id):
+            q = _generate_local_question_locked(session)
+            session.setdefault('questions_asked', []).append(q)
+            session['current_question'] = q
+        async def _local():
             # Simulate streaming for demo mode
             for word in q.split():
-                yield f"data: {word} \n\n"
-            yield "data: [DONE]\n\n"
-        return StreamingResponse(_local(), media_type="text/event-stream",
-                                  headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+                yield word + " "
+            yield sse.control("DONE")
+        return _local()
 
     profile = session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
     provider = session['provider']
     model = session.get('model') or llm_client.get_default_model(provider)
     api_key = session['api_key']
 
-    # ── Serve from prefetch cache if available ────────────────────────────────
-    cached_q = _prefetch_cache.pop(session_id, None)
+    # ── Serve a fused turn's question, or from prefetch cache if available ───
+    nxt = _take_turn_next(session_id, session)
+    with _session_lock(session_id):
+        cached_q = nxt[1] if nxt else _prefetch_cache.pop(session_id, None)
+        if cached_q and not nxt:
+            _commit_question(session, cached_q)
+    if not cached_q:
+        cached_q = _local_basic_question(session_id, session)
+    if not cached_q and _batching_enabled():
+        qtype = _select_question_type(
+            _compute_effective_difficulty(session.get('difficulty', 'basic'), session.get('last_score_10')),
+            session.get('last_score_10'), session,
+        )
+        cached_q = await _next_batched_question(session_id, session, qtype, provider, api_key, model)
     if cached_q:
-        session.setdefault('questions_asked', []).append(cached_q)
-        session['current_question'] = cached_q
-        _note_session_question(session, cached_q)
-        def _cached_gen():
+        async def _cached_gen():
             for word in cached_q.split():
-                yield f"data: {json.dumps(word + ' ')}\n\n"
-                time.sleep(0.02)
-            yield "data: [DONE]\n\n"
-        return StreamingResponse(_cached_gen(), media_type="text/event-stream",
-                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+                yield word + " "
+                await asyncio.sleep(0.02)
+            yield sse.control("DONE")
+        return _cached_gen()
 
     track_data = company_tracks.get_track(session.get("company_track")) if session.get("company_track") else None
     soul_prompt = soul_engine.build_question_prompt(
@@ -1554,128 +2065,287 @@ def stream_question(session_id: str):
 
     accumulated = []
 
-    def _gen():
+    async def _gen():
         # Human-like thinking pause before first token
-        time.sleep(0.8)
+        await asyncio.sleep(0.8)
+        handle = llm_client.StreamHandle()
         try:
-            for chunk in llm_client.stream_llm(provider, api_key, model, messages, max_tokens=400):
+            async for chunk in offload.iterate_io(llm_client.stream_llm(provider, api_key, model, messages,
+                                                                        max_tokens=400, handle=handle)):
                 accumulated.append(chunk)
-                yield f"data: {json.dumps(chunk)}\n\n"
+                yield chunk
             full = "".join(accumulated)
-            if full and not _is_repeat(session, full):
-                _note_session_question(session, full)
-                session.setdefault('questions_asked', []).append(full)
-                session['current_question'] = full
-            yield "data: [DONE]\n\n"
+            with _session_lock(session_id):
+                if full and not _is_repeat(session, full):
+                    _commit_question(session, full)
+            yield sse.control("DONE")
+        except (GeneratorExit, asyncio.CancelledError):
+            _abandon_stream(handle, 400)
+            raise
         except Exception as exc:
-            fallback = _generate_local_question_with_difficulty(session, session_id)
-            session.setdefault('questions_asked', []).append(fallback)
-            session['current_question'] = fallback
-            yield f"data: {json.dumps(fallback)}\n\n"
-            yield "data: [DONE]\n\n"
-
-    return StreamingResponse(_gen(), media_type="text/event-stream",
-                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+            with _session_lock(session_id):
+                fallback = _generate_local_question_locked(session)
+                session.setdefault('questions_asked', []).append(fallback)
+                session['current_question'] = fallback
+            yield fallback
+            yield sse.control("DONE")
+
+    return _gen()
+
+
+# The evaluator's JSON is parsed as it streams (json_stream): each field goes out
+# as a [FIELD]{"name": value} frame the moment it is complete — the score first —
+# and only the detailed_feedback text is streamed as text.
+STREAMED_EVAL_FIELDS = ("detailed_feedback",)
+
+
+def _field_frame(name: str, value) -> sse.Control:
+    return sse.control("FIELD", json.dumps({name: value}))
+
+
+async def _feedback_source(session_id: str, session: InterviewSession, answer: str):
+    """FIELD frames and feedback text for `answer`, then META (evaluation + analysis) and DONE."""
+    with _session_lock(session_id):
+        question = session.get("current_question", "")
+    if session.get("mode") == "rapid_fire":
+        # Queued for the round's batch evaluation, as /interview/answer does.
+        queued = await _accept_rapid_fire_answer(session_id, session, answer, question)
+        async def _queued():
+            yield sse.control("META", json.dumps(queued))
+            yield sse.control("DONE")
+        return _queued()
+    analysis = await _analyze_answer(session_id, session, (answer or "").strip())
+    analysis_dict = speech_analyzer.to_dict(analysis)
 
+    provider = session['provider']
+    api_key = session['api_key']
 
-@router.get("/interview/answer/stream")
-def stream_answer_feedback(session_id: str, answer: str):
-    """
-    Stream AI feedback for a candidate answer via SSE.
-    Uses soul_engine evaluation prompt so feedback is mentor-quality.
-    """
-    session = active_sessions.get(session_id)
-    if not session:
-        def _err():
-            yield "data: [ERROR]Session not found\n\n"
-        return StreamingResponse(_err(), media_type="text/event-stream",
-                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    # Demo mode, an answer too trivial for the evaluator, or a provider whose
+    # circuit is open — local evaluation, same frames
+    eval_data = None
+    if _is_offline_demo(session) or llm_client.circuit_open(provider, api_key):
+        eval_data = _local_eval(session, (answer or "").strip(), question, analysis)
+    else:
+        eval_data = _prescreen(session, question, answer, analysis)
+    if eval_data is not None:
+        await _persist_local(session_id, session, answer, question, eval_data, analysis)
+        return _local_frames(eval_data, analysis_dict)
 
-    # Demo mode — fake stream with local evaluation
-    if _is_offline_demo(session):
-        user_answer = (answer or "").strip()
-        length = len(user_answer.split())
-        score = 1 if length < 3 else min(10, 5 + max(0, length - 8) // 2)
-        eval_data = {
-            "score": score,
-            "is_correct": score >= 7,
-            "short_verdict": "Correct" if score >= 8 else ("Partially correct." if score >= 5 else "Too short."),
-            "detailed_feedback": "Good structure and clarity." if score >= 8 else "Decent attempt—add more depth and real examples.",
-            "correct_answer_hint": f"A strong answer covers definition, trade-offs, and a practical example from {session.get('domain', 'your field')}.",
-            "improvement_tip": "Study core concepts; practice with real examples.",
-            "topic_tag": session.get("domain") or "General",
-        }
-        interview_type = session.get("interview_type", "general")
-        analysis = speech_analyzer.analyze(user_answer, question_type=interview_type)
-        analysis_dict = speech_analyzer.to_dict(analysis)
-        _persist_answer(session, answer, score, eval_data, analysis_dict)
-
-        def _demo_gen():
-            fake_feedback = eval_data["detailed_feedback"]
-            for word in fake_feedback.split():
-                yield f"data: {json.dumps(word + ' ')}\n\n"
-            yield f"data: [META]{json.dumps(eval_data)}\n\n"
-            yield "data: [DONE]\n\n"
-        return StreamingResponse(_demo_gen(), media_type="text/event-stream",
-                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
-
-    question = session.get("current_question", "")
     profile = session.get("soul_profile") or soul_engine.default_profile(session.get("domain", "General"))
     eval_track = company_tracks.get_track(session.get("company_track")) if session.get("company_track") else None
-    eval_prompt = soul_engine.build_evaluation_prompt(question, answer, profile, company_track=eval_track)
+    fused = settings.fused_turns
+    if fused:
+        eval_prompt = _turn_prompt(session, answer, question)
+    else:
+        eval_prompt = soul_engine.build_evaluation_prompt(question, answer, profile, company_track=eval_track)
+    max_tokens = TURN_MAX_TOKENS if fused else 600
     messages = [
         {"role": "system", "content": "You are an expert interview evaluator. Respond with only valid JSON."},
         {"role": "user", "content": eval_prompt},
     ]
-    provider = session['provider']
     model = session.get('model') or llm_client.get_default_model(provider)
-    api_key = session['api_key']
 
     accumulated = []
 
-    def _prefetch_next(sid: str, sess: dict, prof: dict, prov: str, akey: str, mdl: str):
-        """Background thread: pre-generate the next question and cache it."""
-        try:
-            q_num = len(sess.get("questions_asked", [])) + 1
-            last_sc = sess.get("last_score_10")
-            prompt = soul_engine.build_question_prompt(profile=prof, question_number=q_num, last_score=last_sc)
-            msgs = [{"role": "user", "content": prompt}]
-            chunks = []
-            for ch in llm_client.stream_llm(prov, akey, mdl, msgs, max_tokens=400):
-                chunks.append(ch)
-            q_text = "".join(chunks).strip()
-            if q_text and not _is_repeat(sess, q_text):
-                _prefetch_cache[sid] = q_text
-        except Exception:
-            pass  # silent — fallback will generate live
-
-    def _gen():
+    async def _gen():
         # Evaluating pause — feels like AI is actually reading the answer
-        time.sleep(0.9)
+        await asyncio.sleep(0.9)
+        handle = llm_client.StreamHandle()
+        fields = json_stream.ObjectStream(STREAMED_EVAL_FIELDS)
         try:
-            for chunk in llm_client.stream_llm(provider, api_key, model, messages, max_tokens=600):
+            async for chunk in offload.iterate_io(llm_client.stream_llm(provider, api_key, model, messages,
+                                                                        max_tokens=max_tokens, handle=handle)):
                 accumulated.append(chunk)
-                yield f"data: {json.dumps(chunk)}\n\n"
+                for event in fields.feed(chunk):
+                    yield event.value if event.kind == "delta" else _field_frame(event.name, event.value)
             full = "".join(accumulated)
-            eval_data = soul_engine.parse_evaluation_json(full)
+            eval_data, nxt = soul_engine.parse_turn_json(full) if fused else (soul_engine.parse_evaluation_json(full), None)
             score = max(1, min(10, int(eval_data.get("score", 5))))
-            interview_type = session.get("interview_type", "general")
-            analysis = speech_analyzer.analyze(answer, question_type=interview_type)
-            analysis_dict = speech_analyzer.to_dict(analysis)
-            _persist_answer(session, answer, score, eval_data, analysis_dict)
-            yield f"data: [META]{json.dumps(eval_data)}\n\n"
-            yield "data: [DONE]\n\n"
+            with _session_lock(session_id):
+                _persist_answer(session, answer, score, eval_data, analysis, question=question)
+                prof_snap = copy.deepcopy(session.get("soul_profile") or {})
+            await _checkpoint(session_id, session)
+            meta = {**eval_data, "analysis": analysis_dict}
+            if fused and _stash_turn_next(session_id, session, nxt):
+                meta["next_kind"], meta["next_question"] = nxt
+            yield sse.control("META", json.dumps(meta))
+            yield sse.control("DONE")
+            if fused:
+                return   # the evaluation already wrote the next question
             # Pre-generate next question in background (only when score >= 6 — no follow-up)
-            if score >= 6:
-                prof_snap = dict(session.get("soul_profile") or {})
+            if _batching_enabled():
+                _maybe_refill_in_background(session_id, session, provider, api_key, model)
+            elif score >= 6:
                 threading.Thread(
                     target=_prefetch_next,
                     args=(session_id, session, prof_snap, provider, api_key, model),
                     daemon=True,
                 ).start()
+        except (GeneratorExit, asyncio.CancelledError):
+            _abandon_stream(handle, max_tokens)
+            raise
         except Exception as exc:
-            yield f"data: [ERROR]{str(exc)}\n\n"
-            yield "data: [DONE]\n\n"
+            if accumulated:
+                yield sse.control("ERROR", str(exc))
+                yield sse.control("DONE")
+                return
+            # Nothing was streamed yet: grade it locally instead of failing the answer.
+            print(f"Soul evaluator error ({provider}): {mask_secret(str(exc))}")
+            local = _local_eval(session, answer, question, analysis)
+            await _persist_local(session_id, session, answer, question, local, analysis)
+            async for frame in _local_frames(local, analysis_dict):
+                yield frame
+
+    return _gen()
+
+
+async def _persist_local(session_id: str, session: InterviewSession, answer: str, question: str,
+                         eval_data: dict, analysis: speech_analyzer.AnswerAnalysis):
+    with _session_lock(session_id):
+        _persist_answer(session, answer, max(1, eval_data["score"]), eval_data, analysis, question=question)
+    await _checkpoint(session_id, session)
+
+
+async def _local_frames(eval_data: dict, analysis_dict: dict):
+    """The frames of a locally produced evaluation, in the order the LLM stream sends them."""
+    for name in ("score", "short_verdict"):
+        yield _field_frame(name, eval_data.get(name))
+    for word in eval_data["detailed_feedback"].split():
+        yield word + " "
+    yield sse.control("META", json.dumps({**eval_data, "analysis": analysis_dict}))
+    yield sse.control("DONE")
+
+
+@router.get("/interview/question/stream")
+async def stream_question(session_id: str, last_event_id: str | None = Header(None)):
+    """Stream the next interview question via SSE (GET, session_id as query param)."""
+    session = active_sessions.get(session_id)
+    if not session:
+        async def _err():
+            yield sse.control("ERROR", "Session not found")
+        return _event_stream(_err())
+    return await _resumable_stream(session_id, ("question",), last_event_id,
+                                   lambda: _question_source(session_id, session))
 
-    return StreamingResponse(_gen(), media_type="text/event-stream",
-                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.get("/interview/answer/stream")
+async def stream_answer_feedback(session_id: str, answer: str, last_event_id: str | None = Header(None)):
+    """
+    Stream AI feedback for a candidate answer via SSE.
+    Uses soul_engine evaluation prompt so feedback is mentor-quality.
+    """
+    session = active_sessions.get(session_id)
+    if not session:
+        async def _err():
+            yield sse.control("ERROR", "Session not found")
+        return _event_stream(_err())
+
+    with _session_lock(session_id):
+        question = session.get("current_question", "")
+    return await _resumable_stream(session_id, ("answer", question, answer), last_event_id,
+                                   lambda: _feedback_source(session_id, session, answer), replay_finished=True)
+
+
+# ─── Interview session (WebSocket) ────────────────────────────────────────────
+# One connection carries the whole interview; the session is looked up once.
+# Protocol:
+#   client → {"session_id": ...}                                   first message
+#   client → {"type": "question"}                                  stream the next question
+#   client → {"type": "answer", "text": ..., "next": true|false}   stream feedback (then the next question)
+#   client → {"type": "followup"} | {"type": "end"} | {"type": "ping"}
+#   server → {"type": "ready", "mode": ..., "question": current question or null}
+#   server → {"type": "question", "d": text} ... {"type": "question_end", "question": full}
+#   server → {"type": "field", "data": {"score": 7}} ... as each evaluation field completes
+#   server → {"type": "feedback", "d": text} ... {"type": "evaluation", "data": {...}} {"type": "feedback_end"}
+#   server → {"type": "summary", "data": {...}}                    reply to end; the socket then closes
+#   server → {"type": "error", "detail": ...}                     a failed turn; the socket stays open
+# Text deltas are batched exactly like the SSE streams (sse.batch). With
+# "next": true the next question is pushed as soon as the feedback finishes,
+# without another client round trip.
+
+async def _relay_to_socket(websocket: WebSocket, source, stream: str) -> None:
+    batches = sse.batch(source)
+    try:
+        async for item in batches:
+            if not isinstance(item, sse.Control):
+                await websocket.send_text(f'{{"type": "{stream}", "d": {json.dumps(item)}}}')
+            elif item.kind == "FIELD":
+                await websocket.send_text(f'{{"type": "field", "data": {item.payload}}}')
+            elif item.kind == "META":
+                await websocket.send_text(f'{{"type": "evaluation", "data": {item.payload}}}')
+            elif item.kind == "ERROR":
+                await websocket.send_json({"type": "error", "detail": item.payload})
+    finally:
+        await batches.aclose()
+
+
+@router.websocket("/interview/session")
+async def interview_socket(websocket: WebSocket):
+    await websocket.accept()
+    try:
+        hello = await websocket.receive_json()
+    except (WebSocketDisconnect, ValueError):
+        return
+    session_id = str(hello.get("session_id", "")) if isinstance(hello, dict) else ""
+    session = active_sessions.get(session_id)
+    if not session:
+        await websocket.send_json({"type": "error", "detail": "Session not found"})
+        await websocket.close()
+        return
+
+    async def send_question():
+        await _relay_to_socket(websocket, await _question_source(session_id, session), "question")
+        with _session_lock(session_id):
+            question = session.get("current_question", "")
+        await websocket.send_json({"type": "question_end", "question": question})
+
+    try:
+        with _session_lock(session_id):
+            current = session.get("current_question") or None
+        await websocket.send_json({"type": "ready", "mode": session.get("mode", "standard"), "question": current})
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "Messages must be JSON objects"})
+                continue
+            kind = message.get("type") if isinstance(message, dict) else None
+            try:
+                if kind == "question":
+                    await send_question()
+                elif kind == "answer":
+                    answer = str(message.get("text") or "")
+                    if session.get("mode") == "rapid_fire":
+                        with _session_lock(session_id):
+                            asked = session.get("current_question", "")
+                        result = await _accept_rapid_fire_answer(session_id, session, answer, asked)
+                        await websocket.send_json({"type": "evaluation", "data": result})
+                    else:
+                        await _relay_to_socket(websocket, await _feedback_source(session_id, session, answer), "feedback")
+                        await websocket.send_json({"type": "feedback_end"})
+                    if message.get("next"):
+                        await send_question()
+                elif kind == "followup":
+                    result = await generate_followup(session_id=session_id)
+                    await websocket.send_json({"type": "question_end", "question": result["question"], "followup": True})
+                elif kind == "end":
+                    result = await end_interview(session_id=session_id)
+                    await websocket.send_json({"type": "summary", "data": result["summary"]})
+                    await websocket.close()
+                    return
+                elif kind == "ping":
+                    await websocket.send_json({"type": "pong"})
+                else:
+                    await websocket.send_json({"type": "error", "detail": f"Unknown message type: {kind}"})
+            except (WebSocketDisconnect, HTTPException):
+                raise
+            except Exception as e:
+                # A failed turn (provider error, open circuit, bad output) is reported
+                # and the socket stays open for the next one.
+                print(f"[ws] {kind} turn failed: {mask_secret(str(e))}")
+                await websocket.send_json({"type": "error", "detail": f"The {kind} could not be completed, please try again"})
+    except WebSocketDisconnect:
+        pass
+    except HTTPException as e:
+        await websocket.send_json({"type": "error", "detail": e.detail})
+        await websocket.close()
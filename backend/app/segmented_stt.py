@@ -0,0 +1,135 @@
+"""
+Segmented STT — transcribe long spoken answers as parallel chunks.
+
+One Whisper request for a 3-minute answer takes time proportional to its
+length, and a single timeout loses the whole answer. For long recordings
+/interview/transcribe instead:
+
+1. splits the (already normalized, 16 kHz mono) audio at silence: each cut is
+   the quietest 20 ms frame between 2/3 and 4/3 of `settings.stt_segment_seconds`
+   into the segment, so words are rarely split; segments overlap by OVERLAP_SEC
+   so a word that straddles a cut is heard whole at least once;
+2. transcribes segments concurrently, at most `settings.stt_parallel` at a time,
+   retrying each failed segment independently with backoff;
+3. stitches the texts in order, dropping the words the overlap made both
+   neighbours transcribe (longest suffix of one == prefix of the next).
+
+A segment that still fails after its retries leaves a gap, reported by index,
+instead of failing the answer.
+"""
+
+from __future__ import annotations
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .config import settings
+
+try:
+    import numpy as np
+except ImportError:  # optional — without it audio is transcribed in one piece
+    np = None
+
+FRAME_SEC = 0.02
+OVERLAP_SEC = 0.6
+MAX_OVERLAP_WORDS = 8
+RETRY_BACKOFF_SEC = 0.5
+
+_pool = ThreadPoolExecutor(max_workers=max(1, settings.stt_parallel) * 4, thread_name_prefix="intervai-stt")
+
+_WORD = re.compile(r"[\w']+")
+
+
+@dataclass(slots=True)
+class Transcript:
+    text: str
+    segments: int
+    failed: list[int] = field(default_factory=list)
+
+
+def split_at_silence(samples, rate: int, target_sec: float, overlap_sec: float = OVERLAP_SEC) -> list:
+    """Cut `samples` into ~`target_sec` pieces at the quietest point near each boundary."""
+    total = len(samples)
+    seg = int(target_sec * rate)
+    if np is None or seg <= 0 or total <= seg * 1.5:
+        return [samples]
+    frame = max(1, int(rate * FRAME_SEC))
+    n = total // frame
+    energy = np.mean(np.square(samples[: n * frame].reshape(n, frame)), axis=1)
+    overlap = int(overlap_sec * rate)
+    lo_off, hi_off = int(seg * 0.66), int(seg * 1.33)
+
+    pieces, start = [], 0
+    while total - start > hi_off:
+        lo, hi = (start + lo_off) // frame, (start + hi_off) // frame
+        cut = (lo + int(np.argmin(energy[lo:hi]))) * frame + frame // 2
+        pieces.append(samples[start:cut + overlap // 2])
+        start = max(start + 1, cut - overlap // 2)
+    pieces.append(samples[start:])
+    return pieces
+
+
+def _words(text: str) -> list[str]:
+    return [w.lower() for w in _WORD.findall(text)]
+
+
+def stitch(texts: list[str], max_overlap: int = MAX_OVERLAP_WORDS) -> str:
+    """Join segment transcripts in order, dropping words repeated across each seam."""
+    out: list[str] = []
+    for text in texts:
+        tokens = text.split()
+        if out and tokens:
+            tail = _words(" ".join(out[-max_overlap:]))
+            head = _words(" ".join(tokens[:max_overlap]))
+            for k in range(min(len(tail), len(head)), 0, -1):
+                if tail[-k:] == head[:k]:
+                    tokens = tokens[_tokens_spanning(tokens, k):]
+                    break
+        out.extend(tokens)
+    return " ".join(out)
+
+
+def _tokens_spanning(tokens: list[str], n_words: int) -> int:
+    """How many whitespace tokens hold the first `n_words` words (punctuation-only tokens ride along)."""
+    seen = 0
+    for i, tok in enumerate(tokens):
+        seen += len(_WORD.findall(tok))
+        if seen >= n_words:
+            return i + 1
+    return len(tokens)
+
+
+def with_retries(transcribe: Callable[[bytes], str], payload: bytes, retries: int) -> str:
+    for attempt in range(retries + 1):
+        try:
+            return transcribe(payload)
+        except Exception as e:
+            if attempt == retries:
+                raise
+            print(f"[stt] segment failed (attempt {attempt + 1}): {e}")
+            time.sleep(RETRY_BACKOFF_SEC * (2 ** attempt))
+    return ""
+
+
+def transcribe(payloads: list[bytes], transcribe_one: Callable[[bytes], str],
+               parallel: int | None = None, retries: int | None = None) -> Transcript:
+    """Transcribe encoded segments concurrently (bounded) and stitch them in order. Blocking."""
+    width = max(1, settings.stt_parallel if parallel is None else parallel)
+    retries = max(0, settings.stt_retries if retries is None else retries)
+    texts: list[str] = [""] * len(payloads)
+    failed: list[int] = []
+    futures = {}
+    submitted = 0
+    for i in range(len(payloads)):
+        # Sliding window: at most `width` segments of this answer in flight.
+        while submitted < len(payloads) and submitted < i + width:
+            futures[submitted] = _pool.submit(with_retries, transcribe_one, payloads[submitted], retries)
+            submitted += 1
+        try:
+            texts[i] = (futures.pop(i).result() or "").strip()
+        except Exception as e:
+            print(f"[stt] segment {i} gave up: {e}")
+            failed.append(i)
+    return Transcript(stitch(texts), len(payloads), failed)
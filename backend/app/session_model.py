@@ -0,0 +1,222 @@
+"""
+Session Model — compact, typed interview state.
+
+A session used to be a dict of parallel lists (questions_asked, answers_given,
+feedback_received, scores_10, analysis_history, qa_pairs) that held every answer
+and its feedback several times over, with every analysis stored as a 16-key dict.
+
+Here each answer is stored once, as an `AnswerRecord` holding a slotted
+`AnswerAnalysis`; scores live in an `array('b')` column next to it. The old list
+views (`qa_pairs`, `answers_given`, ...) are derived on read, as tuples, so a stray
+`.append()` on one fails loudly instead of silently going nowhere.
+
+`InterviewSession` and `SoulProfile` keep the mapping interface the rest of the
+code uses (`session["x"]`, `.get`, `.setdefault`, `in`, `dict(profile)`), so
+helpers written against plain dicts work on either.
+"""
+
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from .domain_classifier import DomainClass
+from .prosody import Prosody
+from .simhash import SimHashIndex
+from .speech_analyzer import AnswerAnalysis, to_dict as analysis_to_dict
+
+MAX_HISTORY = 30   # answers kept per session
+
+
+class _SlotMapping:
+    """Dict-style access over a slotted dataclass. Unknown keys raise KeyError."""
+
+    __slots__ = ()
+    _keys: tuple[str, ...] = ()
+
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._keys:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._keys:
+            return default
+        return getattr(self, key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        # Every field always has a value, so this is a plain read.
+        return self[key]
+
+
+@dataclass(slots=True)
+class SoulProfile(_SlotMapping):
+    domain: str
+    topics: list[str] = field(default_factory=list)
+    skill_level: str = "unknown"      # unknown → beginner / intermediate / advanced
+    confidence: float = 5             # 1-10
+    scores: array = field(default_factory=lambda: array("b"))    # 0-10 per question
+    weakness_areas: list[str] = field(default_factory=list)      # topics where score < 5
+    strength_areas: list[str] = field(default_factory=list)      # topics where score >= 8
+    question_count: int = 0
+    document_context: str = ""        # extracted text from uploaded files
+    topic_scores: dict[str, array] = field(default_factory=dict)  # {"Python": array('b', [7, 4, 9])}
+    current_difficulty: str = "basic"
+    consecutive_correct: int = 0
+    consecutive_wrong: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "domain": self.domain,
+            "topics": list(self.topics),
+            "skill_level": self.skill_level,
+            "confidence": self.confidence,
+            "scores": list(self.scores),
+            "weakness_areas": list(self.weakness_areas),
+            "strength_areas": list(self.strength_areas),
+            "question_count": self.question_count,
+            "document_context": self.document_context,
+            "topic_scores": {t: list(s) for t, s in self.topic_scores.items()},
+            "current_difficulty": self.current_difficulty,
+            "consecutive_correct": self.consecutive_correct,
+            "consecutive_wrong": self.consecutive_wrong,
+        }
+
+
+@dataclass(slots=True)
+class AnswerRecord:
+    """One answered question. The score lives in InterviewSession.scores."""
+    question: str
+    answer: str
+    verdict: str = ""
+    feedback: str = ""
+    correct_answer: str = ""
+    improvement_tip: str = ""
+    topic_tag: str = ""
+    analysis: AnswerAnalysis | None = None
+    id: int = -1        # stable per-session id, set by InterviewSession.record_answer
+
+    def to_dict(self, score: int) -> dict:
+        """API shape of a Q&A pair (what used to live in session['qa_pairs'])."""
+        return {
+            "question": self.question,
+            "user_answer": self.answer,
+            "score": score,
+            "verdict": self.verdict,
+            "feedback": self.feedback,
+            "correct_answer": self.correct_answer,
+            "improvement_tip": self.improvement_tip,
+            "topic_tag": self.topic_tag,
+            "analysis": analysis_to_dict(self.analysis) if self.analysis is not None else {},
+        }
+
+
+@dataclass(slots=True)
+class InterviewSession(_SlotMapping):
+    provider: str
+    api_key: str
+    domain: str
+    model: str
+    soul_profile: SoulProfile
+    difficulty: str = "basic"
+    topics: list[str] = field(default_factory=list)
+    company_track: str | None = None
+    interview_type: str = "general"
+    user_memory: dict | None = None
+    pressure_level: str = "none"
+    current_question: str = ""
+    questions_asked: list[str] = field(default_factory=list)
+    answers: list[AnswerRecord] = field(default_factory=list)
+    scores: array = field(default_factory=lambda: array("b"))    # aligned with `answers`
+    weak_areas: dict[str, list[dict]] = field(default_factory=dict)
+    last_score_10: int | None = None
+    last_answer_word_count: int | None = None
+    type_counts: dict[str, int] = field(default_factory=dict)
+    last_types: list[str] = field(default_factory=list)
+    asked_norm_set: set[str] = field(default_factory=set)
+    bank_cursors: dict[str, list[int]] = field(default_factory=dict)   # question_bank draw state
+    question_queue: list[list[str]] = field(default_factory=list)     # [[type, question], ...] from a batch
+    question_queue_sig: str = ""                                       # profile signature the queue was made for
+    mode: str = "standard"                                             # "standard" | "rapid_fire"
+    pending_answers: list[AnswerRecord] = field(default_factory=list)  # rapid-fire answers not yet evaluated
+    domain_class: DomainClass | None = None    # domain_classifier.classify(domain), set at start
+    near_dup_index: SimHashIndex = field(default_factory=SimHashIndex)   # fingerprints of asked questions
+    voice_transcript: str = ""                 # last /interview/transcribe or /interview/voice result...
+    voice_prosody: Prosody | None = None       # ...and its delivery features, consumed by the next answer
+    next_answer_id: int = 0                    # ids keep counting after old answers are trimmed
+
+    def record_answer(self, record: AnswerRecord, score: int) -> None:
+        """Append one answer, keeping only the last MAX_HISTORY."""
+        record.id = self.next_answer_id
+        self.next_answer_id += 1
+        self.answers.append(record)
+        self.scores.append(score)
+        if len(self.answers) > MAX_HISTORY:
+            del self.answers[:-MAX_HISTORY]
+            del self.scores[:-MAX_HISTORY]
+
+    def answer_position(self, answer_id: int) -> int | None:
+        """Index in `answers` of the answer with this id (-1: the latest), or None once trimmed."""
+        if answer_id == -1:
+            return len(self.answers) - 1 if self.answers else None
+        for pos in range(len(self.answers) - 1, -1, -1):
+            if self.answers[pos].id == answer_id:
+                return pos
+        return None
+
+    # ── Derived, read-only views (legacy dict keys) ───────────────────────────
+
+    @property
+    def qa_pairs(self) -> tuple[dict, ...]:
+        return tuple(r.to_dict(s) for r, s in zip(self.answers, self.scores))
+
+    @property
+    def answers_given(self) -> tuple[str, ...]:
+        return tuple(r.answer for r in self.answers)
+
+    @property
+    def feedback_received(self) -> tuple[str, ...]:
+        return tuple(r.feedback for r in self.answers)
+
+    @property
+    def scores_10(self) -> tuple[int, ...]:
+        return tuple(self.scores)
+
+    @property
+    def analysis_history(self) -> tuple[dict, ...]:
+        return tuple(analysis_to_dict(r.analysis) for r in self.answers if r.analysis is not None)
+
+    def to_dict(self) -> dict:
+        """Public session state for the API. Never includes the API key."""
+        return {
+            "provider": self.provider,
+            "domain": self.domain,
+            "model": self.model,
+            "difficulty": self.difficulty,
+            "topics": list(self.topics),
+            "company_track": self.company_track,
+            "interview_type": self.interview_type,
+            "pressure_level": self.pressure_level,
+            "current_question": self.current_question,
+            "questions_asked": list(self.questions_asked),
+            "qa_pairs": list(self.qa_pairs),
+            "weak_areas": self.weak_areas,
+            "last_score_10": self.last_score_10,
+            "soul_profile": self.soul_profile.to_dict(),
+        }
+
+
+_DERIVED = ("qa_pairs", "answers_given", "feedback_received", "scores_10", "analysis_history")
+SoulProfile._keys = tuple(f.name for f in fields(SoulProfile))
+InterviewSession._keys = tuple(f.name for f in fields(InterviewSession)) + _DERIVED
@@ -0,0 +1,113 @@
+"""
+SimHash — near-duplicate detection for interview questions.
+
+Exact matching on normalized text lets paraphrases through ("What is a REST API
+and how does it work?" / "How does a REST API work?"). Comparing every new
+question against every asked one with a fuzzy metric is O(n) per check.
+
+Instead each question gets a 64-bit SimHash fingerprint over its content-word
+shingles (single words with stopwords and plural "s" dropped — word order is
+deliberately ignored, so reordered paraphrases collide). Similar questions get
+fingerprints a few bits apart. `SimHashIndex` finds any stored fingerprint
+within Hamming distance k of a new one without scanning: it splits fingerprints
+into k + 1 bands, and by pigeonhole two fingerprints within k bits agree exactly
+on at least one band, so only entries sharing a band value are compared.
+
+The threshold comes from `settings.simhash_threshold` (0 = exact fingerprint
+match only).
+"""
+
+from __future__ import annotations
+import hashlib
+import re
+import threading
+from functools import lru_cache
+
+from .config import settings
+
+BITS = 64
+_MASK = (1 << BITS) - 1
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+_STOPWORDS = frozenset("""
+    a an the and or but of to in on at for with by from as is are was were be been being
+    do does did how what why when where which who whom this that these those it its you your
+    i me my we our can could would should will shall may might must please describe explain
+    tell about give some any there their them they he she his her if then than so such
+""".split())
+
+
+@lru_cache(maxsize=16384)
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _shingles(text: str) -> list[str]:
+    words = [w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+    return [w[:-1] if len(w) > 3 and w.endswith("s") and not w.endswith("ss") else w for w in words]
+
+
+@lru_cache(maxsize=16384)
+def fingerprint(text: str) -> int:
+    """64-bit SimHash of a question's content words."""
+    hashes = [_shingle_hash(s) for s in _shingles(text)]
+    half = len(hashes) / 2
+    fp = 0
+    for bit in range(BITS):
+        if sum((h >> bit) & 1 for h in hashes) > half:
+            fp |= 1 << bit
+    return fp
+
+
+def distance(a: int, b: int) -> int:
+    return ((a ^ b) & _MASK).bit_count()
+
+
+class SimHashIndex:
+    """Banded lookup of fingerprints within `threshold` bits of each other."""
+
+    __slots__ = ("threshold", "_bands", "_tables", "_lock")
+
+    def __init__(self, threshold: int | None = None):
+        k = settings.simhash_threshold if threshold is None else threshold
+        self.threshold = max(0, min(int(k), 31))
+        n = self.threshold + 1
+        width, extra = divmod(BITS, n)
+        bands, shift = [], 0
+        for i in range(n):
+            w = width + (1 if i < extra else 0)
+            bands.append((shift, (1 << w) - 1))
+            shift += w
+        self._bands: tuple[tuple[int, int], ...] = tuple(bands)
+        self._tables: list[dict[int, list[int]]] = [{} for _ in bands]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(fps) for fps in self._tables[0].values())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SimHashIndex):
+            return NotImplemented
+        return self.threshold == other.threshold and sorted(self) == sorted(other)
+
+    def __iter__(self):
+        for fps in self._tables[0].values():
+            yield from fps
+
+    def add(self, fp: int) -> None:
+        with self._lock:
+            if self._tables[0].get(fp & self._bands[0][1], ()).count(fp):
+                return
+            for (shift, mask), table in zip(self._bands, self._tables):
+                table.setdefault((fp >> shift) & mask, []).append(fp)
+
+    def nearest(self, fp: int) -> int | None:
+        """A stored fingerprint within the threshold of `fp`, or None."""
+        for (shift, mask), table in zip(self._bands, self._tables):
+            for other in table.get((fp >> shift) & mask, ()):
+                if distance(fp, other) <= self.threshold:
+                    return other
+        return None
+
+    def __contains__(self, fp: int) -> bool:
+        return self.nearest(fp) is not None
@@ -11,34 +11,24 @@ Responsibilities:
 from __future__ import annotations
 import json
 import re
+from array import array
 from typing import Any
 
+from . import json_stream
+from .session_model import SoulProfile
+
 # ─── User Profile ────────────────────────────────────────────────────────────
 
-def default_profile(domain: str, topics: list[str] | None = None) -> dict:
-    return {
-        "domain": domain,
-        "topics": topics or [domain],
-        "skill_level": "unknown",   # unknown → beginner / intermediate / advanced
-        "confidence": 5,            # 1-10
-        "scores": [],               # list of ints (0-10) per question
-        "weakness_areas": [],       # topics where score < 5
-        "strength_areas": [],       # topics where score >= 8
-        "question_count": 0,
-        "document_context": "",     # extracted text from uploaded files
-        "topic_scores": {},         # {"Python": [7,4,9], "DSA": [3,6]}
-        "current_difficulty": "basic",
-        "consecutive_correct": 0,
-        "consecutive_wrong": 0,
-    }
+def default_profile(domain: str, topics: list[str] | None = None) -> SoulProfile:
+    return SoulProfile(domain=domain, topics=topics or [domain])
 
-def update_profile(profile: dict, score_10: int, topic: str | None = None) -> dict:
+def update_profile(profile: SoulProfile, score_10: int, topic: str | None = None) -> SoulProfile:
     """Update profile after each answered question."""
     profile["scores"].append(score_10)
     profile["question_count"] += 1
 
     t = topic or profile["domain"]
-    profile["topic_scores"].setdefault(t, []).append(score_10)
+    profile["topic_scores"].setdefault(t, array("b")).append(score_10)
 
     # Track streaks
     if score_10 >= 7:
@@ -104,8 +94,15 @@ def build_question_prompt(
     last_answer_word_count: int | None = None,
     company_track: dict | None = None,
     pressure_level: str = "none",
+    batch_size: int = 1,
+    question_types: tuple[str, ...] = (),
 ) -> str:
-    """Build a sharp, personality-driven prompt that generates the next adaptive question."""
+    """Build a sharp, personality-driven prompt that generates the next adaptive question.
+
+    With `batch_size` > 1 the prompt asks for that many candidate questions as a
+    JSON array of {"type", "question"} objects spread across `question_types`
+    (see parse_question_batch_json).
+    """
     skill = profile.get("skill_level", "unknown")
     difficulty = profile.get("current_difficulty", "basic")
     domain = profile.get("domain", "General")
@@ -217,46 +214,100 @@ Candidate snapshot:
 - Skill level: {skill} | Difficulty: {difficulty}
 - Question #{question_number} | Last score: {last_score if last_score is not None else 'N/A'}/10
 {weakness_hint}{strength_hint}{memory_section}{doc_section}
-Interviewer behavior for THIS question:
+Interviewer behavior for {"THIS question" if batch_size <= 1 else "the next question"}:
 {reaction}{emotional_note}{pressure_note}{company_note}
 
-Generate exactly ONE interview question. Rules:
+{_question_rules(domain, difficulty, batch_size, question_types)}"""
+
+
+def _question_rules(domain: str, difficulty: str, batch_size: int, question_types: tuple[str, ...]) -> str:
+    if batch_size <= 1:
+        return f"""Generate exactly ONE interview question. Rules:
 1. Match {difficulty} difficulty for {domain}.
 2. Sound like a real person talking — natural, direct, no textbook language.
 3. Vary types: conceptual → practical → scenario → edge case (don't repeat same type twice in a row).
 4. Output ONLY the question text. No preamble, no labels, no explanation.
+"""
+    types = ", ".join(question_types) or "conceptual, practical, scenario"
+    return f"""Generate exactly {batch_size} different interview questions this candidate could be asked next. Rules:
+1. Match {difficulty} difficulty for {domain}.
+2. Spread them across these types: {types}. Label each with its type.
+3. Sound like a real person talking — natural, direct, no textbook language.
+4. Each question must stand on its own — never refer to the other questions.
+5. Output ONLY a JSON array, no preamble:
+[{{"type": "<one of: {types}>", "question": "<question text>"}}]
 """
 
 
-def build_evaluation_prompt(question: str, answer: str, profile: dict, company_track: dict | None = None) -> str:
-    """Build a sharp, personality-driven evaluation prompt."""
-    skill = profile.get("skill_level", "unknown")
-    domain = profile.get("domain", "General")
-    confidence = profile.get("confidence", 5)
+def _evaluator_mode(profile: dict) -> str:
+    """Evaluator personality based on running performance."""
     scores = profile.get("scores", [])
     last_few = scores[-3:] if scores else []
-
-    # Determine evaluator personality based on running performance
     if last_few and (sum(last_few) / len(last_few)) >= 8:
-        evaluator_mode = (
+        return (
             "The candidate is performing well. Be demanding in your feedback — "
             "acknowledge what's correct briefly, then immediately point out what's still missing or could be deeper. "
             "Your short_verdict should feel like: 'Good start, but you missed X.' or 'Correct — now what about edge case Y?' "
             "Never be effusive or over-praise."
         )
-    elif last_few and (sum(last_few) / len(last_few)) <= 4:
-        evaluator_mode = (
+    if last_few and (sum(last_few) / len(last_few)) <= 4:
+        return (
             "The candidate is struggling. Be calm, direct, and constructive — not harsh. "
             "Clearly identify the gap without making them feel stupid. "
             "Your short_verdict should feel like: 'That's not quite right — the key issue is...' "
             "Focus feedback on one fixable thing, not a list of failures."
         )
-    else:
-        evaluator_mode = (
-            "Balanced performance so far. Give honest, specific feedback. "
-            "Acknowledge what's right, explain what's missing. "
-            "Your short_verdict should feel like a real interviewer's note: precise, not generic."
+    return (
+        "Balanced performance so far. Give honest, specific feedback. "
+        "Acknowledge what's right, explain what's missing. "
+        "Your short_verdict should feel like a real interviewer's note: precise, not generic."
+    )
+
+
+def _company_eval_note(company_track: dict | None) -> str:
+    if not company_track:
+        return ""
+    name = company_track.get("name", "")
+    if name == "Amazon":
+        return (
+            "\nAMAZON EVALUATION: Check if the answer implicitly or explicitly reflects a Leadership Principle "
+            "(e.g., Ownership, Bias for Action, Customer Obsession). If absent, note it in improvement_tip."
+        )
+    if name == "Google":
+        return (
+            "\nGOOGLE EVALUATION: Penalize answers that skip time/space complexity analysis. "
+            "Reward clean reasoning, scalability thinking, and clarity of solution."
         )
+    if "Startup" in name:
+        return (
+            "\nSTARTUP EVALUATION: Value practical, shipping-minded answers. "
+            "Don't penalize for skipping theoretical depth — reward speed of thinking and ownership mindset."
+        )
+    if "Consulting" in name or "Behavioral" in name:
+        return (
+            "\nCONSULTING/BEHAVIORAL EVALUATION: Score heavily on STAR structure. "
+            "Penalize vague or generic answers. Reward concrete metrics and clear narrative."
+        )
+    return ""
+
+
+def build_evaluation_prompt(
+    question: str,
+    answer: str,
+    profile: dict,
+    company_track: dict | None = None,
+    next_question_number: int | None = None,
+    pressure_level: str = "none",
+) -> str:
+    """Build a sharp, personality-driven evaluation prompt.
+
+    With `next_question_number` the same call also writes the next question
+    (see build_turn_prompt).
+    """
+    skill = profile.get("skill_level", "unknown")
+    domain = profile.get("domain", "General")
+    confidence = profile.get("confidence", 5)
+    evaluator_mode = _evaluator_mode(profile)
 
     word_count = len(answer.split())
     length_note = ""
@@ -265,29 +316,12 @@ def build_evaluation_prompt(question: str, answer: str, profile: dict, company_t
     elif word_count > 300:
         length_note = "Note: Answer is long. Reward depth if it's substantive; penalize padding and circular reasoning."
 
-    company_eval_note = ""
-    if company_track:
-        name = company_track.get("name", "")
-        if name == "Amazon":
-            company_eval_note = (
-                "\nAMAZON EVALUATION: Check if the answer implicitly or explicitly reflects a Leadership Principle "
-                "(e.g., Ownership, Bias for Action, Customer Obsession). If absent, note it in improvement_tip."
-            )
-        elif name == "Google":
-            company_eval_note = (
-                "\nGOOGLE EVALUATION: Penalize answers that skip time/space complexity analysis. "
-                "Reward clean reasoning, scalability thinking, and clarity of solution."
-            )
-        elif "Startup" in name:
-            company_eval_note = (
-                "\nSTARTUP EVALUATION: Value practical, shipping-minded answers. "
-                "Don't penalize for skipping theoretical depth — reward speed of thinking and ownership mindset."
-            )
-        elif "Consulting" in name or "Behavioral" in name:
-            company_eval_note = (
-                "\nCONSULTING/BEHAVIORAL EVALUATION: Score heavily on STAR structure. "
-                "Penalize vague or generic answers. Reward concrete metrics and clear narrative."
-            )
+    company_eval_note = _company_eval_note(company_track)
+    next_fields = next_rules = ""
+    if next_question_number is not None:
+        next_fields = (',\n  "next_kind": "<followup or new — see below>",'
+                       '\n  "next_question": "<your next question to the candidate>"')
+        next_rules = _next_question_rules(profile, next_question_number, pressure_level)
 
     return f"""You are a senior technical interviewer with high standards and a direct personality.
 You give honest, specific evaluations — not generic praise or boilerplate criticism.
@@ -310,7 +344,7 @@ Respond in this EXACT JSON structure (nothing outside the JSON):
   "detailed_feedback": "<2-3 sentences: what was right, what was missing, what the ideal answer hits — specific, no filler>",
   "correct_answer_hint": "<key points of the ideal answer — bullet-point style if multiple>",
   "improvement_tip": "<one specific thing to practice — not 'study more', give exact topic/exercise>",
-  "topic_tag": "<precise sub-topic tested, e.g. 'Time Complexity', 'CAP Theorem', 'System Design - Caching'>"
+  "topic_tag": "<precise sub-topic tested, e.g. 'Time Complexity', 'CAP Theorem', 'System Design - Caching'>"{next_fields}
 }}
 
 Scoring:
@@ -318,6 +352,121 @@ Scoring:
 - 4-6: Partial — correct direction but missing depth, examples, or key points
 - 7-8: Good — covers the main points with minor gaps
 - 9-10: Excellent — comprehensive, specific, shows real depth
+{next_rules}"""
+
+
+def build_quick_evaluation_prompt(question: str, answer: str, profile: dict, company_track: dict | None = None) -> str:
+    """Score-only evaluation with one-letter keys — a few dozen output tokens.
+
+    The long feedback is written later, only if the candidate asks for it
+    (build_detail_prompt).
+    """
+    word_count = len(answer.split())
+    length_note = ""
+    if word_count < 20:
+        length_note = "Note: very short answer — brevity without substance scores lower."
+    elif word_count > 300:
+        length_note = "Note: long answer — reward depth, penalize padding."
+
+    return f"""You are a senior interviewer with high standards. Grade this answer.
+
+Domain: {profile.get("domain", "General")} | Skill level: {profile.get("skill_level", "unknown")}
+Question: {question}
+Answer: {answer}
+{length_note}{_company_eval_note(company_track)}
+Scoring: 0-3 misses the core concept; 4-6 right direction, missing depth; 7-8 main points, minor gaps; 9-10 comprehensive and specific.
+
+Reply with ONLY this JSON:
+{{"s": <integer 0-10>, "v": "<one-sentence verdict on THIS answer, max 15 words>", "t": "<precise sub-topic tested>"}}"""
+
+
+def build_detail_prompt(question: str, answer: str, profile: dict, score: int, short_verdict: str = "") -> str:
+    """The long-form feedback for an answer that build_quick_evaluation_prompt already scored."""
+    verdict = f' ("{short_verdict}")' if short_verdict else ""
+    return f"""You are a senior interviewer giving a candidate honest, specific feedback — not generic praise or boilerplate criticism.
+
+Domain: {profile.get("domain", "General")} | Skill level: {profile.get("skill_level", "unknown")}
+Question asked: {question}
+Candidate's answer: {answer}
+You scored it {score}/10{verdict}.
+
+Respond in this EXACT JSON structure (nothing outside the JSON):
+{{
+  "detailed_feedback": "<2-3 sentences: what was right, what was missing, what the ideal answer hits — specific, no filler>",
+  "correct_answer_hint": "<key points of the ideal answer — bullet-point style if multiple>",
+  "improvement_tip": "<one specific thing to practice — not 'study more', give exact topic/exercise>"
+}}"""
+
+
+def build_turn_prompt(
+    question: str,
+    answer: str,
+    profile: dict,
+    question_number: int,
+    company_track: dict | None = None,
+    pressure_level: str = "none",
+) -> str:
+    """Evaluate `answer` and write question #`question_number` in one call (see parse_turn_json)."""
+    return build_evaluation_prompt(question, answer, profile, company_track,
+                                   next_question_number=question_number, pressure_level=pressure_level)
+
+
+def _next_question_rules(profile: dict, question_number: int, pressure_level: str) -> str:
+    difficulty = profile.get("current_difficulty", "basic")
+    domain = profile.get("domain", "General")
+    pressure = {
+        "high": "\n- PRESSURE MODE: HIGH — be demanding; add time urgency ('You have 60 seconds — go.').",
+        "moderate": "\n- PRESSURE MODE: MODERATE — keep a brisk pace; you may add a constraint ('Answer in under 3 sentences.').",
+    }.get(pressure_level, "")
+    return f"""
+Then write your NEXT question (#{question_number}, {difficulty} difficulty for {domain}), based on the score you gave:
+- below 6: "next_kind": "followup" — probe the specific gap in THIS answer with a narrower, more foundational question. Be patient.
+- 6-7: "next_kind": "new" — move forward and probe the weak spot this answer revealed. Be direct, not harsh.
+- 8 or more: "next_kind": "new" — acknowledge briefly, then raise the stakes: edge cases, failure modes, a harder variant.
+- Sound like a real person talking. next_question is only the question text — no labels — and never repeats the question above.{pressure}
+"""
+
+def build_batch_evaluation_prompt(pairs: list[tuple[str, str]], profile: dict, company_track: dict | None = None) -> str:
+    """Evaluate several (question, answer) pairs in one prompt — rapid-fire mode.
+
+    The model returns a JSON array with one evaluation object per pair, in
+    order (see parse_batch_evaluation_json).
+    """
+    skill = profile.get("skill_level", "unknown")
+    domain = profile.get("domain", "General")
+    confidence = profile.get("confidence", 5)
+    items = "\n\n".join(
+        f"[{i}] Question: {q}\n[{i}] Candidate's answer: {a}" for i, (q, a) in enumerate(pairs, 1)
+    )
+    return f"""You are a senior technical interviewer with high standards and a direct personality.
+This was a timed rapid-fire round: short answers are expected, so judge correctness and precision, not length.
+
+Domain: {domain} | Skill level: {skill} | Confidence: {confidence}/10
+{_company_eval_note(company_track)}
+Evaluator mode: {_evaluator_mode(profile)}
+
+{items}
+
+Evaluate each of the {len(pairs)} answers independently. Respond with ONLY a JSON array of {len(pairs)} objects,
+in the same order as the questions (nothing outside the JSON):
+[
+  {{
+    "index": <question number>,
+    "score": <integer 0-10>,
+    "is_correct": <true or false>,
+    "short_verdict": "<1 sentence in interviewer voice — specific to THIS answer>",
+    "detailed_feedback": "<1-2 sentences: what was right, what was missing>",
+    "correct_answer_hint": "<key points of the ideal answer>",
+    "improvement_tip": "<one specific thing to practice>",
+    "topic_tag": "<precise sub-topic tested>"
+  }}
+]
+
+Scoring:
+- 0-3: Missing the core concept entirely
+- 4-6: Partial — correct direction but missing key points
+- 7-8: Good — covers the main points with minor gaps
+- 9-10: Excellent — precise and complete
 """
 
 
@@ -374,13 +523,20 @@ Day 1 should be the weakest area. Day 7 should be a full mock interview challeng
 
 
 def parse_evaluation_json(raw: str) -> dict:
-    """Safely parse the AI's JSON evaluation response."""
+    """Safely parse the AI's JSON evaluation response.
+
+    A response cut off mid-object (max_tokens) keeps every field that was
+    complete, over the defaults, as long as the score made it.
+    """
     try:
         match = re.search(r'\{.*\}', raw, re.DOTALL)
         if match:
             return json.loads(match.group())
     except Exception:
         pass
+    partial = json_stream.parse_partial(raw)
+    if "score" in partial:
+        return {**parse_evaluation_json(""), **partial}
     return {
         "score": 5,
         "is_correct": True,
@@ -392,6 +548,121 @@ def parse_evaluation_json(raw: str) -> dict:
     }
 
 
+_QUICK_KEYS = {"s": "score", "v": "short_verdict", "t": "topic_tag"}
+
+
+def parse_quick_evaluation_json(raw: str) -> dict:
+    """Expand a build_quick_evaluation_prompt reply to the usual evaluation keys.
+
+    The feedback fields are left empty — they are filled in on demand.
+    """
+    data = json_stream.parse_partial(raw or "")
+    if "s" not in data and "score" not in data:
+        data = {"s": 5, "v": "Could not parse evaluation.", "t": "General"}
+    result = {long: data.get(short, data.get(long)) for short, long in _QUICK_KEYS.items()}
+    try:
+        result["score"] = max(0, min(10, int(result["score"])))
+    except (TypeError, ValueError):
+        result["score"] = 5
+    result["short_verdict"] = str(result["short_verdict"] or "")
+    result["topic_tag"] = str(result["topic_tag"] or "General")
+    result["is_correct"] = result["score"] >= 7
+    result.update(detailed_feedback="", correct_answer_hint="", improvement_tip="")
+    return result
+
+
+def parse_detail_json(raw: str) -> dict:
+    """detailed_feedback / correct_answer_hint / improvement_tip from a build_detail_prompt reply."""
+    data = json_stream.parse_partial(raw or "")
+    return {
+        "detailed_feedback": str(data.get("detailed_feedback") or (raw or "")[:500] or "No feedback available."),
+        "correct_answer_hint": str(data.get("correct_answer_hint") or ""),
+        "improvement_tip": str(data.get("improvement_tip") or "Review the topic and try again."),
+    }
+
+
+def parse_turn_json(raw: str) -> tuple[dict, tuple[str, str] | None]:
+    """Split a build_turn_prompt response into (evaluation, (next_kind, next_question) or None)."""
+    data = parse_evaluation_json(raw)
+    question = data.pop("next_question", None)
+    kind = data.pop("next_kind", None)
+    if not isinstance(question, str) or not question.strip():
+        return data, None
+    return data, ("followup" if kind == "followup" else "new", question.strip())
+
+
+def parse_batch_evaluation_json(raw: str, count: int) -> list[dict]:
+    """Parse a rapid-fire batch evaluation into exactly `count` evaluations, in order.
+
+    Items are matched by their "index" when present, else by position; any pair
+    the model skipped gets the same fallback as parse_evaluation_json("").
+    """
+    cleaned = (raw or '').strip()
+    if cleaned.startswith('```'):
+        cleaned = re.sub(r'^```[a-z]*\n?', '', cleaned)
+        cleaned = re.sub(r'\n?```$', '', cleaned).strip()
+    items = None
+    try:
+        items = json.loads(cleaned)
+    except Exception:
+        match = re.search(r'\[.*\]', cleaned, re.DOTALL)
+        if match:
+            try:
+                items = json.loads(match.group())
+            except Exception:
+                items = None
+    if isinstance(items, dict):
+        items = items.get("evaluations")
+    results: list[dict | None] = [None] * count
+    for pos, item in enumerate(items if isinstance(items, list) else []):
+        if not isinstance(item, dict):
+            continue
+        idx = item.get("index")
+        slot = idx - 1 if isinstance(idx, int) and 1 <= idx <= count else pos
+        if slot < count and results[slot] is None:
+            results[slot] = item
+    return [r if r is not None else parse_evaluation_json("") for r in results]
+
+
+def parse_question_batch_json(raw: str, question_types: tuple[str, ...] = ()) -> list[tuple[str | None, str]]:
+    """Parse a batch of candidate questions into (type, question) pairs.
+
+    Tolerates markdown fences, bare strings instead of objects, and unknown
+    types (returned as None). Returns [] when nothing usable is found.
+    """
+    cleaned = (raw or '').strip()
+    if cleaned.startswith('```'):
+        cleaned = re.sub(r'^```[a-z]*\n?', '', cleaned)
+        cleaned = re.sub(r'\n?```$', '', cleaned).strip()
+    items = None
+    try:
+        items = json.loads(cleaned)
+    except Exception:
+        match = re.search(r'\[.*\]', cleaned, re.DOTALL)
+        if match:
+            try:
+                items = json.loads(match.group())
+            except Exception:
+                items = None
+    if isinstance(items, dict):
+        items = items.get("questions")
+    if not isinstance(items, list):
+        return []
+    out = []
+    for item in items:
+        if isinstance(item, str):
+            qtype, text = None, item
+        elif isinstance(item, dict):
+            qtype, text = item.get("type"), item.get("question")
+        else:
+            continue
+        if not isinstance(text, str) or not text.strip():
+            continue
+        qtype = qtype.strip().lower() if isinstance(qtype, str) else None
+        out.append((qtype if qtype in question_types else None, text.strip()))
+    return out
+
+
 def parse_growth_plan_json(raw: str) -> dict:
     """Safely parse the AI's JSON growth plan response (handles markdown fences)."""
     # Strip markdown code fences
@@ -9,12 +9,16 @@ Analyzes written/transcribed answers for:
 - Confidence language indicators
 - Sentence clarity score
 - Answer length appropriateness
+- Delivery from the answer's audio when it was spoken (pace, pauses, pitch
+  variation — see prosody.py)
 """
 
 from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 
+from .prosody import Prosody
+
 FILLER_WORDS = {
     "um", "uh", "uhh", "umm", "er", "err", "ah", "ahh",
     "like", "basically", "literally", "actually", "honestly",
@@ -53,7 +57,7 @@ STAR_KEYWORDS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerAnalysis:
     word_count: int = 0
     filler_words_found: list[str] = field(default_factory=list)
@@ -71,10 +75,17 @@ class AnswerAnalysis:
     estimated_wpm: int = 0
     answer_length_verdict: str = ""    # "too short" | "good" | "too long"
     tips: list[str] = field(default_factory=list)
+    # Delivery — only set for spoken answers (prosody.extract on the recording)
+    speaking_sec: float = 0.0
+    pause_ratio: float = 0.0           # share of the answer spent in pauses ≥ 0.3 s
+    pause_count: int = 0
+    longest_pause_sec: float = 0.0
+    syllables_per_sec: float = 0.0
+    pitch_std_hz: float = 0.0          # low = monotone
 
 
-def analyze(text: str, question_type: str = "general", time_taken_sec: int = 0) -> AnswerAnalysis:
-    """Full analysis of a text answer."""
+def analyze(text: str, question_type: str = "general", time_taken_sec: float = 0, prosody: Prosody | None = None) -> AnswerAnalysis:
+    """Full analysis of a text answer; `prosody` adds delivery metrics for a spoken one."""
     if not text or not text.strip():
         return AnswerAnalysis(tips=["Your answer was empty. Please provide a response."])
 
@@ -83,6 +94,15 @@ def analyze(text: str, question_type: str = "general", time_taken_sec: int = 0)
     words = _tokenize(lower)
     result.word_count = len(words)
 
+    if prosody is not None:
+        time_taken_sec = time_taken_sec or prosody.duration_sec
+        result.speaking_sec = prosody.speaking_sec
+        result.pause_ratio = prosody.pause_ratio
+        result.pause_count = prosody.pause_count
+        result.longest_pause_sec = prosody.longest_pause_sec
+        result.syllables_per_sec = prosody.syllables_per_sec
+        result.pitch_std_hz = prosody.pitch_std_hz
+
     # Words per minute
     if time_taken_sec > 10:
         result.estimated_wpm = round((result.word_count / time_taken_sec) * 60)
@@ -183,6 +203,14 @@ def analyze(text: str, question_type: str = "general", time_taken_sec: int = 0)
     if result.filler_rate > 8:
         top_fillers = result.filler_words_found[:3]
         tips.append(f"High filler word usage ({result.filler_rate}%). Common ones: {', '.join(top_fillers)}. Practice pausing instead of saying these.")
+    if result.estimated_wpm > 170:
+        tips.append(f"You spoke at about {result.estimated_wpm} words per minute. Slow down to 130-160 so key points land.")
+    elif prosody is not None and 0 < result.estimated_wpm < 100:
+        tips.append(f"Your pace was about {result.estimated_wpm} words per minute. Aim for 130-160 to sound more assured.")
+    if result.longest_pause_sec >= 4:
+        tips.append(f"You paused for {result.longest_pause_sec:.0f}s at one point. Buy thinking time out loud: 'Let me structure this in three parts...'.")
+    if prosody is not None and 0 < result.pitch_std_hz < 12:
+        tips.append("Your delivery was quite monotone. Vary your pitch to stress the key point of each sentence.")
     if result.weak_language_found:
         tips.append(f"Replace weak phrases like '{result.weak_language_found[0]}' with confident statements. Own your answers.")
     if not result.strong_language_found:
@@ -219,4 +247,10 @@ def to_dict(a: AnswerAnalysis) -> dict:
         "estimated_wpm": a.estimated_wpm,
         "answer_length_verdict": a.answer_length_verdict,
         "tips": a.tips,
+        "speaking_sec": a.speaking_sec,
+        "pause_ratio": a.pause_ratio,
+        "pause_count": a.pause_count,
+        "longest_pause_sec": a.longest_pause_sec,
+        "syllables_per_sec": a.syllables_per_sec,
+        "pitch_std_hz": a.pitch_std_hz,
     }
@@ -0,0 +1,212 @@
+"""
+SSE — framing and coalescing for the token-streaming endpoints.
+
+Providers stream a few characters per chunk. Writing each chunk as its own
+`data:` frame means hundreds of tiny socket writes per answer and as many
+React re-renders on the client, for text that arrives faster than anyone reads.
+
+The streaming routes yield plain text chunks and `control()` messages. `batch()`
+merges the text, and `coalesce()` renders the result as SSE frames (the
+/interview/session WebSocket renders the same batches as JSON messages):
+
+- text chunks are buffered and written as one JSON-string frame once the buffer
+  reaches `settings.sse_coalesce_bytes`, or `settings.sse_coalesce_ms` after the
+  first buffered chunk arrived — a stalled provider never holds text back longer
+  than that window;
+- control messages ([META], [DONE], [ERROR]) flush the buffer and go out
+  immediately, unbatched, so their order relative to the text is unchanged.
+
+`sse_coalesce_ms = 0` writes one frame per chunk, as before.
+
+Resumable streams: a `StreamLog` runs one generation as its own task, numbers
+its frames (`id: <log key>:<n>`) and keeps the last `settings.sse_replay_frames`
+of them. Responses only follow the log, so a client that reconnects with
+`Last-Event-ID` gets exactly the frames it missed — or keeps following a
+generation that is still running — without a second LLM call. A generation
+nobody follows is cancelled after `settings.sse_resume_grace_sec`.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from .config import settings
+
+HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+@dataclass(frozen=True, slots=True)
+class Control:
+    """A control message ([META], [DONE], [ERROR]); never merged with text."""
+    kind: str
+    payload: str = ""
+
+    def frame(self) -> str:
+        return f"data: [{self.kind}]{self.payload}\n\n"
+
+
+def control(kind: str, payload: str = "") -> Control:
+    return Control(kind, payload)
+
+
+def text_frame(text: str) -> str:
+    return f"data: {json.dumps(text)}\n\n"
+
+
+async def coalesce(source: AsyncIterator, max_bytes: int | None = None,
+                   max_delay_ms: int | None = None) -> AsyncIterator[str]:
+    """SSE frames for a stream of text chunks and `Control` messages."""
+    batches = batch(source, max_bytes, max_delay_ms)
+    try:
+        async for item in batches:
+            yield item.frame() if isinstance(item, Control) else text_frame(item)
+    finally:
+        await batches.aclose()
+
+
+async def batch(source: AsyncIterator, max_bytes: int | None = None,
+                max_delay_ms: int | None = None) -> AsyncIterator:
+    """Merge runs of text chunks by the byte/time window; `Control` items pass through in order."""
+    max_bytes = settings.sse_coalesce_bytes if max_bytes is None else max_bytes
+    delay = (settings.sse_coalesce_ms if max_delay_ms is None else max_delay_ms) / 1000
+    it = source.__aiter__()
+    buf: list[str] = []
+    size = 0
+    deadline = 0.0
+    pending: asyncio.Future | None = None
+    try:
+        if delay <= 0:
+            async for item in it:
+                yield item
+            return
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(it.__anext__())
+            if buf:
+                # Wait for the next chunk only until the window closes; the
+                # pull itself keeps running and is picked up next iteration.
+                done, _ = await asyncio.wait({pending}, timeout=max(0.0, deadline - time.monotonic()))
+                if not done:
+                    yield "".join(buf)
+                    buf, size = [], 0
+                    continue
+            try:
+                item = await pending
+            except StopAsyncIteration:
+                break
+            finally:
+                if pending.done():
+                    pending = None
+            if isinstance(item, Control):
+                if buf:
+                    yield "".join(buf)
+                    buf, size = [], 0
+                yield item
+                continue
+            if not item:
+                continue
+            if not buf:
+                deadline = time.monotonic() + delay
+            buf.append(item)
+            size += len(item)
+            if size >= max_bytes:
+                yield "".join(buf)
+                buf, size = [], 0
+        if buf:
+            yield "".join(buf)
+    finally:
+        # Client went away mid-stream: stop the in-flight pull, then close the
+        # source so its own cleanup (closing the upstream response) runs.
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, Exception):
+                pass
+        aclose = getattr(it, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class StreamLog:
+    """One generation's numbered frames, with a bounded replay buffer."""
+    __slots__ = ("key", "fingerprint", "frames", "next_id", "done", "listeners", "task", "_changed")
+
+    def __init__(self, fingerprint: tuple = (), capacity: int | None = None):
+        self.key = uuid.uuid4().hex[:12]
+        self.fingerprint = fingerprint   # what was asked for; a repeat request attaches instead of regenerating
+        self.frames: deque[tuple[int, str]] = deque(maxlen=max(1, capacity or settings.sse_replay_frames))
+        self.next_id = 0
+        self.done = False
+        self.listeners = 0
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Event()
+
+    def start(self, frames: AsyncIterator[str]) -> None:
+        self.task = asyncio.ensure_future(self._run(frames))
+
+    async def _run(self, frames: AsyncIterator[str]) -> None:
+        try:
+            async for frame in frames:
+                self.frames.append((self.next_id, frame))
+                self.next_id += 1
+                self._wake()
+        finally:
+            await frames.aclose()
+            self.close()
+
+    def close(self) -> None:
+        self.done = True
+        self._wake()
+
+    def _wake(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def resume_point(self, last_event_id: str | None) -> int | None:
+        """The frame number a `Last-Event-ID` refers to, if it belongs to this log."""
+        key, _, n = (last_event_id or "").strip().partition(":")
+        return int(n) if key == self.key and n.isdigit() else None
+
+    async def follow(self, after: int = -1) -> AsyncIterator[str]:
+        """Frames numbered after `after`, tagged with their ids, until the generation ends."""
+        self.listeners += 1
+        n = after + 1
+        try:
+            while True:
+                changed = self._changed
+                first = self.frames[0][0] if self.frames else self.next_id
+                if n < first:
+                    # Fell out of the replay buffer: the client can't be brought up to date.
+                    yield control("ERROR", "Stream expired, please retry").frame()
+                    return
+                while n < self.next_id:
+                    first = self.frames[0][0]
+                    yield f"id: {self.key}:{n}\n{self.frames[n - first][1]}"
+                    n += 1
+                    if n < self.frames[0][0]:
+                        break
+                else:
+                    if self.done:
+                        return
+                    await changed.wait()
+        finally:
+            self.listeners -= 1
+            if not self.listeners and not self.done:
+                self._release()
+
+    def _release(self) -> None:
+        grace = settings.sse_resume_grace_sec
+        if grace <= 0:
+            self._abandon_if_idle()
+        else:
+            asyncio.get_running_loop().call_later(grace, self._abandon_if_idle)
+
+    def _abandon_if_idle(self) -> None:
+        if not self.listeners and not self.done and self.task is not None:
+            self.task.cancel()
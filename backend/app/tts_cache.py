@@ -0,0 +1,162 @@
+"""
+TTS Cache — content-addressed, size-bounded on-disk store of synthesized speech.
+
+The same text is spoken to many candidates: company-track and local bank
+questions, greetings, fallbacks. Synthesizing it again for every request costs a
+provider round trip and money, for bytes we already had.
+
+Audio is stored under `settings.tts_cache_dir` as `<key>.mp3`, where the key is a
+BLAKE2b hash of (model, voice, text) — the same input always maps to the same
+file, so the key doubles as a strong ETag. The cache is LRU by last use and is
+trimmed to `settings.tts_cache_max_mb`; the index is rebuilt from the directory
+(ordered by mtime) on first use, so it survives restarts. An empty directory
+setting disables caching.
+
+`get_or_create` is single-flight per key: a pre-synthesis running in the
+background and a candidate requesting the same question share one upstream call.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from .config import settings
+
+SUFFIX = ".mp3"
+
+
+def key(model: str, voice: str, text: str) -> str:
+    """Cache key (hex) for one synthesis request."""
+    raw = "\0".join((model, voice, text)).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def etag(k: str) -> str:
+    return f'"{k}"'
+
+
+class _Store:
+    __slots__ = ("root", "max_bytes", "_index", "_total", "_lock", "_inflight")
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._index: OrderedDict[str, int] = OrderedDict()   # key → size, least recently used first
+        self._total = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[str, threading.Lock] = {}
+        os.makedirs(root, exist_ok=True)
+        entries = []
+        for name in os.listdir(root):
+            if not name.endswith(SUFFIX):
+                continue
+            try:
+                st = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, name[: -len(SUFFIX)], st.st_size))
+        for _, k, size in sorted(entries):
+            self._index[k] = size
+            self._total += size
+        with self._lock:
+            self._evict()
+
+    def path(self, k: str) -> str:
+        return os.path.join(self.root, k + SUFFIX)
+
+    def get(self, k: str) -> str | None:
+        with self._lock:
+            if k not in self._index:
+                return None
+            self._index.move_to_end(k)
+        path = self.path(k)
+        try:
+            os.utime(path)   # recency survives a restart
+        except OSError:
+            with self._lock:
+                self._total -= self._index.pop(k, 0)
+            return None
+        return path
+
+    def put(self, k: str, data: bytes) -> str:
+        path = self.path(k)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self._total += len(data) - self._index.pop(k, 0)
+            self._index[k] = len(data)
+            self._evict(keep=k)
+        return path
+
+    def _evict(self, keep: str | None = None):
+        while self._total > self.max_bytes and self._index:
+            k, size = next(iter(self._index.items()))
+            if k == keep:
+                break
+            del self._index[k]
+            self._total -= size
+            try:
+                os.remove(self.path(k))
+            except OSError:
+                pass
+
+    def get_or_create(self, k: str, produce: Callable[[], bytes]) -> str | None:
+        path = self.get(k)
+        if path is not None:
+            return path
+        with self._lock:
+            flight = self._inflight.setdefault(k, threading.Lock())
+        with flight:
+            try:
+                path = self.get(k)   # filled while we waited
+                if path is not None:
+                    return path
+                data = produce()
+                return self.put(k, data) if data else None
+            finally:
+                with self._lock:
+                    self._inflight.pop(k, None)
+
+    def in_flight(self, k: str) -> bool:
+        """Whether get_or_create is currently producing `k`."""
+        return k in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+
+_store: _Store | None = None
+_store_guard = threading.Lock()
+
+
+def store() -> _Store | None:
+    """The cache for the configured directory, or None when caching is disabled."""
+    global _store
+    root = settings.tts_cache_dir
+    if not root:
+        return None
+    max_bytes = max(1, settings.tts_cache_max_mb) * 1024 * 1024
+    current = _store
+    if current is not None and current.root == root and current.max_bytes == max_bytes:
+        return current
+    with _store_guard:
+        if _store is None or _store.root != root or _store.max_bytes != max_bytes:
+            _store = _Store(root, max_bytes)
+        return _store
@@ -0,0 +1,93 @@
+"""
+TTS Stream — start playback before the whole text has been synthesized.
+
+A single tts-1 request for a long text only returns once the provider has
+rendered all of it, so the candidate waits for the last sentence before hearing
+the first. Instead the text is split at sentence boundaries into chunks —
+a short first chunk so audio starts quickly, larger ones after it — and:
+
+- the first chunk's audio is relayed byte-by-byte as the provider sends it;
+- meanwhile up to `settings.tts_parallel` following chunks are synthesized
+  concurrently on a small dedicated pool;
+- chunks are emitted strictly in order. MP3 is a sequence of self-contained
+  frames, so concatenated chunk files play as one stream.
+
+`synth` is any callable returning an iterator of audio bytes for one chunk
+(routes._synthesize_stream for OpenAI).
+"""
+
+from __future__ import annotations
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from .config import settings
+
+FIRST_CHUNK_CHARS = 160   # keep time-to-first-audio low
+CHUNK_CHARS = 600
+
+_SENTENCE = re.compile(r"(?<=[.!?;:])\s+")
+
+_pool = ThreadPoolExecutor(max_workers=max(1, settings.tts_parallel) * 4, thread_name_prefix="intervai-tts")
+
+
+def _wrap(sentence: str, limit: int) -> list[str]:
+    """Split a sentence longer than `limit` at word boundaries."""
+    if len(sentence) <= limit:
+        return [sentence]
+    pieces, cur = [], ""
+    for word in sentence.split():
+        if cur and len(cur) + 1 + len(word) > limit:
+            pieces.append(cur)
+            cur = word
+        else:
+            cur = f"{cur} {word}" if cur else word
+    if cur:
+        pieces.append(cur)
+    return pieces
+
+
+def split_text(text: str, first_max: int = FIRST_CHUNK_CHARS, max_chars: int = CHUNK_CHARS) -> list[str]:
+    """Sentence-aligned synthesis chunks: a short first one, then up to `max_chars` each."""
+    chunks: list[str] = []
+    cur = ""
+    for sentence in _SENTENCE.split((text or "").strip()):
+        for piece in _wrap(sentence, first_max if not chunks and not cur else max_chars):
+            limit = first_max if not chunks else max_chars
+            if cur and len(cur) + 1 + len(piece) > limit:
+                chunks.append(cur)
+                cur = piece
+            else:
+                cur = f"{cur} {piece}" if cur else piece
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def _collect(synth: Callable[[str], Iterator[bytes]], text: str) -> bytes:
+    return b"".join(synth(text))
+
+
+def stream(chunks: list[str], synth: Callable[[str], Iterator[bytes]], parallel: int | None = None) -> Iterator[bytes]:
+    """Audio for `chunks` in order: the first relayed as it arrives, the rest synthesized ahead in parallel."""
+    if not chunks:
+        return
+    ahead = max(1, settings.tts_parallel if parallel is None else parallel)
+    futures: dict[int, Future] = {}
+    submitted = 1
+
+    def submit_through(last: int):
+        nonlocal submitted
+        while submitted < len(chunks) and submitted <= last:
+            futures[submitted] = _pool.submit(_collect, synth, chunks[submitted])
+            submitted += 1
+
+    try:
+        submit_through(ahead)
+        yield from synth(chunks[0])
+        for i in range(1, len(chunks)):
+            submit_through(i + ahead)
+            yield futures.pop(i).result()
+    finally:
+        for f in futures.values():
+            f.cancel()
@@ -0,0 +1,108 @@
+"""
+VAD — server-side voice-activity detection for live voice answers.
+
+The live voice socket (/interview/voice) receives raw 16 kHz mono PCM as the
+candidate speaks. `VoiceActivityDetector` cuts that stream into utterances so
+each one can be transcribed while the candidate is still talking:
+
+- audio is processed in 20 ms frames; a frame is voiced when its RMS clears both
+  an absolute floor (`SPEECH_DB`) and a multiple of the running noise floor,
+  which adapts to the room during non-speech;
+- speech starts after `START_MS` of consecutive voiced frames; the `PRE_ROLL_MS`
+  before it is kept so soft word onsets aren't clipped;
+- an utterance ends after `END_MS` of silence (a natural pause), or is forced
+  out at `MAX_UTTERANCE_SEC` so a candidate who never pauses still gets
+  transcribed incrementally.
+
+Pure numpy, no model; cheap enough to run inline on the event loop per frame.
+"""
+
+from __future__ import annotations
+from collections import deque
+
+import numpy as np
+
+FRAME_MS = 20
+SPEECH_DB = -42            # absolute floor for a voiced frame (dBFS)
+NOISE_RATIO = 3.0          # ...and this many times the running noise RMS
+NOISE_ALPHA = 0.05         # noise floor EMA weight per silent frame
+START_MS = 60
+END_MS = 500
+PRE_ROLL_MS = 200
+MAX_UTTERANCE_SEC = 15
+
+
+class VoiceActivityDetector:
+    __slots__ = ("rate", "_frame", "_start", "_end", "_max", "_pending", "_pre", "_speech",
+                 "_voiced_run", "_silent_run", "_noise", "_floor")
+
+    def __init__(self, rate: int = 16000):
+        self.rate = rate
+        self._frame = rate * FRAME_MS // 1000
+        self._start = max(1, START_MS // FRAME_MS)
+        self._end = max(1, END_MS // FRAME_MS)
+        self._max = MAX_UTTERANCE_SEC * 1000 // FRAME_MS
+        self._floor = 10 ** (SPEECH_DB / 20)
+        self._noise = self._floor / NOISE_RATIO
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._pre: deque = deque(maxlen=max(1, PRE_ROLL_MS // FRAME_MS))
+        self._speech: list | None = None
+        self._voiced_run = 0
+        self._silent_run = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._speech is not None
+
+    def feed(self, samples) -> list:
+        """Add float32 samples; returns the utterances (sample arrays) completed by them."""
+        buf = np.concatenate((self._pending, np.asarray(samples, dtype=np.float32)))
+        n = len(buf) // self._frame
+        self._pending = buf[n * self._frame:]
+        if n == 0:
+            return []
+        frames = buf[: n * self._frame].reshape(n, self._frame)
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+        done = []
+        for frame, level in zip(frames, rms):
+            utterance = self._step(frame, float(level))
+            if utterance is not None:
+                done.append(utterance)
+        return done
+
+    def flush(self):
+        """End of stream: the utterance in progress, if any."""
+        if self._speech is None:
+            return None
+        if len(self._pending):
+            self._speech.append(self._pending)
+            self._pending = np.zeros(0, dtype=np.float32)
+        return self._emit()
+
+    def _step(self, frame, level: float):
+        voiced = level > max(self._floor, self._noise * NOISE_RATIO)
+        if self._speech is None:
+            self._pre.append(frame)
+            if voiced:
+                self._voiced_run += 1
+                if self._voiced_run >= self._start:
+                    self._speech = list(self._pre)
+                    self._pre.clear()
+                    self._silent_run = 0
+            else:
+                self._voiced_run = 0
+                self._noise += NOISE_ALPHA * (level - self._noise)
+            return None
+        self._speech.append(frame)
+        self._silent_run = 0 if voiced else self._silent_run + 1
+        if self._silent_run >= self._end or len(self._speech) >= self._max:
+            return self._emit()
+        return None
+
+    def _emit(self):
+        # Keep a little of the trailing pause, drop the rest.
+        keep = len(self._speech) - max(0, self._silent_run - self._pre.maxlen)
+        utterance = np.concatenate(self._speech[:keep])
+        self._speech = None
+        self._voiced_run = self._silent_run = 0
+        return utterance
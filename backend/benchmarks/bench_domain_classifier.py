@@ -0,0 +1,97 @@
+"""
+Domain classification over a few thousand free-text domains: the old keyword
+cascade (re-run per question) vs domain_classifier (cold, then memoized).
+
+    cd backend && python -m benchmarks.bench_domain_classifier
+"""
+
+from __future__ import annotations
+import random
+import time
+
+from app import domain_classifier
+
+DOMAINS = 4000
+
+_TITLES = (
+    "Software Engineer", "Backend Developer", "Frontend Engineer", "Full Stack Developer",
+    "Data Scientist", "Data Engineer", "Machine Learning Engineer", "DevOps Engineer",
+    "Site Reliability Engineer", "Cloud Architect", "Security Analyst", "Database Administrator",
+    "Product Manager", "Project Manager", "Business Analyst", "Management Consultant",
+    "Operations Manager", "Digital Marketing Specialist", "SEO Specialist", "Content Strategist",
+    "Brand Manager", "Sales Executive", "Social Media Manager", "Financial Analyst",
+    "Investment Banking Associate", "Accountant", "Tax Consultant", "Internal Auditor",
+    "HR Business Partner", "Talent Acquisition Specialist", "Recruiter", "UX Designer",
+    "UI/UX Designer", "Graphic Designer", "Product Designer", "Clinical Research Associate",
+    "Registered Nurse", "Healthcare Administrator", "Pharmaceutical Sales", "Corporate Lawyer",
+    "Compliance Officer", "Paralegal", "Teacher", "Chef", "Civil Engineer", "Retail Store Manager",
+)
+_PREFIXES = ("", "", "Senior ", "Junior ", "Lead ", "Staff ", "Principal ", "Associate ", "Sr. ")
+_SUFFIXES = ("", "", "", " II", " (Remote)", " - Fintech", " at a startup", " intern")
+
+
+def _typo(rng: random.Random, s: str) -> str:
+    if len(s) < 6 or rng.random() > 0.2:
+        return s
+    i = rng.randrange(1, len(s) - 1)
+    return s[:i] + s[i + 1:]
+
+
+def corpus(seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        _typo(rng, rng.choice(_PREFIXES) + rng.choice(_TITLES) + rng.choice(_SUFFIXES))
+        for _ in range(DOMAINS)
+    ]
+
+
+def legacy_category(domain: str) -> str:
+    """The cascade _generate_domain_specific_question ran on every local question."""
+    d = domain.lower()
+    for key in ("software engineering", "digital marketing", "financial analysis", "human resources", "ux/ui design"):
+        if key in d or any(word in d for word in key.split()):
+            break
+    if any(w in d for w in ['software', 'engineering', 'development', 'programming', 'tech', 'data', 'machine learning', 'ai', 'cloud', 'devops', 'cyber', 'security', 'database', 'system']):
+        return "tech"
+    if any(w in d for w in ['business', 'management', 'strategy', 'operations', 'consulting', 'product']):
+        return "business"
+    if any(w in d for w in ['marketing', 'sales', 'brand', 'content', 'social media', 'seo', 'advertising']):
+        return "marketing"
+    if any(w in d for w in ['finance', 'accounting', 'investment', 'banking', 'financial', 'audit', 'tax']):
+        return "finance"
+    if any(w in d for w in ['human resources', 'hr', 'talent', 'recruitment', 'organizational', 'training']):
+        return "hr"
+    if any(w in d for w in ['design', 'ux', 'ui', 'creative', 'graphic', 'web design', 'product design']):
+        return "design"
+    if any(w in d for w in ['healthcare', 'medical', 'clinical', 'pharmaceutical', 'biotech', 'health']):
+        return "healthcare"
+    if any(w in d for w in ['legal', 'compliance', 'regulatory', 'contract', 'intellectual property']):
+        return "legal"
+    return "generic"
+
+
+def _per_call_us(fn, domains) -> float:
+    start = time.perf_counter()
+    for d in domains:
+        fn(d)
+    return (time.perf_counter() - start) / len(domains) * 1e6
+
+
+def main():
+    domains = corpus()
+    legacy = _per_call_us(legacy_category, domains)
+    domain_classifier._classify_normalized.cache_clear()
+    domain_classifier._fuzzy.cache_clear()
+    cold = _per_call_us(domain_classifier.classify, domains)
+    warm = _per_call_us(domain_classifier.classify, domains)
+    generic_old = sum(legacy_category(d) == "generic" for d in domains)
+    generic_new = sum(domain_classifier.classify(d).category == "generic" for d in domains)
+    print(f"domains={len(domains)} unique={len(set(domains))}")
+    print(f"legacy cascade      : {legacy:6.2f} us/call (every question)")
+    print(f"classifier, cold    : {cold:6.2f} us/call")
+    print(f"classifier, memoized: {warm:6.2f} us/call (once per session at /interview/start)")
+    print(f"unclassified (generic): legacy {generic_old}, classifier {generic_new}")
+
+
+if __name__ == "__main__":
+    main()
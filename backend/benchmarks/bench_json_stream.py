@@ -0,0 +1,62 @@
+"""
+When does the score reach the client? Parsing the evaluation JSON at the end of
+the stream (the old path) vs json_stream.ObjectStream over the chunks, for a
+provider streaming ~4-character chunks every 25 ms; plus the parser's own cost.
+
+    cd backend && python -m benchmarks.bench_json_stream
+"""
+
+from __future__ import annotations
+import json
+import time
+
+from app import json_stream, soul_engine
+
+CHUNK_CHARS = 4
+CHUNK_INTERVAL_MS = 25
+RUNS = 2000
+
+EVALUATION = json.dumps({
+    "score": 6,
+    "is_correct": True,
+    "short_verdict": "Right idea, but you skipped how the cache is invalidated.",
+    "detailed_feedback": "You correctly put a read-through cache in front of the orders table and sized the TTL. "
+                         "What was missing is invalidation on writes: without it, customers see stale totals "
+                         "for up to the TTL. A strong answer names write-through or event-driven invalidation.",
+    "correct_answer_hint": "Read-through cache; invalidate on write (write-through or CDC events); TTL as a backstop.",
+    "improvement_tip": "Sketch the write path for one cached entity and mark where staleness can leak in.",
+    "topic_tag": "System Design - Caching",
+}, indent=2)
+
+
+def main():
+    chunks = [EVALUATION[i:i + CHUNK_CHARS] for i in range(0, len(EVALUATION), CHUNK_CHARS)]
+
+    stream = json_stream.ObjectStream(("detailed_feedback",))
+    first_score = first_text = None
+    for n, chunk in enumerate(chunks, 1):
+        for event in stream.feed(chunk):
+            if event.name == "score" and first_score is None:
+                first_score = n
+            if event.kind == "delta" and first_text is None:
+                first_text = n
+    at = lambda n: n * CHUNK_INTERVAL_MS
+    print(f"chunks={len(chunks)}  score at end-of-stream parse: {at(len(chunks)):>5} ms   "
+          f"incremental: {at(first_score):>4} ms (feedback text from {at(first_text)} ms)")
+
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        soul_engine.parse_evaluation_json("".join(chunks))
+    whole = (time.perf_counter() - start) / RUNS * 1e6
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        stream = json_stream.ObjectStream(("detailed_feedback",))
+        for chunk in chunks:
+            stream.feed(chunk)
+    incremental = (time.perf_counter() - start) / RUNS * 1e6
+    print(f"parse cost per response: whole-object {whole:6.1f} us   incremental {incremental:6.1f} us "
+          f"({incremental / len(chunks):.2f} us/chunk)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Cost of scoring an answer locally (local_scorer) — the fallback used in demo
+mode and while a provider's circuit is open — with the speech analysis passed
+in (as the routes do) and computed from scratch; plus the scores it gives a
+strong, a partial and an off-topic answer to the same question.
+
+    cd backend && python -m benchmarks.bench_local_scorer
+"""
+
+from __future__ import annotations
+import time
+
+from app import local_scorer, speech_analyzer
+
+RUNS = 2000
+
+QUESTION = "Explain how a HashMap works internally. What happens during collision?"
+ANSWERS = {
+    "strong": "A hash map stores key-value pairs in an array of buckets chosen by hashing the key. On a collision "
+              "it chains entries in a linked list or probes for the next free slot, and it resizes once the load "
+              "factor passes about 0.75, so lookups stay O(1) on average.",
+    "partial": "It maps keys to values using a hash function, so finding a key is fast.",
+    "off-topic": "I would put everything in a relational database and query it when I need a value back.",
+}
+
+
+def main():
+    local_scorer.evaluate(QUESTION, ANSWERS["strong"])   # load the model and IDF table
+    for name, answer in ANSWERS.items():
+        print(f"{name:>9}: {local_scorer.evaluate(QUESTION, answer)['score']:>2}/10")
+
+    answer = ANSWERS["strong"]
+    analysis = speech_analyzer.analyze(answer)
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        local_scorer.evaluate(QUESTION, answer, analysis)
+    scored = (time.perf_counter() - start) / RUNS * 1e3
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        local_scorer.evaluate(QUESTION, answer)
+    full = (time.perf_counter() - start) / RUNS * 1e3
+    print(f"per answer: {scored:.3f} ms with analysis given, {full:.3f} ms including speech_analyzer.analyze")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Prosody extraction cost per answer length: a per-frame Python loop (the obvious
+implementation) vs the vectorized prosody.extract.
+
+    cd backend && python -m benchmarks.bench_prosody
+"""
+
+from __future__ import annotations
+import time
+
+import numpy as np
+
+from app import prosody
+
+RATE = 16000
+REPEATS = 5
+
+
+def _speech(seconds: float, rng) -> np.ndarray:
+    # Syllable-like tone bursts (drifting pitch) in phrases separated by pauses.
+    t = np.arange(int(RATE * 0.15)) / RATE
+    out, total = [], 0
+    while total < seconds * RATE:
+        for _ in range(rng.integers(5, 15)):
+            f0 = rng.uniform(100, 220)
+            out += [0.3 * np.sin(np.pi * t / 0.15) * np.sin(2 * np.pi * f0 * t), np.zeros(int(RATE * 0.08))]
+        out.append(np.zeros(int(RATE * rng.uniform(0.3, 2.0))))
+        total = sum(len(a) for a in out)
+    x = np.concatenate(out)[: int(seconds * RATE)]
+    return (x + rng.normal(0, 0.002, len(x))).astype(np.float32)
+
+
+def _looped(x: np.ndarray) -> tuple[float, int]:
+    frame = int(RATE * prosody.FRAME_SEC)
+    rms = [float(np.sqrt(np.mean(x[i:i + frame] ** 2))) for i in range(0, len(x) - frame + 1, frame)]
+    threshold = max(prosody.SILENCE_FLOOR, sorted(rms)[int(len(rms) * 0.9)] * prosody.VOICED_FRACTION)
+    lo, hi = RATE // prosody.PITCH_MAX_HZ, RATE // prosody.PITCH_MIN_HZ
+    pitches, voiced = [], 0
+    for i, r in enumerate(rms):
+        if r <= threshold:
+            continue
+        voiced += 1
+        w = x[i * frame: i * frame + prosody.PITCH_FRAME]
+        if len(w) < prosody.PITCH_FRAME:
+            continue
+        w = w - w.mean()
+        ac = [float(np.dot(w[:len(w) - k], w[k:])) for k in range(lo, hi)]
+        pitches.append(RATE / (lo + int(np.argmax(ac))))
+    return (float(np.mean(pitches)) if pitches else 0.0), voiced
+
+
+def main():
+    rng = np.random.default_rng(3)
+    for seconds in (15, 60, 180):
+        x = _speech(seconds, rng)
+        start = time.perf_counter()
+        _looped(x)
+        loop_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            p = prosody.extract(x)
+        vec_ms = (time.perf_counter() - start) / REPEATS * 1e3
+        print(f"answer={seconds:>4}s  per-frame loop {loop_ms:9,.1f} ms   vectorized {vec_ms:6.2f} ms"
+              f"   (pitch {p.pitch_mean_hz:.0f}±{p.pitch_std_hz:.0f} Hz, {p.pause_count} pauses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Cost of generating a local question from the template grammar (question_grammar),
+how many distinct questions each category can produce, and how many draws a
+session takes before the first repeat.
+
+    cd backend && python -m benchmarks.bench_question_grammar
+"""
+
+from __future__ import annotations
+import random
+import time
+
+from app import question_grammar
+
+RUNS = 20000
+DIFFICULTIES = ("basic", "medium", "hard")
+TYPES = ("conceptual", "practical", "scenario", "coding", "behavioral")
+
+
+def main():
+    rng = random.Random(0)
+    question_grammar.generate("tech", "Backend")   # load the grammar
+    for category in question_grammar.grammar().categories:
+        total = sum(question_grammar.count(category, d, t) for d in DIFFICULTIES for t in TYPES)
+        seen: set[str] = set()
+        while True:
+            q = question_grammar.generate(category, "your field", "basic", rng.choice(TYPES), rng=rng)
+            if q in seen:
+                break
+            seen.add(q)
+        print(f"{category:>10}: {total:>6} distinct questions, first repeat after {len(seen) + 1} basic draws")
+
+    topics = ("Kafka", "gRPC")
+    start = time.perf_counter()
+    for i in range(RUNS):
+        question_grammar.generate("tech", "Backend", DIFFICULTIES[i % 3], TYPES[i % 5], topics, rng)
+    per = (time.perf_counter() - start) / RUNS * 1e6
+    print(f"per question: {per:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Bytes per interview session at 30 answers: legacy dict layout vs session_model.
+
+    cd backend && python -m benchmarks.bench_session_memory
+"""
+
+from __future__ import annotations
+import random
+import tracemalloc
+
+from app import soul_engine, speech_analyzer
+from app.session_model import AnswerRecord, InterviewSession
+
+ANSWERS = 30
+SESSIONS = 200
+
+_WORDS = (
+    "cache latency shard replica index queue consistency throughput partition lock "
+    "so basically i think we would use a write ahead log and for example measure p99 "
+    "as a result the error rate dropped by forty percent in my experience"
+).split()
+
+
+def _answer(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(60, 140)))
+
+
+def _feedback(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(45))
+
+
+def _legacy_profile(domain: str) -> dict:
+    return {
+        "domain": domain, "topics": [domain], "skill_level": "unknown", "confidence": 5,
+        "scores": [], "weakness_areas": [], "strength_areas": [], "question_count": 0,
+        "document_context": "", "topic_scores": {}, "current_difficulty": "basic",
+        "consecutive_correct": 0, "consecutive_wrong": 0,
+    }
+
+
+def build_legacy(seed: int) -> dict:
+    """The pre-session_model layout, filled the way the old _persist_answer did."""
+    rng = random.Random(seed)
+    s = {
+        "provider": "openai", "api_key": "sk-x", "domain": "Backend Engineering", "model": "gpt-4o-mini",
+        "difficulty": "basic", "topics": ["Backend Engineering"], "company_track": None,
+        "interview_type": "general", "questions_asked": [], "answers_given": [],
+        "feedback_received": [], "qa_pairs": [], "weak_areas": {}, "scores_10": [],
+        "last_score_10": None, "soul_profile": _legacy_profile("Backend Engineering"),
+        "analysis_history": [], "user_memory": None, "pressure_level": "none",
+        "last_answer_word_count": None,
+    }
+    for i in range(ANSWERS):
+        q, a, fb, score = f"Question {i}: design a cache for service {seed}?", _answer(rng), _feedback(rng), rng.randint(1, 10)
+        analysis = speech_analyzer.to_dict(speech_analyzer.analyze(a))
+        s["questions_asked"].append(q)
+        s["qa_pairs"].append({
+            "question": q, "user_answer": a, "score": score, "verdict": "Partially Correct",
+            "feedback": fb, "correct_answer": fb[:80], "improvement_tip": fb[:40],
+            "topic_tag": "Caching", "analysis": analysis,
+        })
+        s["answers_given"].append(a)
+        s["feedback_received"].append(fb)
+        s["scores_10"].append(score)
+        s["analysis_history"].append(analysis)
+        s["soul_profile"]["scores"].append(score)
+        s["soul_profile"]["topic_scores"].setdefault("Caching", []).append(score)
+    return s
+
+
+def build_model(seed: int) -> InterviewSession:
+    rng = random.Random(seed)
+    s = InterviewSession(
+        provider="openai", api_key="sk-x", domain="Backend Engineering", model="gpt-4o-mini",
+        soul_profile=soul_engine.default_profile("Backend Engineering"),
+        topics=["Backend Engineering"],
+    )
+    for i in range(ANSWERS):
+        q, a, fb, score = f"Question {i}: design a cache for service {seed}?", _answer(rng), _feedback(rng), rng.randint(1, 10)
+        analysis = speech_analyzer.analyze(a)
+        s.questions_asked.append(q)
+        s.record_answer(AnswerRecord(
+            question=q, answer=a, verdict="Partially Correct", feedback=fb,
+            correct_answer=fb[:80], improvement_tip=fb[:40], topic_tag="Caching", analysis=analysis,
+        ), score)
+        soul_engine.update_profile(s.soul_profile, score, topic="Caching")
+    return s
+
+
+def _bytes_per_session(builder) -> float:
+    tracemalloc.start()
+    keep = [builder(seed) for seed in range(SESSIONS)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return current / SESSIONS
+
+
+def main():
+    legacy = _bytes_per_session(build_legacy)
+    model = _bytes_per_session(build_model)
+    print(f"sessions={SESSIONS} answers/session={ANSWERS}")
+    print(f"legacy dict layout : {legacy:>10,.0f} bytes/session")
+    print(f"session_model      : {model:>10,.0f} bytes/session")
+    print(f"saved              : {legacy - model:>10,.0f} bytes/session ({(1 - model / legacy) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Near-duplicate check cost as the number of asked questions grows: a pairwise
+scan over all fingerprints vs the banded SimHashIndex.
+
+    cd backend && python -m benchmarks.bench_simhash
+"""
+
+from __future__ import annotations
+import random
+import time
+
+from app.simhash import SimHashIndex, distance
+
+PROBES = 2000
+THRESHOLD = 3
+
+
+def main():
+    rng = random.Random(5)
+    for n in (100, 1_000, 10_000, 100_000):
+        stored = [rng.getrandbits(64) for _ in range(n)]
+        index = SimHashIndex(threshold=THRESHOLD)
+        for fp in stored:
+            index.add(fp)
+        probes = [rng.getrandbits(64) for _ in range(PROBES)]
+
+        start = time.perf_counter()
+        for p in probes[: max(20, PROBES * 100 // n)]:
+            any(distance(p, fp) <= THRESHOLD for fp in stored)
+        scan = (time.perf_counter() - start) / max(20, PROBES * 100 // n) * 1e6
+
+        start = time.perf_counter()
+        for p in probes:
+            p in index
+        banded = (time.perf_counter() - start) / PROBES * 1e6
+        print(f"asked={n:>7,}  pairwise scan {scan:>10,.1f} us/check   banded index {banded:6.2f} us/check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Snapshot size and encode/decode time: JSON of the legacy dict layout vs app.snapshot.
+
+    cd backend && python -m benchmarks.bench_snapshot
+"""
+
+from __future__ import annotations
+import json
+import time
+
+from app import snapshot
+from .bench_session_memory import build_legacy, build_model
+
+ROUNDS = 20
+REPEATS = 50   # best of: a single run is at the mercy of the scheduler
+
+
+def _time(fn, arg) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best / ROUNDS * 1e3
+
+
+def main():
+    legacy, model = build_legacy(1), build_model(1)
+    as_json = json.dumps(legacy).encode()
+    as_snap = snapshot.dumps(model)
+    as_snap_raw = snapshot.dumps(model, compress=False)
+
+    print(f"json (legacy layout)   : {len(as_json):>8,} bytes  "
+          f"dump {_time(json.dumps, legacy):6.2f} ms  load {_time(json.loads, as_json):6.2f} ms")
+    print(f"snapshot, uncompressed : {len(as_snap_raw):>8,} bytes  "
+          f"dump {_time(lambda s: snapshot.dumps(s, compress=False), model):6.2f} ms  "
+          f"load {_time(snapshot.loads, as_snap_raw):6.2f} ms")
+    print(f"snapshot               : {len(as_snap):>8,} bytes  "
+          f"dump {_time(snapshot.dumps, model):6.2f} ms  load {_time(snapshot.loads, as_snap):6.2f} ms")
+    print(f"size vs json           : {len(as_snap) / len(as_json) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+SSE frames per streamed response: one frame per provider chunk (the old
+behaviour, sse_coalesce_ms=0) vs coalesced 30 ms / 512-byte windows, for
+providers of different chunk rates.
+
+    cd backend && python -m benchmarks.bench_sse
+"""
+
+from __future__ import annotations
+import asyncio
+import random
+import time
+
+from app import sse
+
+ANSWER_CHARS = 1600   # a long feedback response
+
+
+async def _provider(interval_ms: float, chunk_chars: int, rng: random.Random):
+    sent = 0
+    while sent < ANSWER_CHARS:
+        n = max(1, int(rng.gauss(chunk_chars, 1)))
+        await asyncio.sleep(interval_ms / 1000 * rng.uniform(0.5, 1.5))
+        yield "x" * n
+        sent += n
+    yield sse.control("META", "{}")
+    yield sse.control("DONE")
+
+
+async def _run(interval_ms: float, chunk_chars: int, window_ms: int) -> tuple[int, int, float]:
+    frames = size = 0
+    start = time.perf_counter()
+    async for f in sse.coalesce(_provider(interval_ms, chunk_chars, random.Random(1)),
+                                max_bytes=512, max_delay_ms=window_ms):
+        frames += 1
+        size += len(f)
+    return frames, size, time.perf_counter() - start
+
+
+def main():
+    for label, interval, chars in (("fast (2 ms, 3 chars)", 2, 3), ("typical (10 ms, 4 chars)", 10, 4),
+                                   ("slow (40 ms, 6 chars)", 40, 6)):
+        before = asyncio.run(_run(interval, chars, 0))
+        after = asyncio.run(_run(interval, chars, 30))
+        print(f"{label:<26} frames/response {before[0]:>4} -> {after[0]:>3}   "
+              f"bytes {before[1]:>6,} -> {after[1]:>6,}   wall {before[2]:.2f}s -> {after[2]:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
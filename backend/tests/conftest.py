@@ -0,0 +1,28 @@
+import asyncio
+
+import pytest
+
+from app import routes
+
+
+@pytest.fixture
+def start_session():
+    """Start an interview through the route and return its id; sessions a test leaves open are dropped.
+
+    Each test module passes its own api_key, so the provider circuit breaker
+    (keyed by provider and key) never carries failures from one module into another.
+    """
+    started = []
+
+    def start(api_key: str = "demo", domain: str = "Backend", mode: str = "standard") -> str:
+        res = asyncio.run(routes.start_interview(
+            provider="openai", api_key=api_key, domain=domain, model=None, difficulty="basic",
+            topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+            mode=mode,
+        ))
+        started.append(res["session_id"])
+        return res["session_id"]
+
+    yield start
+    for sid in started:
+        routes.active_sessions.pop(sid, None)
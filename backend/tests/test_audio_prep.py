@@ -0,0 +1,46 @@
+import io
+import wave
+
+import pytest
+
+from app import audio_prep
+
+np = pytest.importorskip("numpy")
+
+
+def _stereo_wav(rate=48000, silence=1.0, tone=2.0) -> bytes:
+    quiet = np.zeros(int(rate * silence))
+    t = np.arange(int(rate * tone)) / rate
+    voice = 0.5 * np.sin(2 * np.pi * 220 * t)
+    mono = np.concatenate([quiet, voice, quiet])
+    pcm = (np.stack([mono, mono], axis=1) * 32767).astype("<i2").tobytes()
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+
+def test_wav_is_downmixed_resampled_and_trimmed(monkeypatch):
+    monkeypatch.setattr(audio_prep.shutil, "which", lambda name: None)
+    raw = _stereo_wav()
+    out = audio_prep.prepare(raw, "answer.wav")
+    r = out.report
+    assert r.method == "wav" and out.content_type == "audio/wav" and out.filename == "answer.wav"
+    assert r.input_seconds == 4.0 and 2.0 <= r.output_seconds <= 2.0 + 2 * audio_prep.EDGE_PAD_SEC + 0.05
+    assert r.output_bytes < r.input_bytes / 10
+    with wave.open(io.BytesIO(out.data)) as w:
+        assert (w.getnchannels(), w.getframerate(), w.getsampwidth()) == (1, 16000, 2)
+
+    silent = audio_prep.prepare(_stereo_wav(tone=0.0), "s.wav")
+    assert silent.report.output_seconds == 0
+
+
+def test_unknown_formats_pass_through_with_their_content_type(monkeypatch):
+    monkeypatch.setattr(audio_prep.shutil, "which", lambda name: None)
+    out = audio_prep.prepare(b"\x1aE\xdf\xa3webm", "clip.webm", "audio/webm;codecs=opus")
+    assert out.data == b"\x1aE\xdf\xa3webm" and out.content_type == "audio/webm"
+    assert out.report.method == "passthrough"
+    assert audio_prep.content_type_for("x.m4a") == "audio/mp4"
@@ -0,0 +1,33 @@
+import asyncio
+
+from app import domain_classifier, routes
+from app.domain_classifier import classify
+
+
+def test_keywords_and_phrases():
+    assert classify("Senior Software Engineer") == ("tech", ("software engineering",))
+    assert classify("Digital Marketing Manager") == ("marketing", ("digital marketing",))
+    assert classify("Product Design").category == "design"     # phrase beats the lone "product"
+    assert classify("Corporate Lawyer").category == "legal"
+    assert classify("Pastry Chef") == ("generic", ())
+
+
+def test_typos_fall_back_to_trigrams():
+    assert classify("sofware enginering") == classify("Software Engineering")
+    assert classify("machine lerning").category == "tech"
+    assert classify("Marketting").category == "marketing"
+    assert classify("retail").category == "generic"    # no substring hit on "ai"
+
+
+def test_memoized_and_stored_on_session():
+    domain_classifier._classify_normalized.cache_clear()
+    classify("UX/UI Design")
+    classify("  ux / ui   DESIGN ")
+    assert domain_classifier._classify_normalized.cache_info().hits == 1
+
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="demo", domain="Financial Analyst", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    session = routes.active_sessions.pop(res["session_id"])
+    assert session.domain_class == ("finance", ("financial analysis",))
@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+from app import llm_client, routes, soul_engine
+
+
+def _fused_llm(monkeypatch, reply):
+    calls = []
+
+    def call_llm(provider, api_key, model, messages, **kw):
+        calls.append(messages[-1]["content"])
+        return json.dumps(reply)
+
+    def no_second_call(*a, **kw):
+        raise AssertionError("the next question should come from the evaluation call")
+
+    monkeypatch.setattr(routes.settings, "fused_turns", True)
+    monkeypatch.setattr(llm_client, "call_llm", call_llm)
+    monkeypatch.setattr(routes.requests, "post", no_second_call)
+    return calls
+
+
+def _answer(sid, question, answer):
+    routes.active_sessions[sid]["current_question"] = question
+    return asyncio.run(routes.submit_interview_answer(session_id=sid, answer=answer))
+
+
+def test_parse_turn_json_splits_off_the_next_question():
+    evaluation, nxt = soul_engine.parse_turn_json(
+        '{"score": 4, "short_verdict": "Thin.", "next_kind": "followup", "next_question": " What does a B-tree buy you? "}'
+    )
+    assert nxt == ("followup", "What does a B-tree buy you?")
+    assert evaluation["score"] == 4 and "next_question" not in evaluation and "next_kind" not in evaluation
+    assert soul_engine.parse_turn_json('{"score": 9, "next_kind": "new"}')[1] is None
+    assert soul_engine.parse_turn_json('{"score": 9, "next_kind": "odd", "next_question": "Q?"}')[1] == ("new", "Q?")
+
+
+def test_low_score_turn_serves_the_followup_without_a_second_call(monkeypatch, start_session):
+    follow = "Which column would you index first, and why?"
+    calls = _fused_llm(monkeypatch, {"score": 4, "short_verdict": "Thin.", "detailed_feedback": "Missed indexes.",
+                                     "next_kind": "followup", "next_question": follow})
+    sid = start_session(api_key="sk-live-fused")
+    try:
+        result = _answer(sid, "How would you speed up a slow query?", "Add more servers.")
+        assert result["score"] == 4
+        assert (result["next_kind"], result["next_question"]) == ("followup", follow)
+        assert "next question" in calls[0].lower() and "followup" in calls[0]
+
+        q = asyncio.run(routes.generate_followup(session_id=sid))
+        assert q == {"question": follow, "kind": "followup"}
+        assert routes.active_sessions[sid]["current_question"] == follow
+        assert len(calls) == 1
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
+
+
+def test_new_question_is_served_by_the_question_endpoints(monkeypatch, start_session):
+    nxt = "How would you shard a table that outgrew one machine?"
+    _fused_llm(monkeypatch, {"score": 8, "detailed_feedback": "Solid.", "next_kind": "new", "next_question": nxt})
+    sid = start_session(api_key="sk-live-fused")
+    try:
+        _answer(sid, "What is an index?", "A sorted structure that lets lookups skip a full scan.")
+        assert asyncio.run(routes.get_interview_question(session_id=sid)) == {"question": nxt, "source": "turn", "kind": "new"}
+        assert sid not in routes._turn_next
+
+        # A repeat of something already asked is dropped instead of served.
+        _answer(sid, "Another question?", "An answer long enough to grade.")
+        assert sid not in routes._turn_next
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
@@ -0,0 +1,79 @@
+from fastapi.testclient import TestClient
+
+from app import llm_client, routes
+from app.main import app
+
+
+def _until(ws, kind):
+    messages = []
+    while True:
+        messages.append(ws.receive_json())
+        if messages[-1]["type"] == kind:
+            return messages
+
+
+def test_whole_turn_over_one_socket(start_session):
+    sid = start_session(domain="Backend Engineer")
+    with TestClient(app).websocket_connect("/interview/session") as ws:
+        ws.send_json({"session_id": sid})
+        assert ws.receive_json()["type"] == "ready"
+
+        ws.send_json({"type": "question"})
+        msgs = _until(ws, "question_end")
+        question = msgs[-1]["question"]
+        assert question and "".join(m["d"] for m in msgs[:-1]).strip() == question.strip()
+        assert question == routes.active_sessions[sid].current_question
+
+        ws.send_json({"type": "answer", "text": "I would shard the table by tenant and cache hot reads in Redis.",
+                      "next": True})
+        msgs = _until(ws, "feedback_end")
+        evaluation = next(m["data"] for m in msgs if m["type"] == "evaluation")
+        assert 1 <= evaluation["score"] <= 10 and "filler_words" in evaluation["analysis"]
+        pushed = _until(ws, "question_end")        # next question arrives without another request
+        assert pushed[-1]["question"] and pushed[-1]["question"] != question
+
+        ws.send_json({"type": "ping"})
+        assert ws.receive_json() == {"type": "pong"}
+        ws.send_json({"type": "end"})
+        summary = _until(ws, "summary")[-1]["data"]
+    assert sid not in routes.active_sessions and len(summary["qa_pairs"]) == 1
+
+
+def test_unknown_session_and_bad_messages(start_session):
+    client = TestClient(app)
+    with client.websocket_connect("/interview/session") as ws:
+        ws.send_json({"session_id": "nope"})
+        assert ws.receive_json() == {"type": "error", "detail": "Session not found"}
+
+    sid = start_session(domain="Backend Engineer", mode="rapid_fire")
+    with client.websocket_connect("/interview/session") as ws:
+        ws.send_json({"session_id": sid})
+        assert ws.receive_json()["mode"] == "rapid_fire"
+        ws.send_json({"type": "dance"})
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "answer", "text": "Use a queue."})
+        assert ws.receive_json()["data"]["pending"] is True
+    routes.active_sessions.pop(sid)
+
+
+def test_a_provider_failure_mid_turn_is_reported_and_the_socket_stays_open(monkeypatch, start_session):
+    async def failing_feedback(session_id, session, answer):
+        async def source():
+            yield "Good start, "
+            raise llm_client.CircuitOpen("openai is failing; retrying after the cooldown")
+        return source()
+
+    monkeypatch.setattr(routes, "_feedback_source", failing_feedback)
+    sid = start_session(domain="Backend Engineer")
+    with TestClient(app).websocket_connect("/interview/session") as ws:
+        ws.send_json({"session_id": sid})
+        assert ws.receive_json()["type"] == "ready"
+        ws.send_json({"type": "answer", "text": "Cache the hot reads."})
+        error = _until(ws, "error")[-1]
+        assert "could not be completed" in error["detail"] and "openai" not in error["detail"]
+
+        ws.send_json({"type": "ping"})
+        assert ws.receive_json() == {"type": "pong"}
+        ws.send_json({"type": "question"})
+        assert _until(ws, "question_end")[-1]["question"]
+    routes.active_sessions.pop(sid)
@@ -0,0 +1,56 @@
+import asyncio
+import json
+import random
+
+from app import json_stream, llm_client, routes, soul_engine
+
+EVALUATION = {
+    "score": 7, "is_correct": True, "short_verdict": 'Solid, but "eventual" needs a definition.',
+    "detailed_feedback": "You named the trade-off.\nMissing: quorum math \\ R+W>N 😀 and é.",
+    "correct_answer_hint": ["quorums", {"read": "R", "write": "W]"}], "topic_tag": None,
+}
+
+
+def test_fields_complete_in_order_under_any_chunking():
+    raw = "```json\n" + json.dumps(EVALUATION, indent=2) + "\n```"   # \uXXXX escapes included
+    rng = random.Random(4)
+    for _ in range(200):
+        stream, events, i = json_stream.ObjectStream(("detailed_feedback",)), [], 0
+        while i < len(raw):
+            step = rng.randint(1, 9)
+            events += stream.feed(raw[i:i + step])
+            i += step
+        assert stream.done and stream.fields == EVALUATION
+        assert [e.name for e in events if e.kind == "field"][:2] == ["score", "is_correct"]
+        assert "".join(e.value for e in events if e.kind == "delta") == EVALUATION["detailed_feedback"]
+
+
+def test_truncated_evaluation_keeps_completed_fields():
+    raw = '{"score": 8, "is_correct": true, "short_verdict": "Good.", "detailed_feedback": "You cov'
+    parsed = soul_engine.parse_evaluation_json(raw)
+    assert parsed["score"] == 8 and parsed["short_verdict"] == "Good." and parsed["topic_tag"] == "General"
+    assert soul_engine.parse_evaluation_json("no json")["score"] == 5
+
+
+def test_feedback_stream_sends_score_before_any_text(monkeypatch):
+    body = json.dumps({"score": 4, "is_correct": False, "short_verdict": "Vague.",
+                       "detailed_feedback": "You never said which index.", "topic_tag": "Indexes"})
+    monkeypatch.setattr(llm_client, "stream_llm",
+                        lambda *a, **kw: iter(body[i:i + 5] for i in range(0, len(body), 5)))
+    monkeypatch.setattr(routes.settings, "sse_coalesce_ms", 0)
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-fields", domain="Backend", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+
+    async def run():
+        response = await routes.stream_answer_feedback(sid, "Add an index.", None)
+        return [f.split("\n", 1)[1] async for f in response.body_iterator]
+
+    frames = asyncio.run(run())
+    assert frames[0] == 'data: [FIELD]{"score": 4}\n\n'
+    text = "".join(json.loads(f[6:]) for f in frames if not f.startswith("data: ["))
+    assert text == "You never said which index."
+    assert frames[-2].startswith("data: [META]") and frames[-1] == "data: [DONE]\n\n"
+    routes.active_sessions.pop(sid)
@@ -0,0 +1,76 @@
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app import routes, vad
+from app.main import app
+
+RATE = 16000
+
+
+def _tone(sec: float):
+    t = np.arange(int(RATE * sec)) / RATE
+    return (0.3 * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+def _silence(sec: float):
+    return (np.random.default_rng(0).standard_normal(int(RATE * sec)) * 1e-4).astype(np.float32)
+
+
+def test_vad_cuts_at_pauses_and_flushes_the_tail():
+    det = vad.VoiceActivityDetector(RATE)
+    stream = np.concatenate([_silence(0.5), _tone(1.0), _silence(0.8), _tone(0.7), _silence(0.2)])
+    utterances = []
+    for i in range(0, len(stream), 1600):   # 100 ms chunks, as a browser would send them
+        utterances += det.feed(stream[i:i + 1600])
+    assert len(utterances) == 1 and 1.0 <= len(utterances[0]) / RATE <= 1.0 + 0.2 + 0.25
+    assert det.in_speech
+    tail = det.flush()
+    assert tail is not None and len(tail) / RATE >= 0.7 and det.flush() is None
+
+
+def test_socket_pushes_partials_then_final(monkeypatch):
+    calls = []
+
+    def fake_stt(provider, api_key, filename, data, content_type):
+        calls.append(len(data))
+        return f"utterance{len(calls)}"
+
+    monkeypatch.setattr(routes, "_stt_request", fake_stt)
+    routes.active_sessions["voice-test"] = {"provider": "openai", "api_key": "sk-live"}
+    pcm = lambda a: (a * 32767).astype("<i2").tobytes()
+    with TestClient(app).websocket_connect("/interview/voice") as ws:
+        ws.send_json({"session_id": "voice-test", "sample_rate": RATE})
+        assert ws.receive_json() == {"type": "ready"}
+        ws.send_bytes(pcm(np.concatenate([_tone(1.0), _silence(0.8)])))
+        partial = ws.receive_json()   # first utterance transcribed before the candidate finishes
+        assert partial == {"type": "partial", "text": "utterance1", "utterances": 1}
+        ws.send_bytes(pcm(_tone(0.6)))
+        ws.send_json({"type": "end"})
+        messages = [ws.receive_json(), ws.receive_json()]
+    routes.active_sessions.pop("voice-test")
+    assert messages[-1] == {"type": "final", "text": "utterance1 utterance2", "utterances": 2, "failed_utterances": []}
+    assert len(calls) == 2
+
+
+def test_socket_tells_demo_sessions_to_fall_back():
+    routes.active_sessions["voice-demo"] = {"provider": "openai", "api_key": "demo"}
+    with TestClient(app).websocket_connect("/interview/voice") as ws:
+        ws.send_json({"session_id": "voice-demo"})
+        assert ws.receive_json()["fallback"] is True
+    routes.active_sessions.pop("voice-demo")
+
+
+def test_socket_reports_a_failure_mid_stream_and_closes(monkeypatch):
+    def broken_feed(self, samples):
+        raise RuntimeError("vad exploded")
+
+    monkeypatch.setattr(vad.VoiceActivityDetector, "feed", broken_feed)
+    routes.active_sessions["voice-broken"] = {"provider": "openai", "api_key": "sk-live"}
+    with TestClient(app).websocket_connect("/interview/voice") as ws:
+        ws.send_json({"session_id": "voice-broken", "sample_rate": RATE})
+        assert ws.receive_json() == {"type": "ready"}
+        ws.send_bytes((_tone(0.2) * 32767).astype("<i2").tobytes())
+        assert ws.receive_json() == {"type": "error", "detail": "Live transcription failed", "fallback": True}
+        closed = ws.receive()
+    routes.active_sessions.pop("voice-broken")
+    assert closed["type"] == "websocket.close" and closed["code"] == 1011
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+import requests
+
+from app import llm_client, local_scorer, metrics, routes
+
+_Q = "Explain how a HashMap works internally. What happens during collision?"
+_STRONG = ("A hash map stores key-value pairs in buckets chosen by hashing the key. On a collision it chains "
+           "entries in a linked list or probes for a free slot, and it resizes when the load factor passes 0.75.")
+
+
+def test_local_scorer_ranks_answers_and_names_missing_points():
+    strong = local_scorer.evaluate(_Q, _STRONG)
+    partial = local_scorer.evaluate(_Q, "It maps keys to values using a hash function.")
+    off = local_scorer.evaluate(_Q, "I would put everything in a relational database and query it later.")
+    assert strong["score"] >= 8 > partial["score"] and partial["score"] >= off["score"]
+    assert strong["topic_tag"] == "Hash Maps" and strong["scorer"] == "local"
+    assert "collision" in partial["detailed_feedback"].split("Missing:")[1]
+    assert set(strong) >= {"score", "is_correct", "short_verdict", "detailed_feedback",
+                           "correct_answer_hint", "improvement_tip", "topic_tag"}
+
+
+def _failing_provider(monkeypatch):
+    posts = []
+
+    def post(*a, **kw):
+        posts.append(1)
+        raise requests.exceptions.ConnectionError("provider down")
+
+    monkeypatch.setattr(llm_client.requests, "post", post)
+    monkeypatch.setattr(llm_client.settings, "llm_breaker_failures", 2)
+    monkeypatch.setattr(llm_client.settings, "llm_breaker_cooldown_sec", 60)
+    return posts
+
+
+def test_circuit_opens_after_repeated_failures_and_fails_fast(monkeypatch):
+    posts = _failing_provider(monkeypatch)
+    args = ("openai", "sk-breaker-unit", "gpt-4o-mini", [{"role": "user", "content": "hi"}])
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            llm_client.call_llm(*args)
+    assert llm_client.circuit_open("openai", "sk-breaker-unit")
+    assert not llm_client.circuit_open("openai", "sk-another-key")
+    with pytest.raises(llm_client.CircuitOpen):
+        llm_client.call_llm(*args)
+    with pytest.raises(llm_client.CircuitOpen):
+        list(llm_client.stream_llm(*args))
+    assert len(posts) == 2
+
+    # After the cooldown a trial call goes through; success closes the circuit.
+    llm_client._circuits[("openai", hash("sk-breaker-unit"))][1] = 0.0
+    monkeypatch.setattr(llm_client, "_call", lambda *a: "ok")
+    assert llm_client.call_llm(*args) == "ok"
+    assert ("openai", hash("sk-breaker-unit")) not in llm_client._circuits
+
+
+def test_answers_are_scored_locally_while_the_provider_is_down(monkeypatch):
+    posts = _failing_provider(monkeypatch)
+    before = metrics.snapshot().get("llm_circuit_rejections", 0)
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-breaker-route", domain="Backend", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+    try:
+        scores = []
+        for _ in range(3):
+            routes.active_sessions[sid]["current_question"] = _Q
+            result = asyncio.run(routes.submit_interview_answer(session_id=sid, answer=_STRONG))
+            scores.append(result["score"])
+            assert result["topic_tag"] == "Hash Maps"
+        assert min(scores) >= 8
+        assert len(posts) == 2   # the third answer never reached the provider
+        assert metrics.snapshot()["llm_circuit_rejections"] == before + 1
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
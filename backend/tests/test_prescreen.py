@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+from app import llm_client, metrics, prescreen, routes, speech_analyzer
+
+_Q = "What is the difference between a process and a thread?"
+
+
+def _classify(answer, question=_Q):
+    return prescreen.classify(question, answer, speech_analyzer.analyze(answer))
+
+
+def test_trivial_answers_are_classified():
+    assert _classify("") == _classify(" ... ") == "empty"
+    assert _classify("idk") == _classify("I don't know, sorry.") == _classify("Pass") == "dont_know"
+    assert _classify("Mutex.") == _classify("um, like, basically") == "too_short"
+    assert _classify("The difference between a process and a thread.") == "echo"
+
+
+def test_substantive_answers_are_forwarded():
+    assert _classify("A process has its own memory; threads share it.") is None
+    assert _classify("I don't know exactly, but threads share the heap and processes are isolated.") is None
+    assert _classify("Pass by reference") is None
+    # Picking an option the question offered is an answer, not an echo.
+    assert _classify("UDP for video streaming", "Which is better: TCP or UDP for video streaming?") is None
+
+
+def test_trivial_answer_skips_the_evaluator_and_is_counted(monkeypatch):
+    calls = []
+
+    def call_llm(*a, **kw):
+        calls.append(1)
+        return json.dumps({"score": 7, "short_verdict": "Good.", "detailed_feedback": "Solid."})
+
+    monkeypatch.setattr(llm_client, "call_llm", call_llm)
+    before = metrics.snapshot()
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-prescreen", domain="Backend", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+    try:
+        routes.active_sessions[sid]["current_question"] = _Q
+        skipped = asyncio.run(routes.submit_interview_answer(session_id=sid, answer="no idea"))
+        assert skipped["prescreen"] == "dont_know" and skipped["score"] == 1 and not calls
+        after = metrics.snapshot()
+        assert after.get("llm_calls_avoided", 0) == before.get("llm_calls_avoided", 0) + 1
+        assert after.get("prescreen_dont_know", 0) == before.get("prescreen_dont_know", 0) + 1
+
+        graded = asyncio.run(routes.submit_interview_answer(
+            session_id=sid, answer="A process owns its address space; threads share one and are cheaper to switch."))
+        assert graded["score"] == 7 and "prescreen" not in graded and len(calls) == 1
+        assert [p["score"] for p in routes.active_sessions[sid]["qa_pairs"]] == [1, 7]
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
@@ -0,0 +1,77 @@
+import asyncio
+import io
+import wave
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app import audio_prep, prosody, routes, speech_analyzer
+from app.main import app
+
+RATE = 16000
+
+
+def _syllables(n: int, f0: float, gap: float = 0.1, jitter: float = 0.0):
+    t = np.arange(int(RATE * 0.15)) / RATE
+    out = []
+    for i in range(n):
+        f = f0 + jitter * np.sin(i)
+        out += [0.3 * np.sin(np.pi * t / 0.15) * np.sin(2 * np.pi * f * t), np.zeros(int(RATE * gap))]
+    return np.concatenate(out)
+
+
+def _answer(f0=140.0, jitter=40.0):
+    # 4 phrases of 12 syllables, separated by 0.5 s pauses and one 4.5 s pause
+    pause, long_pause = np.zeros(int(RATE * 0.5)), np.zeros(int(RATE * 4.5))
+    phrases = [_syllables(12, f0, jitter=jitter) for _ in range(4)]
+    return np.concatenate([phrases[0], pause, phrases[1], long_pause, phrases[2], pause, phrases[3]]).astype(np.float32)
+
+
+def test_extract_measures_pauses_rate_and_pitch():
+    p = prosody.extract(_answer())
+    assert p.pause_count == 3 and 4.4 <= p.longest_pause_sec <= 4.7
+    assert 0.3 <= p.pause_ratio <= 0.4             # ~5.8 s of pauses in ~17.4 s
+    assert 5.0 <= p.syllables_per_sec <= 8.0           # 48 syllables in ~7.2 s of voicing
+    assert 120 <= p.pitch_mean_hz <= 160 and p.pitch_std_hz > 15
+    flat = prosody.extract(_answer(jitter=0.0))
+    assert flat.pitch_std_hz < 5
+    assert prosody.extract(np.zeros(RATE)).speaking_sec == 0
+
+
+def test_analysis_gets_pace_and_delivery_tips():
+    words = " ".join(["specifically the cache"] * 20)   # 60 words
+    p = prosody.Prosody(duration_sec=20.0, speaking_sec=15.0, pause_count=2, longest_pause_sec=5.0, pitch_std_hz=6.0)
+    a = speech_analyzer.analyze(words, prosody=p)
+    assert a.estimated_wpm == 180 and a.longest_pause_sec == 5.0
+    assert any("words per minute" in t for t in a.tips) and any("monotone" in t for t in a.tips)
+    assert speech_analyzer.to_dict(a)["pitch_std_hz"] == 6.0
+    assert speech_analyzer.analyze(words).estimated_wpm == 0
+
+
+def test_transcribed_answer_carries_its_prosody(monkeypatch):
+    monkeypatch.setattr(audio_prep.shutil, "which", lambda name: None)
+    spoken = "I would put a read-through cache in front of the orders table"
+    monkeypatch.setattr(routes, "_stt_request", lambda *a: spoken)
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-voice", domain="Backend", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes((_answer() * 32767).astype("<i2").tobytes())
+    out = TestClient(app).post("/interview/transcribe", data={"session_id": sid},
+                               files={"file": ("a.wav", buf.getvalue(), "audio/wav")}).json()
+    assert out["text"] == spoken
+
+    session = routes.active_sessions[sid]
+    typed = asyncio.run(routes._analyze_answer(sid, session, "Something else entirely, typed by hand."))
+    assert typed.speaking_sec == 0 and session.voice_prosody is None   # consumed, didn't match
+
+    routes._note_voice(sid, session, spoken, prosody.extract(_answer()))
+    voiced = asyncio.run(routes._analyze_answer(sid, session, spoken + "."))
+    assert voiced.estimated_wpm > 0 and voiced.longest_pause_sec > 4
+    routes.active_sessions.pop(sid)
@@ -0,0 +1,45 @@
+from app import question_bank, routes, snapshot, soul_engine
+from app.session_model import InterviewSession
+
+
+def test_every_local_question_is_compiled_once():
+    bank = question_bank.LOCAL_QUESTION_BANK["medium"]["coding"]
+    bucket = question_bank.bank_bucket("medium", "coding")
+    assert question_bank.size(bucket) == len(bank)
+    drawn = {question_bank.text(question_bank.sample(bucket)) for _ in range(200)}
+    assert drawn == set(bank)
+    qid = question_bank.first(bucket)
+    assert question_bank.norm(qid) == routes._normalize_q(bank[0])
+    assert question_bank.qhash(qid) == question_bank.stable_hash(question_bank.norm(qid))
+
+
+def test_cursor_walks_each_bucket_once_per_session():
+    bucket = question_bank.track_bucket("google", "hard")
+    n = question_bank.size(bucket)
+    orders = []
+    for _ in range(5):
+        session = {}
+        ids = [question_bank.draw(session, bucket) for _ in range(n)]
+        assert sorted(ids) == sorted(set(ids)) and len(ids) == n
+        assert question_bank.draw(session, bucket) is None
+        orders.append(tuple(ids))
+    assert len(set(orders)) > 1   # shuffled differently per session
+
+
+def test_domain_matching_and_fallbacks():
+    banks = ("software engineering", "ux/ui design")
+    assert question_bank.domain_bucket(banks, "basic", "coding") == "domain/software engineering/basic/coding"
+    assert question_bank.domain_bucket(banks, "basic", "scenario") == "domain/ux/ui design/basic/scenario"
+    assert question_bank.domain_bucket(banks[:1], "basic", "scenario") is None
+    assert question_bank.bank_bucket("hard", "nope") == "pool/hard"
+    assert question_bank.track_bucket("GOOGLE", "expert") == "track/google/medium"
+
+
+def test_cursor_state_survives_a_snapshot():
+    session = InterviewSession(provider="openai", api_key="demo", domain="UX/UI Design", model="m",
+                               soul_profile=soul_engine.default_profile("UX/UI Design"))
+    asked = [routes._generate_local_question_locked(session) for _ in range(6)]
+    restored = snapshot.loads(snapshot.dumps(session))
+    assert restored.bank_cursors == session.bank_cursors
+    asked += [routes._generate_local_question_locked(restored) for _ in range(6)]
+    assert len(set(asked)) == len(asked)
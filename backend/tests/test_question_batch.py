@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+from app import llm_client, question_queue, routes, soul_engine
+
+
+def _batch_reply(prefix: str):
+    return json.dumps([
+        {"type": "conceptual", "question": f"{prefix}: how does a write-ahead log guarantee durability?"},
+        {"type": "practical", "question": f"{prefix}: walk me through adding an index to a 2 TB table online."},
+        {"type": "scenario", "question": f"{prefix}: replication lag spikes to 30 seconds at noon, what now?"},
+        {"type": "coding", "question": f"{prefix}: implement a token bucket rate limiter."},
+        {"type": "behavioral", "question": f"{prefix}: tell me about a migration you had to roll back."},
+    ])
+
+
+def test_one_call_serves_a_batch_and_profile_shift_invalidates(monkeypatch, start_session):
+    calls, refills = [], []
+
+    def fake_call(provider, api_key, model, messages, max_tokens=1024, timeout=45):
+        calls.append(messages[0]["content"])
+        return _batch_reply(f"batch{len(calls)}")
+
+    monkeypatch.setattr(llm_client, "call_llm", fake_call)
+    monkeypatch.setattr(routes.settings, "question_batch_size", 5)
+    monkeypatch.setattr(routes, "_maybe_refill_in_background", lambda sid, *a: refills.append(sid))
+    sid = start_session(api_key="sk-live-batch", domain="Databases")
+    session = routes.active_sessions[sid]
+
+    asked = [asyncio.run(routes.get_interview_question(session_id=sid)) for _ in range(5)]
+    assert len(calls) == 1 and "JSON array" in calls[0]
+    assert all(r["source"] == "batch" for r in asked)
+    assert len({r["question"] for r in asked}) == 5
+    assert sum(session.type_counts.values()) == 5
+    assert refills == [sid] * 5
+
+    # Serve two from a fresh batch, then let the profile move on: the rest are dropped.
+    asyncio.run(routes.get_interview_question(session_id=sid))
+    assert len(calls) == 2 and question_queue.pending(session) == 4
+    session.soul_profile.current_difficulty = "hard"
+    q = asyncio.run(routes.get_interview_question(session_id=sid))
+    assert len(calls) == 3 and q["question"].startswith("batch3")
+    routes.active_sessions.pop(sid)
+
+
+def test_failed_batch_falls_back_to_single_question(monkeypatch, start_session):
+    def broken_call(*args, **kwargs):
+        raise RuntimeError("upstream down")
+
+    class _Resp:
+        ok = True
+        text = ""
+
+        def json(self):
+            return {"choices": [{"message": {"content": "How do B-tree page splits work?"}}]}
+
+    monkeypatch.setattr(llm_client, "call_llm", broken_call)
+    monkeypatch.setattr(routes.requests, "post", lambda *a, **kw: _Resp())
+    monkeypatch.setattr(routes.settings, "question_batch_size", 5)
+    sid = start_session(api_key="sk-live-batch", domain="Databases")
+    q = asyncio.run(routes.get_interview_question(session_id=sid))
+    assert q == {"question": "How do B-tree page splits work?"}
+    routes.active_sessions.pop(sid)
+
+
+def test_parse_question_batch_tolerates_model_noise():
+    raw = "```json\n[{\"type\": \"Coding\", \"question\": \"Reverse a list\"}, \"Bare string?\", {\"question\": \"\"}]\n```"
+    assert soul_engine.parse_question_batch_json(raw, routes.QUESTION_TYPES) == [
+        ("coding", "Reverse a list"), (None, "Bare string?"),
+    ]
+    assert soul_engine.parse_question_batch_json("no json here") == []
@@ -0,0 +1,50 @@
+import asyncio
+import random
+
+from app import metrics, question_grammar, routes
+from app.config import settings
+
+_TYPES = ("conceptual", "practical", "scenario", "coding", "behavioral")
+
+
+def test_every_category_yields_thousands_of_type_aware_questions():
+    rng = random.Random(7)
+    for category in question_grammar.grammar().categories:
+        total = sum(question_grammar.count(category, d, t) for d in ("basic", "medium", "hard") for t in _TYPES)
+        assert total >= 1000, category
+        questions = {question_grammar.generate(category, "Operations", "basic", "scenario", rng=rng) for _ in range(200)}
+        assert len(questions) > 50 and not any("{" in q or "}" in q for q in questions)
+    # Only tech asks for code; other categories answer "coding" with practical questions.
+    assert question_grammar.count("hr", "basic", "coding") == question_grammar.count("hr", "basic", "practical")
+    coding = question_grammar.generate("tech", "Backend", "basic", "coding", rng=rng)
+    assert any(w in coding.lower() for w in ("code", "function"))
+
+
+def test_session_topics_are_preferred_and_the_domain_is_not_repeated():
+    rng = random.Random(3)
+    topics = ("Distributed Systems", "Kafka")
+    questions = [question_grammar.generate("tech", "Distributed Systems", "basic", "conceptual", topics, rng)
+                 for _ in range(300)]
+    assert sum("Kafka" in q for q in questions) > 50
+    assert not any(q.count("Distributed Systems") > 1 for q in questions)
+
+
+def test_basic_questions_are_served_locally_without_a_provider_call(monkeypatch):
+    monkeypatch.setattr(settings, "local_question_share", 1.0)
+    posts = []
+    monkeypatch.setattr(routes.requests, "post", lambda *a, **kw: posts.append(1))
+    before = metrics.snapshot()
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-grammar", domain="Digital Marketing", model=None, difficulty="basic",
+        topics="SEO, Email Campaigns", company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+    try:
+        asked = [asyncio.run(routes.get_interview_question(session_id=sid)) for _ in range(5)]
+        assert all(q["source"] == "local" for q in asked) and not posts
+        assert len({q["question"] for q in asked}) == 5
+        assert routes.active_sessions[sid]["current_question"] == asked[-1]["question"]
+        after = metrics.snapshot()
+        assert after.get("questions_local", 0) == before.get("questions_local", 0) + 5
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import re
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app import llm_client, routes, soul_engine
+from app.session_model import MAX_HISTORY
+
+
+_DETAIL = {"detailed_feedback": "Named the B-tree but not the write cost.",
+           "correct_answer_hint": "- ordered lookups\n- write amplification",
+           "improvement_tip": "Compare B-tree and LSM write paths."}
+
+
+def _fake_llm(monkeypatch):
+    calls = []
+
+    def call_llm(provider, api_key, model, messages, max_tokens=None, **kw):
+        calls.append(max_tokens)
+        if max_tokens == routes.QUICK_MAX_TOKENS:
+            return '{"s": 6, "v": "Right idea, thin on trade-offs.", "t": "Indexing"}'
+        time.sleep(0.05)
+        return json.dumps(_DETAIL)
+
+    monkeypatch.setattr(routes.settings, "quick_eval", True)
+    monkeypatch.setattr(llm_client, "call_llm", call_llm)
+    return calls
+
+
+def test_parse_quick_evaluation_expands_the_short_keys():
+    data = soul_engine.parse_quick_evaluation_json('```json\n{"s": 8, "v": "Solid.", "t": "Caching"}\n```')
+    assert (data["score"], data["short_verdict"], data["topic_tag"], data["is_correct"]) == (8, "Solid.", "Caching", True)
+    assert data["detailed_feedback"] == ""
+    assert soul_engine.parse_quick_evaluation_json('{"s": 3, "v": "Cut off')["score"] == 3
+    assert soul_engine.parse_quick_evaluation_json("")["score"] == 5
+
+
+def test_answer_is_graded_quickly_and_detail_is_generated_once(monkeypatch, start_session):
+    calls = _fake_llm(monkeypatch)
+    sid = start_session(api_key="sk-live-quick")
+    try:
+        routes.active_sessions[sid]["current_question"] = "What does an index cost you?"
+        result = asyncio.run(routes.submit_interview_answer(session_id=sid, answer="Faster reads via a B-tree."))
+        assert calls == [routes.QUICK_MAX_TOKENS]
+        assert result["score"] == 6 and result["topic_tag"] == "Indexing"
+        assert result["detail_pending"] and result["answer_id"] == 0
+
+        async def open_twice():
+            return await asyncio.gather(routes.get_answer_detail(session_id=sid, answer_id=0),
+                                        routes.get_answer_detail(session_id=sid, answer_id=-1))
+        first, second = asyncio.run(open_twice())
+        assert calls == [routes.QUICK_MAX_TOKENS, routes.DETAIL_MAX_TOKENS]
+        assert first["feedback"] == second["feedback"] == _DETAIL["detailed_feedback"]
+
+        again = asyncio.run(routes.get_answer_detail(session_id=sid, answer_id=0))
+        assert again["cached"] and again["correct_answer"] == _DETAIL["correct_answer_hint"]
+        assert len(calls) == 2
+        assert routes.active_sessions[sid]["qa_pairs"][0]["improvement_tip"] == _DETAIL["improvement_tip"]
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
+
+
+def test_a_failed_detail_call_is_not_cached(monkeypatch, start_session):
+    calls = _fake_llm(monkeypatch)
+    working = llm_client.call_llm
+
+    def flaky(provider, api_key, model, messages, max_tokens=None, **kw):
+        if max_tokens == routes.DETAIL_MAX_TOKENS and calls.count(routes.DETAIL_MAX_TOKENS) == 0:
+            calls.append(max_tokens)
+            raise RuntimeError("HTTP 503")
+        return working(provider, api_key, model, messages, max_tokens, **kw)
+
+    monkeypatch.setattr(llm_client, "call_llm", flaky)
+    sid = start_session(api_key="sk-live-quick")
+    try:
+        routes.active_sessions[sid]["current_question"] = "What does an index cost you?"
+        asyncio.run(routes.submit_interview_answer(session_id=sid, answer="Faster reads via a B-tree."))
+        local = asyncio.run(routes.get_answer_detail(session_id=sid, answer_id=0))
+        assert local["fallback"] and not local["cached"] and local["feedback"] != _DETAIL["detailed_feedback"]
+        assert routes.active_sessions[sid].answers[0].feedback == ""
+
+        retried = asyncio.run(routes.get_answer_detail(session_id=sid, answer_id=0))
+        assert retried["feedback"] == _DETAIL["detailed_feedback"] and "fallback" not in retried
+        assert calls.count(routes.DETAIL_MAX_TOKENS) == 2
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
+
+
+def test_answer_ids_stay_stable_after_old_answers_are_trimmed(monkeypatch, start_session):
+    def call_llm(provider, api_key, model, messages, max_tokens=None, **kw):
+        if max_tokens == routes.QUICK_MAX_TOKENS:
+            return '{"s": 6, "v": "Fine.", "t": "Indexing"}'
+        asked = re.search(r"Question \d+", messages[-1]["content"]).group(0)
+        return json.dumps({**_DETAIL, "detailed_feedback": f"About {asked}."})
+
+    monkeypatch.setattr(routes.settings, "quick_eval", True)
+    monkeypatch.setattr(llm_client, "call_llm", call_llm)
+    sid = start_session(api_key="sk-live-quick")
+    try:
+        total = MAX_HISTORY + 5
+        ids = []
+        for n in range(total):
+            routes.active_sessions[sid]["current_question"] = f"Question {n}: what does an index cost you?"
+            result = asyncio.run(routes.submit_interview_answer(session_id=sid, answer=f"Answer {n} about B-trees."))
+            ids.append(result["answer_id"])
+        assert ids == list(range(total))
+
+        detail = asyncio.run(routes.get_answer_detail(session_id=sid, answer_id=10))
+        assert detail["answer_id"] == 10 and detail["feedback"] == "About Question 10."
+        latest = asyncio.run(routes.get_answer_detail(session_id=sid, answer_id=-1))
+        assert latest["answer_id"] == total - 1 and latest["feedback"] == f"About Question {total - 1}."
+        with pytest.raises(HTTPException) as trimmed:
+            asyncio.run(routes.get_answer_detail(session_id=sid, answer_id=2))
+        assert trimmed.value.status_code == 404
+    finally:
+        asyncio.run(routes.end_interview(session_id=sid))
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import re
+import time
+
+from app import llm_client, routes, soul_engine
+
+
+def _batch_reply(prompt: str) -> str:
+    # Score each answer by the digit it ends with; answer in reverse order to exercise "index".
+    answers = re.findall(r"\[(\d+)\] Candidate's answer: .*?(\d+)$", prompt, re.MULTILINE)
+    return json.dumps([
+        {"index": int(i), "score": int(s), "is_correct": int(s) >= 7, "short_verdict": f"v{s}",
+         "detailed_feedback": f"feedback {s}", "topic_tag": "Indexes"}
+        for i, s in reversed(answers)
+    ])
+
+
+def test_answers_return_instantly_and_merge_in_order(monkeypatch):
+    calls = []
+
+    def fake_call(provider, api_key, model, messages, max_tokens=1024, timeout=45):
+        calls.append(messages[-1]["content"])
+        return _batch_reply(messages[-1]["content"])
+
+    monkeypatch.setattr(llm_client, "call_llm", fake_call)
+    monkeypatch.setattr(routes.settings, "rapid_fire_batch_size", 3)
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-rapid", domain="Databases", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+        mode="rapid_fire",
+    ))
+    sid = res["session_id"]
+    session = routes.active_sessions[sid]
+    assert res["mode"] == "rapid_fire"
+
+    scores = [7, 3, 9, 8, 2]
+    for i, s in enumerate(scores):
+        session.current_question = f"Question {i}?"
+        r = asyncio.run(routes.submit_interview_answer(session_id=sid, answer=f"My short answer {s}"))
+        assert r["pending"] and r["score"] is None and "word_count" in r["analysis"]
+
+    # The first full batch is evaluated in one background call; the tail waits for the end of the round.
+    deadline = time.monotonic() + 5
+    while len(session.pending_answers) > 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 1
+    partial = asyncio.run(routes.rapid_fire_results(session_id=sid))
+    assert [p["score"] for p in partial["qa_pairs"]] == scores[:3] and partial["pending"] == 2
+
+    summary = asyncio.run(routes.end_interview(session_id=sid))["summary"]
+    assert len(calls) == 2
+    assert [p["question"] for p in summary["qa_pairs"]] == [f"Question {i}?" for i in range(5)]
+    assert [p["score"] for p in summary["qa_pairs"]] == scores
+    assert list(session.soul_profile.scores) == scores
+
+
+def test_parse_batch_evaluation_fills_gaps():
+    raw = '```json\n[{"index": 2, "score": 9}, "noise", {"score": 4}]\n```'
+    out = soul_engine.parse_batch_evaluation_json(raw, 3)
+    assert [e["score"] for e in out] == [5, 9, 4]
+    assert soul_engine.parse_batch_evaluation_json("nope", 2) == [soul_engine.parse_evaluation_json("")] * 2
+
+
+
+def test_streamed_answers_are_queued_for_the_batch(monkeypatch):
+    calls = []
+    monkeypatch.setattr(llm_client, "call_llm", lambda *a, **kw: calls.append(1) or _batch_reply(a[3][-1]["content"]))
+    monkeypatch.setattr(llm_client, "stream_llm", lambda *a, **kw: calls.append("stream") or iter(()))
+    monkeypatch.setattr(routes.settings, "rapid_fire_batch_size", 5)
+    monkeypatch.setattr(routes.settings, "sse_coalesce_ms", 0)
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-rapid-stream", domain="Databases", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+        mode="rapid_fire",
+    ))
+    sid = res["session_id"]
+    session = routes.active_sessions[sid]
+    session.current_question = "Question 0?"
+
+    async def run():
+        response = await routes.stream_answer_feedback(sid, "My short answer 6", None)
+        return [f.split("\n", 1)[1] async for f in response.body_iterator]
+
+    frames = asyncio.run(run())
+    assert frames[0].startswith("data: [META]") and frames[-1] == "data: [DONE]\n\n"
+    meta = json.loads(frames[0][len("data: [META]"):])
+    assert meta["pending"] and meta["score"] is None and meta["pending_evaluations"] == 1
+    assert not calls and len(session.pending_answers) == 1
+
+    summary = asyncio.run(routes.end_interview(session_id=sid))["summary"]
+    assert calls == [1] and [p["score"] for p in summary["qa_pairs"]] == [6]
@@ -0,0 +1,100 @@
+import io
+import threading
+import wave
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import audio_prep, routes, segmented_stt
+from app.main import app
+
+np = pytest.importorskip("numpy")
+
+RATE = audio_prep.TARGET_RATE
+
+
+def _speech(words: int, gap: float = 0.4):
+    """Tone bursts ("words") separated by silent gaps."""
+    t = np.arange(int(RATE * 0.5)) / RATE
+    word, pause = 0.4 * np.sin(2 * np.pi * 200 * t), np.zeros(int(RATE * gap))
+    return np.concatenate([np.concatenate([word, pause]) for _ in range(words)]).astype(np.float32)
+
+
+def _wav(samples) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(RATE)
+        w.writeframes((samples * 32767).astype("<i2").tobytes())
+    return buf.getvalue()
+
+
+def test_cuts_land_in_silence_and_cover_the_audio():
+    samples = _speech(60)   # 54 s
+    pieces = segmented_stt.split_at_silence(samples, RATE, target_sec=10)
+    assert 4 <= len(pieces) <= 8
+    assert sum(len(p) for p in pieces) >= len(samples)   # overlap, nothing dropped
+    frame = int(RATE * segmented_stt.FRAME_SEC)
+    for p in pieces[:-1]:
+        seam = p[-int(segmented_stt.OVERLAP_SEC * RATE) // 2 - frame // 2:][:frame]
+        assert np.abs(seam).max() < 1e-3
+    assert len(segmented_stt.split_at_silence(samples[: RATE * 12], RATE, target_sec=10)) == 1
+
+
+def test_stitch_drops_words_repeated_across_seams():
+    assert segmented_stt.stitch(["I would shard the", "shard the table by tenant.", "Tenant, then cache."]) == \
+        "I would shard the table by tenant. then cache."
+    assert segmented_stt.stitch(["", "alpha beta", "gamma"]) == "alpha beta gamma"
+
+
+def test_failed_segments_are_retried_individually(monkeypatch):
+    monkeypatch.setattr(segmented_stt, "RETRY_BACKOFF_SEC", 0)
+    attempts, lock = {}, threading.Lock()
+
+    def flaky(payload: bytes) -> str:
+        with lock:
+            attempts[payload] = attempts.get(payload, 0) + 1
+            n = attempts[payload]
+        if payload == b"2" and n < 2 or payload == b"4":
+            raise RuntimeError("timeout")
+        return f"part{payload.decode()}"
+
+    result = segmented_stt.transcribe([b"0", b"1", b"2", b"3", b"4"], flaky, parallel=2, retries=2)
+    assert result.text == "part0 part1 part2 part3" and result.failed == [4]
+    assert attempts[b"2"] == 2 and attempts[b"4"] == 3 and attempts[b"0"] == 1
+
+
+def test_long_answer_is_transcribed_in_segments(monkeypatch):
+    monkeypatch.setattr(audio_prep.shutil, "which", lambda name: None)
+    monkeypatch.setattr(routes.settings, "stt_segment_seconds", 10)
+    calls = []
+
+    def fake_stt(provider, api_key, filename, data, content_type):
+        calls.append(content_type)
+        return f"chunk{len(calls)}"
+
+    monkeypatch.setattr(routes, "_stt_request", fake_stt)
+    routes.active_sessions.setdefault("stt-test", {"provider": "openai", "api_key": "sk-live"})
+    out = TestClient(app).post("/interview/transcribe", data={"session_id": "stt-test"},
+                               files={"file": ("a.wav", _wav(_speech(40)), "audio/wav")}).json()
+    routes.active_sessions.pop("stt-test")
+    assert out["segments"] == len(calls) > 1 and out["failed_segments"] == []
+    assert set(calls) == {"audio/wav"} and out["text"].startswith("chunk")
+
+
+def test_segmented_failure_falls_back_to_one_request(monkeypatch):
+    monkeypatch.setattr(audio_prep.shutil, "which", lambda name: None)
+    monkeypatch.setattr(routes.settings, "stt_segment_seconds", 10)
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("segment pool exploded")
+
+    monkeypatch.setattr(segmented_stt, "transcribe", broken)
+    monkeypatch.setattr(routes, "_stt_request", lambda provider, api_key, filename, data, content_type: "whole answer")
+    routes.active_sessions.setdefault("stt-fallback", {"provider": "openai", "api_key": "sk-live"})
+    out = TestClient(app).post("/interview/transcribe", data={"session_id": "stt-fallback"},
+                               files={"file": ("a.wav", _wav(_speech(40)), "audio/wav")}).json()
+    session = routes.active_sessions.pop("stt-fallback")
+    assert out["text"] == "whole answer" and "segments" not in out
+    assert session["voice_transcript"] == "whole answer" and session["voice_prosody"] is not None
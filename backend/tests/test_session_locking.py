@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import threading
+import time
+
+from app import routes, llm_client
+from app.session_model import MAX_HISTORY
+
+
+def _start_demo_session(domain="Backend Engineering") -> str:
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="demo", domain=domain, model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    return res["session_id"]
+
+
+def _fake_stream(*args, **kwargs):
+    yield "How would you partition "
+    yield f"a hot table #{time.perf_counter_ns()}?"
+
+
+def test_single_session_stays_consistent_under_concurrent_mutation(monkeypatch):
+    monkeypatch.setattr(llm_client, "stream_llm", _fake_stream)
+    sid = _start_demo_session()
+    session = routes.active_sessions[sid]
+    threads, per_thread = 8, 6
+    errors = []
+    barrier = threading.Barrier(threads * 3)
+
+    def answer_worker():
+        barrier.wait()
+        try:
+            for i in range(per_thread):
+                asyncio.run(routes.submit_interview_answer(
+                    session_id=sid, answer=f"I would shard by tenant id and add a cache layer {i}",
+                ))
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    def question_worker():
+        barrier.wait()
+        try:
+            for _ in range(per_thread):
+                asyncio.run(routes.get_interview_question(session_id=sid))
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    def prefetch_worker():
+        barrier.wait()
+        for _ in range(per_thread):
+            with routes._session_lock(sid):
+                snap = dict(session["soul_profile"])
+            routes._prefetch_next(sid, session, snap, "openai", "demo", "gpt-4o-mini")
+
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # force frequent thread switches to expose races
+    try:
+        pool = (
+            [threading.Thread(target=answer_worker) for _ in range(threads)]
+            + [threading.Thread(target=question_worker) for _ in range(threads)]
+            + [threading.Thread(target=prefetch_worker) for _ in range(threads)]
+        )
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+    finally:
+        sys.setswitchinterval(old_interval)
+
+    assert not errors
+    total = threads * per_thread
+    profile = session["soul_profile"]
+    assert profile["question_count"] == total
+    assert len(profile["scores"]) == total
+    kept = min(total, MAX_HISTORY)
+    assert len(session["qa_pairs"]) == len(session["answers_given"]) == len(session["scores_10"]) == kept
+    assert len(session["questions_asked"]) == total
+    assert sum(session["type_counts"].values()) == total
+    assert len(session["last_types"]) == total
+    assert session["current_question"] in session["questions_asked"]
+
+
+def test_sessions_do_not_block_each_other():
+    busy = _start_demo_session("Data Engineering")
+    free = _start_demo_session("Frontend Engineering")
+    held = threading.Event()
+    release = threading.Event()
+
+    def hog():
+        with routes._session_lock(busy):
+            held.set()
+            release.wait(5)
+
+    t = threading.Thread(target=hog)
+    t.start()
+    held.wait(5)
+    try:
+        t0 = time.perf_counter()
+        asyncio.run(routes.get_interview_question(session_id=free))
+        asyncio.run(routes.submit_interview_answer(session_id=free, answer="Normalise first, then denormalise hot paths."))
+        assert time.perf_counter() - t0 < 1.0
+        assert routes._session_lock(busy) is not routes._session_lock(free)
+    finally:
+        release.set()
+        t.join()
@@ -0,0 +1,46 @@
+import pytest
+
+from app import soul_engine, speech_analyzer
+from app.session_model import MAX_HISTORY, AnswerRecord, InterviewSession
+
+
+def _session() -> InterviewSession:
+    return InterviewSession(
+        provider="openai", api_key="sk-x", domain="Backend", model="gpt-4o-mini",
+        soul_profile=soul_engine.default_profile("Backend"),
+    )
+
+
+def test_answers_stored_once_and_views_derived():
+    s = _session()
+    for i in range(MAX_HISTORY + 5):
+        analysis = speech_analyzer.analyze(f"answer number {i} with for example a cache")
+        s.record_answer(AnswerRecord(question=f"q{i}", answer=f"a{i}", feedback=f"fb{i}", analysis=analysis), i % 11)
+    assert len(s.answers) == len(s.scores) == MAX_HISTORY
+    assert s["answers_given"][0] == "a5" and s["feedback_received"][-1] == f"fb{MAX_HISTORY + 4}"
+    assert s["scores_10"] == tuple((i % 11) for i in range(5, MAX_HISTORY + 5))
+    pair = s["qa_pairs"][-1]
+    assert pair["user_answer"] == f"a{MAX_HISTORY + 4}" and pair["analysis"]["word_count"] == 7
+    assert s["analysis_history"][-1] == pair["analysis"]
+
+
+def test_mapping_interface_is_strict():
+    s = _session()
+    s["current_question"] = "What is a B-tree?"
+    assert s.get("current_question") == "What is a B-tree?"
+    assert "soul_profile" in s and "qa_pairs" in s and "nope" not in s
+    assert s.get("nope", 1) == 1
+    with pytest.raises(KeyError):
+        s["nope"] = 1
+    with pytest.raises(AttributeError):
+        s.setdefault("qa_pairs", []).append({})  # derived views are read-only
+
+
+def test_profile_updates_and_copies_like_a_dict():
+    p = soul_engine.default_profile("Backend", ["Caching"])
+    for score in (8, 9, 9):
+        soul_engine.update_profile(p, score, topic="Caching")
+    assert p["current_difficulty"] == "medium"
+    snap = dict(p)
+    assert snap["scores"].tolist() == [8, 9, 9]
+    assert p.to_dict()["topic_scores"] == {"Caching": [8, 9, 9]}
@@ -0,0 +1,54 @@
+import random
+
+from app import routes
+from app.simhash import SimHashIndex, distance, fingerprint
+
+
+def test_paraphrases_collide_and_distinct_questions_do_not():
+    assert distance(fingerprint("What is a REST API and how does it work?"),
+                    fingerprint("How does a REST API work?")) <= 3
+    assert distance(fingerprint("Explain the CAP theorem and its practical implications."),
+                    fingerprint("What are the practical implications of the CAP theorem?")) <= 3
+    assert distance(fingerprint("How would you design a rate limiter for an API?"),
+                    fingerprint("How would you design a URL shortener?")) > 10
+
+
+def test_banded_lookup_matches_brute_force():
+    rng = random.Random(3)
+    stored = [rng.getrandbits(64) for _ in range(2000)]
+    for k in (0, 3, 6):
+        index = SimHashIndex(threshold=k)
+        for fp in stored:
+            index.add(fp)
+        assert len(index) == len(stored)
+        for _ in range(300):
+            base = rng.choice(stored)
+            flips = rng.sample(range(64), rng.randint(0, 2 * k + 1))
+            probe = base
+            for bit in flips:
+                probe ^= 1 << bit
+            brute = any(distance(probe, fp) <= k for fp in stored)
+            assert (probe in index) == brute
+
+
+def test_session_rejects_paraphrase_of_an_asked_question(monkeypatch):
+    monkeypatch.setattr(routes, "GLOBAL_NEAR_DUPS", SimHashIndex())
+    monkeypatch.setattr(routes, "GLOBAL_ASKED_HASHES", set())
+    session = {"questions_asked": []}
+    routes._note_session_question(session, "How would you design a rate limiter for a public API?")
+    assert routes._is_repeat(session, "Design a rate limiter for a public API.")
+    assert not routes._is_repeat(session, "How would you design a URL shortener?")
+    # The configured threshold decides what counts as near: at 0 only an exact
+    # fingerprint matches, so one flipped bit is a new question.
+    fp = fingerprint("How would you design a rate limiter for a public API?")
+    assert (fp ^ 1) in _session_with(fp)
+    monkeypatch.setattr(routes.settings, "simhash_threshold", 0)
+    strict = _session_with(fp)
+    assert fp in strict and (fp ^ 1) not in strict
+    assert not routes._is_near_dup(strict, fp ^ 1)
+
+
+def _session_with(fp: int) -> SimHashIndex:
+    session = {}
+    routes._session_near_dups(session).add(fp)
+    return session["near_dup_index"]
@@ -0,0 +1,89 @@
+import asyncio
+import base64
+
+import pytest
+
+from app import domain_classifier, routes, simhash, snapshot, soul_engine, speech_analyzer
+from app.session_model import AnswerRecord, InterviewSession
+
+
+def _session() -> InterviewSession:
+    profile = soul_engine.default_profile("Backend", ["Caching", "Queues"])
+    profile.document_context = "Resume: built a distributed cache. " * 40
+    s = InterviewSession(
+        provider="openai", api_key="sk-x", domain="Backend", model="gpt-4o-mini",
+        soul_profile=profile, company_track="google", user_memory={"weak": ["SQL"]},
+        domain_class=domain_classifier.classify("Backend"),
+    )
+    for i in range(12):
+        s.questions_asked.append(f"Question {i}?")
+        s.asked_norm_set.add(f"question {i}")
+        s.near_dup_index.add(simhash.fingerprint(f"question {i}"))
+        answer = f"I would add a write-through cache and measure hit ratio {i}"
+        s.record_answer(AnswerRecord(
+            question=f"Question {i}?", answer=answer, verdict="Correct", feedback="Good.",
+            topic_tag="Caching", analysis=speech_analyzer.analyze(answer),
+        ), i % 11)
+        s.soul_profile = soul_engine.update_profile(s.soul_profile, i % 11, topic="Caching")
+    s.mode = "rapid_fire"
+    s.pending_answers.append(AnswerRecord(question="Question 12?", answer="LRU", analysis=speech_analyzer.analyze("LRU")))
+    s.weak_areas = {"Caching": [{"question": "Question 3?", "improvement_tips": "Go deeper."}]}
+    s.type_counts = {"conceptual": 7, "coding": 5}
+    s.last_score_10 = -3   # exercises negative varints
+    return s
+
+
+def test_round_trip_preserves_every_field():
+    s = _session()
+    blob = snapshot.dumps(s)
+    restored = snapshot.loads(blob)
+    assert restored == s
+    assert restored.qa_pairs == s.qa_pairs and restored.analysis_history == s.analysis_history
+    assert snapshot.loads(snapshot.dumps(s, compress=False)) == s
+    assert len(blob) < len(snapshot.dumps(s, compress=False))
+
+
+# A version-1 snapshot written before answers had ids (three answers, uncompressed).
+_V1_BLOB = base64.b64decode(
+    "SVZTAQcXBQZvcGVuYWkFBHNrLXgFB0JhY2tlbmQFC2dwdC00by1taW5pBQViYXNpYwcAAAUHZ2VuZXJhbAAFBG5vbmUFAAcACQMGBwgIAQUH"
+    "Q2FjaGluZwcBCAEFCHF1ZXN0aW9uBQtRdWVzdGlvbiAxPwMOAAgABwALAAgABwAGBwUIc3RhbmRhcmQHDQYCBwEGCAUHdW5rbm93bgMKCQAH"
+    "AAcAAwAGBwgABgQDAAMABwMHCAULUXVlc3Rpb24gMD8FCEFuc3dlciAwBQdDb3JyZWN0BgcGBwYHBggABwgGCgUIQW5zd2VyIDEGDwYHBgcG"
+    "BwYIAAcIBQtRdWVzdGlvbiAyPwUIQW5zd2VyIDIGDwYHBgcGBwYIAAcA"
+)
+
+
+def test_loads_snapshots_written_before_answer_ids():
+    s = snapshot.loads(_V1_BLOB)
+    assert s.weak_areas == {"Caching": [{"question": "Question 1?"}]} and s.last_score_10 == 7
+    assert [r.answer for r in s.answers] == ["Answer 0", "Answer 1", "Answer 2"] and list(s.scores) == [6, 7, 8]
+    assert [r.id for r in s.answers] == [0, 1, 2] and s.next_answer_id == 3
+    assert s.answer_position(1) == 1
+    s.record_answer(AnswerRecord(question="Question 3?", answer="Answer 3"), 9)
+    assert s.answers[-1].id == 3 and snapshot.loads(snapshot.dumps(s)) == s
+
+
+def test_rejects_foreign_and_corrupt_bytes():
+    blob = snapshot.dumps(_session())
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.loads(b"{}")
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.loads(blob[:3] + bytes((snapshot.VERSION + 1,)) + blob[4:])
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.loads(blob[: len(blob) // 2])
+
+
+def test_restore_endpoint_rehydrates_from_disk(monkeypatch, tmp_path):
+    monkeypatch.setattr(routes.settings, "snapshot_dir", str(tmp_path))
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="demo", domain="Backend", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+    asyncio.run(routes.submit_interview_answer(session_id=sid, answer="Shard by tenant and cache hot keys."))
+    before = routes.active_sessions.pop(sid)   # simulate a restart
+
+    meta = asyncio.run(routes.restore_interview(session_id=sid))
+    assert meta["session_id"] == sid and routes.active_sessions[sid] == before
+
+    asyncio.run(routes.end_interview(session_id=sid))
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+from app import sse
+
+
+async def _collect(source, **kw):
+    return [f async for f in sse.coalesce(source, **kw)]
+
+
+def _texts(frames):
+    return [json.loads(f[6:]) for f in frames if not f.startswith("data: [")]
+
+
+def test_fast_chunks_merge_and_control_frames_pass_through_in_order():
+    async def source():
+        for i in range(50):
+            yield f"t{i} "
+        yield sse.control("META", '{"score": 7}')
+        yield "tail"
+        yield sse.control("DONE")
+
+    frames = asyncio.run(_collect(source(), max_bytes=4096, max_delay_ms=30))
+    assert frames == [sse.text_frame("".join(f"t{i} " for i in range(50))),
+                      'data: [META]{"score": 7}\n\n', sse.text_frame("tail"), "data: [DONE]\n\n"]
+
+
+def test_byte_cap_and_stalled_source_flush_early():
+    async def source():
+        for _ in range(10):
+            yield "x" * 10
+        yield "y"
+        await asyncio.sleep(0.3)      # provider stalls: "y" must not wait for the next chunk
+        yield "z"
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start, out = loop.time(), []
+        async for f in sse.coalesce(source(), max_bytes=40, max_delay_ms=20):
+            out.append((f, loop.time() - start))
+        return out
+
+    out = asyncio.run(run())
+    texts = _texts(f for f, _ in out)
+    assert "".join(texts) == "x" * 100 + "yz" and all(len(t) <= 40 for t in texts[:2])
+    y_frame = next(t for f, t in out if "y" in f)
+    assert y_frame < 0.2 and out[-1][0] == sse.text_frame("z")
+
+
+def test_zero_window_keeps_one_frame_per_chunk():
+    async def source():
+        for w in ("a", "b", "c"):
+            yield w
+        yield sse.control("DONE")
+
+    frames = asyncio.run(_collect(source(), max_delay_ms=0))
+    assert _texts(frames) == ["a", "b", "c"] and frames[-1] == "data: [DONE]\n\n"
+
+
+def test_closing_mid_stream_closes_the_source():
+    closed = []
+
+    async def source():
+        try:
+            yield "a"
+            await asyncio.sleep(10)
+            yield "b"
+        finally:
+            closed.append(True)
+
+    async def run():
+        frames = sse.coalesce(source(), max_delay_ms=10)
+        first = await frames.__anext__()
+        await frames.aclose()
+        return first
+
+    assert asyncio.run(run()) == sse.text_frame("a") and closed == [True]
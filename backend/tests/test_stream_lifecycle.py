@@ -0,0 +1,206 @@
+import asyncio
+import json
+import threading
+import time
+
+import requests
+
+from app import llm_client, metrics, routes, sse
+
+
+class _SlowProviderResponse:
+    """A provider SSE body that produces one token every 20 ms until closed."""
+
+    def __init__(self, lines=200, tokens=None):
+        self.tokens = tokens or [f"w{i} " for i in range(lines)]
+        self.closed = threading.Event()
+        self.lines_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        self.closed.set()
+
+    def iter_lines(self):
+        for token in self.tokens:
+            if self.closed.wait(0.02):
+                raise requests.exceptions.ConnectionError("connection closed")
+            self.lines_read += 1
+            yield ("data: " + json.dumps({"choices": [{"delta": {"content": token}}]})).encode()
+        yield b"data: [DONE]"
+
+
+# score < 6, so no background prefetch makes a second upstream call
+_EVALUATION = ['{"score": 5, "short_verdict": "Partly.", "detailed_feedback": "'] + [f"w{i} " for i in range(40)] + ['"}']
+
+
+def _frame_id(frame):
+    return frame.split("\n", 1)[0][len("id: "):]
+
+
+def test_disconnect_closes_the_upstream_stream_and_counts_it(monkeypatch, start_session):
+    monkeypatch.setattr(routes.settings, "sse_resume_grace_sec", 0)
+    upstream = _SlowProviderResponse()
+    monkeypatch.setattr(llm_client.requests, "post", lambda *a, **kw: upstream)
+    sid = start_session(api_key="sk-live-stream")
+    before = metrics.snapshot()
+
+    async def client_leaves_after_first_frame():
+        response = await routes.stream_question(sid)
+        first_frame = asyncio.Event()
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_frame.set()
+
+        async def receive():
+            await first_frame.wait()
+            return {"type": "http.disconnect"}
+
+        await response({"type": "http", "asgi": {"spec_version": "2.3"}}, receive, send)
+
+    asyncio.run(client_leaves_after_first_frame())
+    assert upstream.closed.wait(1)
+    time.sleep(0.1)
+    assert upstream.lines_read < 50
+    after = metrics.snapshot()
+    assert after.get("llm_streams_cancelled", 0) == before.get("llm_streams_cancelled", 0) + 1
+    saved = after["llm_tokens_saved_est"] - before.get("llm_tokens_saved_est", 0)
+    assert 300 < saved <= 400
+    assert not routes.active_sessions[sid].current_question.startswith("w0")   # nothing written to the session
+    routes.active_sessions.pop(sid)
+
+
+def test_finished_stream_is_not_cancelled():
+    handle = llm_client.StreamHandle()
+    handle.finish()
+    assert handle.cancel() is False
+
+
+def test_reconnect_with_last_event_id_replays_only_missing_frames(monkeypatch, start_session):
+    calls = []
+
+    def post(*a, **kw):
+        calls.append(_SlowProviderResponse(tokens=_EVALUATION))
+        return calls[-1]
+
+    monkeypatch.setattr(llm_client.requests, "post", post)
+    monkeypatch.setattr(routes.settings, "sse_coalesce_ms", 0)
+    sid = start_session(api_key="sk-live-stream")
+    answer = "I would add an index on the foreign key."
+
+    async def run():
+        first = await routes.stream_answer_feedback(sid, answer, None)
+        frames = first.body_iterator
+        seen = [await frames.__anext__() for _ in range(3)]
+        await frames.aclose()                              # network drops
+        await asyncio.sleep(0.1)                           # generation keeps going meanwhile
+        again = await routes.stream_answer_feedback(sid, answer, _frame_id(seen[-1]))
+        rest = [f async for f in again.body_iterator]
+        return seen, rest
+
+    seen, rest = asyncio.run(run())
+    ids = [int(_frame_id(f).split(":")[1]) for f in seen + rest]
+    assert ids == list(range(len(ids)))                   # nothing missing, nothing repeated
+    assert rest[-1].endswith("data: [DONE]\n\n") and any("[META]" in f for f in rest)
+    assert len(calls) == 1 and calls[0].lines_read == len(_EVALUATION)
+    routes.active_sessions.pop(sid)
+
+
+def test_repeat_request_attaches_and_abandoned_generation_is_cancelled(monkeypatch, start_session):
+    calls = []
+
+    def post(*a, **kw):
+        calls.append(_SlowProviderResponse())
+        return calls[-1]
+
+    monkeypatch.setattr(llm_client.requests, "post", post)
+    monkeypatch.setattr(routes.settings, "sse_resume_grace_sec", 0.3)
+    sid = start_session(api_key="sk-live-stream")
+
+    async def run():
+        one = await routes.stream_question(sid, None)
+        two = await routes.stream_question(sid, None)      # same request while running: no second call
+        first_one = await one.body_iterator.__anext__()
+        first_two = await two.body_iterator.__anext__()
+        await one.body_iterator.aclose()
+        await two.body_iterator.aclose()
+        await asyncio.sleep(0.1)
+        assert not calls[0].closed.is_set()                # still inside the grace period
+        await asyncio.sleep(0.5)
+        return first_one, first_two
+
+    first_one, first_two = asyncio.run(run())
+    assert first_one == first_two and len(calls) == 1
+    assert calls[0].closed.is_set() and calls[0].lines_read < 100
+    routes.active_sessions.pop(sid)
+
+
+def test_frames_evicted_from_the_replay_buffer_are_reported():
+    async def run():
+        log = sse.StreamLog(capacity=2)
+
+        async def frames():
+            for i in range(5):
+                yield f"data: {i}\n\n"
+
+        log.start(frames())
+        await log.task
+        return [f async for f in log.follow(0)], [f async for f in log.follow(2)]
+
+    expired, tail = asyncio.run(run())
+    assert expired == ["data: [ERROR]Stream expired, please retry\n\n"]
+    assert [f.split("\n")[1] for f in tail] == ["data: 3", "data: 4"]
+
+
+def test_repeating_a_finished_answer_replays_it_instead_of_re_evaluating(monkeypatch, start_session):
+    calls = []
+
+    def post(*a, **kw):
+        calls.append(_SlowProviderResponse(tokens=_EVALUATION))
+        return calls[-1]
+
+    monkeypatch.setattr(llm_client.requests, "post", post)
+    monkeypatch.setattr(routes.settings, "sse_coalesce_ms", 0)
+    sid = start_session(api_key="sk-live-stream")
+    answer = "I would add an index on the foreign key."
+
+    async def run():
+        first = [f async for f in (await routes.stream_answer_feedback(sid, answer, None)).body_iterator]
+        again = [f async for f in (await routes.stream_answer_feedback(sid, answer, None)).body_iterator]
+        routes.active_sessions[sid]["current_question"] = "And how would you shard it?"
+        other = [f async for f in (await routes.stream_answer_feedback(sid, answer, None)).body_iterator]
+        return first, again, other
+
+    first, again, other = asyncio.run(run())
+    assert again == first and first[-1].endswith("data: [DONE]\n\n")
+    assert len(routes.active_sessions[sid].answers) == 2   # the repeat wasn't recorded; the new question was
+    assert len(calls) == 2 and other[-1].endswith("data: [DONE]\n\n")
+    routes.active_sessions.pop(sid)
+
+
+def test_ending_the_interview_cancels_a_running_generation(monkeypatch, start_session):
+    upstream = _SlowProviderResponse(tokens=_EVALUATION)
+    monkeypatch.setattr(llm_client.requests, "post", lambda *a, **kw: upstream)
+    monkeypatch.setattr(routes.settings, "sse_resume_grace_sec", 30)
+    sid = start_session(api_key="sk-live-stream")
+    session = routes.active_sessions[sid]
+
+    async def run():
+        response = await routes.stream_answer_feedback(sid, "I would add an index on the foreign key.", None)
+        await response.body_iterator.__anext__()
+        await routes.end_interview(session_id=sid)
+        await asyncio.sleep(0.2)
+        # Checked while the loop still runs: asyncio.run cancels leftover tasks on exit.
+        return upstream.closed.is_set(), upstream.lines_read
+
+    closed, lines_read = asyncio.run(run())
+    assert closed and lines_read < len(_EVALUATION)
+    assert not session.answers
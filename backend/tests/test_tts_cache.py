@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+from fastapi.testclient import TestClient
+
+from app import routes, tts_cache
+from app.main import app
+
+
+def test_lru_eviction_and_restart(monkeypatch, tmp_path):
+    monkeypatch.setattr(routes.settings, "tts_cache_dir", str(tmp_path))
+    monkeypatch.setattr(routes.settings, "tts_cache_max_mb", 1)
+    store = tts_cache.store()
+    mb = 1024 * 1024
+    store.put("a", b"x" * (mb // 2))
+    store.put("b", b"y" * (mb // 3))
+    assert store.get("a")            # a is now most recent
+    store.put("c", b"z" * (mb // 3))  # over budget: evicts b, the least recently used
+    assert store.get("b") is None and store.get("a") and store.get("c")
+    assert store.total_bytes <= mb and sorted(p.name for p in tmp_path.iterdir()) == ["a.mp3", "c.mp3"]
+
+    reopened = tts_cache._Store(str(tmp_path), mb)
+    assert len(reopened) == 2 and reopened.total_bytes == store.total_bytes
+
+
+def test_get_or_create_is_single_flight(monkeypatch, tmp_path):
+    monkeypatch.setattr(routes.settings, "tts_cache_dir", str(tmp_path))
+    store = tts_cache.store()
+    calls, gate = [], threading.Event()
+
+    def produce():
+        calls.append(1)
+        gate.wait(2)
+        return b"audio"
+
+    threads = [threading.Thread(target=store.get_or_create, args=("k", produce)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+    assert calls == [1] and open(store.get("k"), "rb").read() == b"audio"
+
+
+def test_speak_serves_repeats_from_cache_with_etag_and_range(monkeypatch, tmp_path):
+    monkeypatch.setattr(routes.settings, "tts_cache_dir", str(tmp_path))
+    synth = []
+
+    def fake_stream(api_key, text):
+        synth.append(text)
+        yield b"ID3"
+        yield bytes(range(200))
+
+    monkeypatch.setattr(routes, "_synthesize_stream", fake_stream)
+    res = asyncio.run(routes.start_interview(
+        provider="openai", api_key="sk-live-tts", domain="Backend", model=None, difficulty="basic",
+        topics=None, company_track=None, interview_type=None, user_memory=None, pressure_level="none",
+    ))
+    sid = res["session_id"]
+    client = TestClient(app)
+
+    first = client.post("/interview/speak", data={"session_id": sid, "text": "  Tell me about caching. "})
+    again = client.post("/interview/speak", data={"session_id": sid, "text": "Tell me about caching."})
+    assert first.status_code == again.status_code == 200
+    assert first.content == again.content and len(synth) == 1
+    assert first.headers["x-tts-key"] == again.headers["x-tts-key"]
+    etag, key = again.headers["etag"], again.headers["x-tts-key"]
+
+    assert client.get(f"/interview/speak/{key}", headers={"If-None-Match": etag}).status_code == 304
+    part = client.get(f"/interview/speak/{key}", headers={"Range": "bytes=0-9"})
+    assert part.status_code == 206 and part.content == first.content[:10]
+    assert client.get("/interview/speak/" + "0" * 32).status_code == 404
+    routes.active_sessions.pop(sid)
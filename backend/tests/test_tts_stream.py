@@ -0,0 +1,35 @@
+import threading
+import time
+
+from app import tts_stream
+
+
+def test_split_text_keeps_sentences_and_a_short_first_chunk():
+    text = "Hi there. " + " ".join(f"Sentence number {i} explains one more idea." for i in range(30))
+    chunks = tts_stream.split_text(text, first_max=40, max_chars=200)
+    assert chunks[0] == "Hi there." or len(chunks[0]) <= 40
+    assert all(len(c) <= 200 for c in chunks)
+    assert all(c.endswith(".") for c in chunks)
+    assert " ".join(chunks) == text.strip()
+    long_word_run = "word " * 100
+    assert all(len(c) <= 50 for c in tts_stream.split_text(long_word_run, first_max=50, max_chars=50))
+    assert tts_stream.split_text("   ") == []
+
+
+def test_stream_is_ordered_and_synthesizes_ahead():
+    started, lock = [], threading.Lock()
+
+    def synth(text):
+        with lock:
+            started.append(text)
+        time.sleep(0.05 if text != "c0" else 0.0)
+        for part in (text.encode(), b"|"):
+            yield part
+
+    chunks = [f"c{i}" for i in range(6)]
+    t0 = time.monotonic()
+    out = b"".join(tts_stream.stream(chunks, synth, parallel=3))
+    elapsed = time.monotonic() - t0
+    assert out == b"".join(c.encode() + b"|" for c in chunks)
+    assert elapsed < 0.05 * 5   # later chunks overlapped instead of running back to back
+    assert set(started) == set(chunks)
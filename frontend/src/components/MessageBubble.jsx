@@ -107,11 +107,23 @@ function renderContent(content, type) {
   });
 }
 
-export default function MessageBubble({ message }) {
+export default function MessageBubble({ message, onLoadDetail }) {
   const { type, content, score, timestamp, analysis,
-          short_verdict, improvement_tip, topic_tag } = message;
+          short_verdict, improvement_tip, topic_tag, detail_id } = message;
   const isUser = type === 'answer';
   const [analysisOpen, setAnalysisOpen] = useState(false);
+  const [detailState, setDetailState] = useState('idle'); // idle | loading | error
+  const detailPending = type === 'feedback' && detail_id !== null && detail_id !== undefined && onLoadDetail;
+
+  const openDetail = async () => {
+    setDetailState('loading');
+    try {
+      await onLoadDetail(message);
+      setDetailState('idle');
+    } catch {
+      setDetailState('error');
+    }
+  };
   const normalizedScore = typeof score === 'number'
     ? (score <= 10 ? score : Math.round(score / 10))
     : null;
@@ -149,6 +161,19 @@ export default function MessageBubble({ message }) {
             {renderContent(content, type)}
           </div>
 
+          {detailPending && (
+            <button
+              type="button"
+              onClick={openDetail}
+              disabled={detailState === 'loading'}
+              className="mt-2 text-xs font-medium text-indigo-600 hover:text-indigo-800 disabled:opacity-60"
+            >
+              {detailState === 'loading' ? 'Writing detailed feedback…'
+                : detailState === 'error' ? 'Could not load feedback — retry'
+                : 'Show detailed feedback & model answer'}
+            </button>
+          )}
+
           {/* Score + improvement tip */}
           {type === 'feedback' && normalizedScore !== null && (
             <div className="mt-3 pt-3 border-t border-gray-100 space-y-2">
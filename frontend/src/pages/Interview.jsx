@@ -304,20 +304,39 @@ function Interview() {
         }]);
         setInterviewStats(prev => ({ ...prev, questionsAsked: prev.questionsAsked + 1 }));
 
-        const reader = response.body.getReader();
+        let reader = response.body.getReader();
         const decoder = new TextDecoder();
         let buffer = '';
+        let frameId = null;       // id of the frame being read
+        let lastEventId = null;   // id of the last frame fully handled
+        let resumesLeft = 2;
 
         while (true) {
-          const { done, value } = await reader.read();
+          let result;
+          try {
+            result = await reader.read();
+          } catch (readErr) {
+            // Connection dropped mid-stream: resume after the last frame we handled
+            // instead of asking for a new question (the server replays what we missed).
+            if (!lastEventId || resumesLeft-- <= 0) throw readErr;
+            const resumed = await fetch(url, { headers: { 'Last-Event-ID': lastEventId } });
+            if (!resumed.ok || !resumed.body) throw readErr;
+            reader = resumed.body.getReader();
+            buffer = '';
+            frameId = null;
+            continue;
+          }
+          const { done, value } = result;
           if (done) break;
           buffer += decoder.decode(value, { stream: true });
           const lines = buffer.split('\n');
           buffer = lines.pop(); // keep incomplete line
 
           for (const line of lines) {
+            if (line.startsWith('id: ')) { frameId = line.slice(4); continue; }
             if (!line.startsWith('data: ')) continue;
             const raw = line.slice(6);
+            if (frameId) { lastEventId = frameId; frameId = null; }
             if (raw === '[DONE]') { streamSucceeded = true; break; }
             if (raw.startsWith('[ERROR]')) {
               throw new Error(raw.slice(7) || 'Stream error');
@@ -510,7 +529,8 @@ function Interview() {
         const feedbackMessage = {
           id: Date.now() + 1,
           type: 'feedback',
-          content: [
+          // Quick evaluation: the long feedback is fetched when the candidate opens it
+          content: data?.detail_pending ? '' : [
             (data && data.feedback) || 'No feedback received',
             data && data.correct_answer ? `\n\nCorrect answer:\n${data.correct_answer}` : ''
           ].filter(Boolean).join(''),
@@ -518,6 +538,7 @@ function Interview() {
           short_verdict: data?.short_verdict || null,
           improvement_tip: data?.improvement_tip || null,
           topic_tag: data?.topic_tag || null,
+          detail_id: data?.detail_pending ? data.answer_id : null,
           timestamp: new Date().toISOString()
         };
 
@@ -560,6 +581,24 @@ function Interview() {
     }
   };
 
+  const loadDetail = async (message) => {
+    const formData = new FormData();
+    formData.append('session_id', sessionData.session_id);
+    formData.append('answer_id', String(message.detail_id));
+    const response = await fetch(API_BASE + '/interview/answer/detail', { method: 'POST', body: formData });
+    if (!response.ok) throw new Error(`Server error (${response.status})`);
+    const detail = await response.json();
+    setMessages(prev => prev.map(m => m.id === message.id ? {
+      ...m,
+      content: [
+        detail.feedback || 'No feedback received',
+        detail.correct_answer ? `\n\nCorrect answer:\n${detail.correct_answer}` : ''
+      ].filter(Boolean).join(''),
+      improvement_tip: detail.improvement_tip || m.improvement_tip,
+      detail_id: null
+    } : m));
+  };
+
   const requestFollowup = async () => {
     if (!sessionData?.session_id || !isOnline) return;
     try {
@@ -1012,7 +1051,7 @@ function Interview() {
                 ) : (
                   <>
                     {messages.map((message) => (
-                      <MessageBubble key={message.id} message={message} />
+                      <MessageBubble key={message.id} message={message} onLoadDetail={loadDetail} />
                     ))}
                     <div ref={messagesEndRef} />
                   </>